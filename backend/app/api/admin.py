@@ -45,6 +45,9 @@ async def trigger_ingestion_manually(db: Session = Depends(get_db)):
                 skipped_parts = []
                 if stats['duplicates_skipped'] > 0:
                     skipped_parts.append(f"{stats['duplicates_skipped']} duplicates")
+                prefiltered = sum(stats.get('prefilter_skipped', {}).values())
+                if prefiltered > 0:
+                    skipped_parts.append(f"{prefiltered} pre-filtered")
                 if stats.get('low_worthiness_skipped', 0) > 0:
                     skipped_parts.append(f"{stats['low_worthiness_skipped']} low-worthiness")
                 message = f"No new posts added ({', '.join(skipped_parts)} skipped)"
@@ -121,6 +124,30 @@ async def trigger_archive_manually(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Archival failed: {str(e)}")
 
 
+@router.post("/repair-group-aggregates")
+async def repair_group_aggregates_now(db: Session = Depends(get_db)):
+    """Recompute post count, max worthiness and representative post of every group
+
+    The board reads these from groups; ingestion maintains them per post and
+    a nightly job fixes drift. Run this after editing posts by hand.
+
+    **Returns:**
+    - Number of groups whose stored aggregates were corrected
+    """
+    from app.services.group_aggregates import repair_group_aggregates
+
+    try:
+        fixed = repair_group_aggregates(db)
+        return {
+            "message": "Group aggregates repaired",
+            "status": "success",
+            "groups_updated": fixed
+        }
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Repair failed: {str(e)}")
+
+
 @router.get("/scheduler-status")
 async def get_scheduler_status(db: Session = Depends(get_db)):
     """Get current scheduler status and job information (V-15)
@@ -308,3 +335,160 @@ async def get_archive_preview(db: Session = Depends(get_db)):
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get archive preview: {str(e)}")
+
+
+@router.get("/openai-pool")
+async def get_openai_pool_stats():
+    """Get statistics of the shared OpenAI connection pool
+
+    **Returns:**
+    - requests: Requests sent through the shared client since startup
+    - connections_opened: New TCP connections opened (lower than requests = reuse)
+    - reuse_ratio: Share of requests served on an already-open connection
+    - pooled_connections / idle_connections: Current pool occupancy
+    """
+    from app.services.openai_client import openai_pool
+
+    return openai_pool.stats()
+
+
+@router.get("/http-pools")
+async def get_http_pool_stats():
+    """Get statistics of the shared upstream HTTP clients (X API, Teams, OpenAI)
+
+    **Returns:**
+    - One entry per upstream with request count, new connections opened,
+      reuse ratio, current pool occupancy and whether HTTP/2 is enabled
+    """
+    from app.services.http_clients import get_http_client_stats
+
+    return get_http_client_stats()
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats():
+    """Get connection pool and statement metrics per database engine
+
+    Engines: "app" (sync sessions), "async" (AsyncSession endpoints and the
+    ingestion job) and "logging" (DatabaseLogHandler writes).
+
+    **Returns:**
+    - pool: Configured size, connections checked out / idle, current overflow
+    - checkout_wait_ms: p50/p95/max time to obtain a connection (queue wait + pre-ping)
+    - checkout_timeouts: Checkouts that gave up after db_pool_timeout_seconds
+    - overflow_checkouts / peak_overflow: Checkouts made while over pool_size and
+      the most overflow connections seen at once
+    - invalidations: Connections discarded (failed pre-ping, server disconnects)
+    - statements: Count, p50/p95 duration, errors, statement_timeout cancellations
+      and the most recent statements slower than 500ms
+    """
+    from app.services.db_metrics import get_pool_stats
+
+    return get_pool_stats()
+
+
+@router.get("/log-writer")
+async def get_log_writer_stats():
+    """Get statistics of the batched system_logs writer
+
+    **Returns:**
+    - queued / queue_max_size: Rows waiting to be written and the queue bound
+    - rows_written / batches_written / avg_batch_rows: Bulk insert throughput
+    - last_flush_ms: Duration of the latest batch insert
+    - dropped_by_level: Records dropped because the queue was full
+    - write_failures / rows_lost_on_failure: Failed batch inserts
+    """
+    from app.services.logging_handler import log_writer
+
+    return log_writer.stats()
+
+
+@router.get("/event-loop")
+async def get_event_loop_stats():
+    """Get event loop lag percentiles and recently detected blocking calls
+
+    **Returns:**
+    - lag_ms: p50/p95/p99/max scheduling lag over the recent sample window
+    - blocks_total / blocks_by_activity: Stalls longer than loop_block_threshold_ms,
+      grouped by the route ("GET /api/groups/") or job ("job:ingest_posts") that caused them
+    - recent_blocks: Latest stalls with duration and the stack of the blocking code
+    """
+    from app.services.loop_monitor import loop_monitor
+
+    return loop_monitor.stats()
+
+
+@router.delete("/event-loop")
+async def reset_event_loop_stats():
+    """Clear loop lag samples and recorded blocking calls"""
+    from app.services.loop_monitor import loop_monitor
+
+    loop_monitor.reset()
+    return {"message": "Event loop statistics reset"}
+
+
+@router.get("/llm-cache")
+async def get_llm_cache_stats(db: Session = Depends(get_db)):
+    """Get LLM response cache statistics
+
+    **Returns:**
+    - hit_ratio: Share of cacheable lookups served from cache since startup
+    - totals / by_operation: memory hits, DB hits, misses, writes and bypassed calls
+    - memory_entries / db_entries: Current size of each cache tier
+    - evicted: Rows removed by TTL expiry or LRU eviction since startup
+    """
+    from app.services.llm_cache import llm_cache
+
+    return llm_cache.stats(db)
+
+
+@router.delete("/llm-cache")
+async def clear_llm_cache():
+    """Drop all cached LLM responses (e.g. after changing model behaviour upstream)"""
+    from app.services.llm_cache import llm_cache
+
+    try:
+        deleted = await llm_cache.clear()
+        return {"message": "LLM cache cleared", "deleted": deleted}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to clear LLM cache: {str(e)}")
+
+
+@router.get("/ingestion-runs")
+async def get_ingestion_runs(limit: int = 20, db: Session = Depends(get_db)):
+    """Get the most recent ingestion runs with per-list results
+
+    **Returns:**
+    - runs: Newest first; counts, duration, posts_per_minute, per-stage timings
+      (count, total, p50, p95, max seconds) and one entry per list
+    """
+    from sqlalchemy import select
+    from app.models.ingestion_run import IngestionRun, IngestionRunList
+    from app.services.ingestion_metrics import serialize_run
+
+    limit = max(1, min(limit, 200))
+    runs = db.execute(
+        select(IngestionRun).order_by(IngestionRun.started_at.desc()).limit(limit)
+    ).scalars().all()
+
+    lists_by_run = {}
+    if runs:
+        for row in db.execute(
+            select(IngestionRunList).where(IngestionRunList.run_id.in_([run.id for run in runs]))
+        ).scalars().all():
+            lists_by_run.setdefault(row.run_id, []).append(row)
+
+    return {"runs": [serialize_run(run, lists_by_run.get(run.id, [])) for run in runs]}
+
+
+@router.get("/ingestion-runs/trends")
+async def get_ingestion_run_trends(days: int = 14, db: Session = Depends(get_db)):
+    """Get daily ingestion trends for spotting throughput regressions
+
+    **Returns:**
+    - daily: runs, failed runs, posts fetched/added, average and p95 run duration,
+      posts_per_minute, and the median per-stage p95 latency for each day
+    """
+    from app.services.ingestion_metrics import get_run_trends
+
+    return get_run_trends(db, days=max(1, min(days, 90)))
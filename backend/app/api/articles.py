@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.article import Article
+from app.services import resource_versions
 
 router = APIRouter()
 
@@ -108,6 +109,7 @@ AI Summary: {post.ai_summary or 'N/A'}
 
     # 5. Mark group as selected (V-13)
     db.execute(update(Group).where(Group.id == request.group_id).values(selected=True))
+    resource_versions.bump(db, resource_versions.GROUPS)
 
     # 6. Store in database (use first post's id for backward compatibility)
     new_article = Article(
@@ -231,8 +233,7 @@ async def regenerate_article(
     """
     from sqlalchemy import select, update
     from app.models.post import Post
-    from app.services.openai_client import openai_client
-    from openai import AsyncOpenAI
+    from app.services.openai_client import openai_client, openai_pool
 
     article = db.execute(select(Article).where(Article.id == article_id)).scalar_one_or_none()
     if not article:
@@ -243,7 +244,7 @@ async def regenerate_article(
         return {"error": "Source post not found"}
 
     # Regenerate with improved prompt
-    client = AsyncOpenAI(api_key=openai_client.api_key)
+    client = openai_pool.get_client()
     improved_prompt = f"Write a comprehensive news article based on this post: {post.original_text}. Requirements: Informative headline, 3-5 paragraphs, Objective tone, Include context and background. Format as markdown. Previous version was too short/long/technical - adjust accordingly."
 
     response = await client.chat.completions.create(
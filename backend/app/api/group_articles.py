@@ -1,11 +1,13 @@
 """Group Articles API endpoints (V-11, V-12, V-19)"""
-from fastapi import APIRouter, Depends, Path, HTTPException
+from fastapi import APIRouter, Depends, Path, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from typing import Optional
 import re
 
+from app.api.schemas import ArticleDetail, ArticleItem, ArticlePage
 from app.database import get_db
 from app.models.group import Group
 
@@ -13,6 +15,20 @@ from app.models.group import Group
 router = APIRouter()
 
 
+def _article_item(a) -> ArticleItem:
+    return ArticleItem(
+        id=a.id,
+        group_id=a.group_id,
+        style=a.style,
+        title=a.title,
+        preview=a.preview,
+        content=a.content,
+        posted_to_teams=a.posted_to_teams,
+        created_at=a.created_at,
+        updated_at=a.updated_at
+    )
+
+
 def strip_html_tags(text: str) -> str:
     """Remove HTML tags from text (AI sometimes adds them despite plain text instruction)"""
     # Remove HTML tags while preserving content
@@ -45,12 +61,11 @@ async def generate_article(
     If research exists, uses posts + research as context.
     If no research, uses posts only for simpler output.
     """
-    from app.services.openai_client import openai_client
     from app.models.group_research import GroupResearch
     from app.models.group_articles import GroupArticle
     from app.models.post import Post
     from app.models.system_settings import SystemSettings
-    from openai import AsyncOpenAI
+    from app.services.openai_client import openai_pool
 
     # Validate group
     group = db.execute(select(Group).where(Group.id == group_id)).scalar_one_or_none()
@@ -105,7 +120,7 @@ Start with a compelling headline, then write the article content."""
     # Generate article
     # NOTE: gpt-5-mini is a reasoning model - does NOT support temperature parameter
     # See GOTCHAS.md "gpt-5-mini Temperature Limitation" section
-    client = AsyncOpenAI(api_key=openai_client.api_key)
+    client = openai_pool.get_client()
     response = await client.chat.completions.create(
         model="gpt-5-mini",
         messages=[{"role": "user", "content": full_prompt}],
@@ -157,40 +172,56 @@ Start with a compelling headline, then write the article content."""
     }
 
 
-@router.get("/{group_id}/articles/")
+@router.get("/{group_id}/articles/", response_model=ArticlePage, response_class=ORJSONResponse)
 async def get_all_articles(
     group_id: int = Path(..., description="Group ID"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get all articles for a group, ordered by creation date descending"""
+    """Get articles for a group, ordered by creation date descending
+
+    Paginated by (created_at, id): pass next_cursor back as cursor for the
+    next page (null on the last page); count is the number on this page.
+    """
+    from datetime import datetime
     from app.models.group_articles import GroupArticle
+    from app.services.pagination import after, decode_cursor, encode_cursor
+
+    # Returned columns only (not prompt_used / research_id)
+    query = select(
+        GroupArticle.id,
+        GroupArticle.group_id,
+        GroupArticle.style,
+        GroupArticle.title,
+        GroupArticle.preview,
+        GroupArticle.content,
+        GroupArticle.posted_to_teams,
+        GroupArticle.created_at,
+        GroupArticle.updated_at,
+    ).where(GroupArticle.group_id == group_id)
+    if cursor:
+        try:
+            query = query.where(after((GroupArticle.created_at, GroupArticle.id), decode_cursor(cursor, datetime, int)))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
     articles = db.execute(
-        select(GroupArticle)
-        .where(GroupArticle.group_id == group_id)
-        .order_by(GroupArticle.created_at.desc())
-    ).scalars().all()
+        query.order_by(GroupArticle.created_at.desc(), GroupArticle.id.desc()).limit(limit + 1)
+    ).all()
+    next_cursor = None
+    if len(articles) > limit:
+        articles = articles[:limit]
+        next_cursor = encode_cursor(articles[-1].created_at, articles[-1].id)
 
-    return {
-        "articles": [
-            {
-                "id": a.id,
-                "group_id": a.group_id,
-                "style": a.style,
-                "title": a.title,
-                "preview": a.preview,
-                "content": a.content,
-                "posted_to_teams": a.posted_to_teams.isoformat() if a.posted_to_teams else None,
-                "created_at": a.created_at.isoformat() if a.created_at else None,
-                "updated_at": a.updated_at.isoformat() if a.updated_at else None
-            }
-            for a in articles
-        ],
-        "count": len(articles)
-    }
+    return ORJSONResponse(ArticlePage(
+        articles=[_article_item(a) for a in articles],
+        count=len(articles),
+        next_cursor=next_cursor
+    ))
 
 
-@router.get("/{group_id}/article/")
+@router.get("/{group_id}/article/", response_model=ArticleDetail, response_class=ORJSONResponse)
 async def get_article(
     group_id: int = Path(..., description="Group ID"),
     db: Session = Depends(get_db)
@@ -207,19 +238,7 @@ async def get_article(
     if not article:
         raise HTTPException(status_code=404, detail="No article found for this group")
 
-    return {
-        "article": {
-            "id": article.id,
-            "group_id": article.group_id,
-            "style": article.style,
-            "title": article.title,
-            "preview": article.preview,
-            "content": article.content,
-            "posted_to_teams": article.posted_to_teams.isoformat() if article.posted_to_teams else None,
-            "created_at": article.created_at.isoformat() if article.created_at else None,
-            "updated_at": article.updated_at.isoformat() if article.updated_at else None
-        }
-    }
+    return ORJSONResponse(ArticleDetail(article=_article_item(article)))
 
 
 @router.put("/{group_id}/article/{article_id}/")
@@ -290,11 +309,10 @@ async def refine_article(
     Uses specified article + research + posts + instruction to generate refined version.
     Updates the article in place.
     """
-    from app.services.openai_client import openai_client
     from app.models.group_articles import GroupArticle
     from app.models.group_research import GroupResearch
     from app.models.post import Post
-    from openai import AsyncOpenAI
+    from app.services.openai_client import openai_pool
     from sqlalchemy import update
 
     # Get specific article and verify it belongs to the group
@@ -344,7 +362,7 @@ Output the refined article as plain text with paragraphs."""
     # Generate refined article
     # NOTE: gpt-5-mini is a reasoning model - does NOT support temperature parameter
     # See GOTCHAS.md "gpt-5-mini Temperature Limitation" section
-    client = AsyncOpenAI(api_key=openai_client.api_key)
+    client = openai_pool.get_client()
     response = await client.chat.completions.create(
         model="gpt-5-mini",
         messages=[{"role": "user", "content": refine_prompt}],
@@ -1,11 +1,19 @@
 """Groups API endpoints (V-5)"""
-from fastapi import APIRouter, Depends, Body
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Body, Query, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 
-from app.database import get_db
+from app.api.schemas import (
+    ArchivedGroup, ArchivedGroupPage, BoardGroup, GroupBoard, GroupPostItem, GroupPostList
+)
+from app.database import get_db, get_async_db
 from app.models.group import Group
 from app.models.post import Post
+from app.services import resource_versions
 
 router = APIRouter()
 
@@ -19,106 +27,208 @@ def _build_x_post_url(author: str | None, post_id: str | None) -> str | None:
     return f"https://x.com/i/web/status/{post_id}"
 
 
-@router.get("/")
-async def get_all_groups(db: Session = Depends(get_db)):
-    """Get all active (non-archived) groups with representative titles and post counts (V-6)"""
-    # Subquery to compute max worthiness per group
-    max_worthiness_subq = (
-        select(Post.group_id, func.max(Post.worthiness_score).label('max_worthiness'))
-        .group_by(Post.group_id)
-        .subquery()
-    )
+def _active_groups_query():
+    """Active groups, newest first (aggregates are stored on Group, see group_aggregates)"""
+    return select(Group).where(Group.archived == False).order_by(Group.first_seen.desc(), Group.id.desc())
+
+
+async def list_active_groups(db: AsyncSession) -> GroupBoard:
+    """Board payload: active groups with representative titles and post counts (V-6)"""
+    groups = (await db.execute(_active_groups_query())).scalars().all()
+
+    return GroupBoard(groups=[BoardGroup(
+        id=g.id,
+        representative_title=g.representative_title,
+        representative_summary=g.representative_summary,
+        category=g.category,
+        first_seen=g.first_seen,
+        post_count=g.post_count,
+        max_worthiness=g.max_worthiness,
+        source_post_id=g.source_post_id,
+        source_author=g.source_author,
+        source_url=_build_x_post_url(g.source_author, g.source_post_id),
+        archived=g.archived,
+        selected=g.selected,
+        state=g.state or 'NEW'
+    ) for g in groups])
+
+
+@router.get("/", response_model=GroupBoard)
+async def get_all_groups(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Get all active (non-archived) groups with representative titles and post counts (V-6)
+
+    Conditional: the ETag is the board version (bumped by ingestion and by
+    every group mutation). A matching If-None-Match gets 304 after one
+    version lookup; otherwise the body comes from the per-version response
+    cache and the board query only runs after a change.
+    """
+    cache = resource_versions.response_cache
+    # Version first: the body built below is at least this new
+    version = await resource_versions.get_version_async(db, resource_versions.GROUPS)
+    etag = resource_versions.etag_for(resource_versions.GROUPS, version)
+    # no-cache: browsers may store the board but must revalidate every time
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if resource_versions.etag_matches(request.headers.get("if-none-match"), etag):
+        cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+
+    body = cache.get(resource_versions.GROUPS, version)
+    if body is None:
+        body = ORJSONResponse(await list_active_groups(db)).body
+        cache.put(resource_versions.GROUPS, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/archived", response_model=ArchivedGroupPage, response_class=ORJSONResponse)
+async def get_archived_groups(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get archived groups, newest first (V-14)
 
-    # Subquery to pick one representative source post per group for external linking.
-    representative_post_subq = (
-        select(
-            Post.group_id.label('group_id'),
-            Post.post_id.label('source_post_id'),
-            Post.author.label('source_author'),
-            func.row_number().over(
-                partition_by=Post.group_id,
-                order_by=[func.coalesce(Post.worthiness_score, 0).desc(), Post.created_at.desc()]
-            ).label('rn')
-        )
-        .subquery()
-    )
+    Paginated by (first_seen, id): pass next_cursor back as cursor for the
+    next page (null on the last page).
+    """
+    from app.services.pagination import after, decode_cursor, encode_cursor
+
+    query = select(
+        Group.id,
+        Group.representative_title,
+        Group.representative_summary,
+        Group.category,
+        Group.first_seen,
+        Group.post_count,
+        Group.archived,
+        Group.selected,
+        Group.state,
+    ).where(Group.archived == True)
+    if cursor:
+        try:
+            query = query.where(after((Group.first_seen, Group.id), decode_cursor(cursor, datetime, int)))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    groups = (await db.execute(
+        query.order_by(Group.first_seen.desc(), Group.id.desc()).limit(limit + 1)
+    )).all()
+    next_cursor = None
+    if len(groups) > limit:
+        groups = groups[:limit]
+        next_cursor = encode_cursor(groups[-1].first_seen, groups[-1].id)
+
+    return ORJSONResponse(ArchivedGroupPage(groups=[ArchivedGroup(
+        id=g.id,
+        representative_title=g.representative_title,
+        representative_summary=g.representative_summary,
+        category=g.category,
+        first_seen=g.first_seen,
+        post_count=g.post_count,
+        archived=g.archived,
+        selected=g.selected,
+        state=g.state or 'NEW'
+    ) for g in groups], next_cursor=next_cursor))
+
+
+@router.get("/export")
+async def export_groups(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    state: Optional[str] = Query(None, pattern="^(NEW|COOKING|REVIEW|PUBLISHED)$"),
+    archived: Optional[bool] = None,
+    category: Optional[str] = None,
+    include_research: bool = True,
+    include_articles: bool = True
+):
+    """Stream groups as NDJSON, oldest first, with their research and articles
 
-    # Query groups with max_worthiness + representative source post via left joins
-    stmt = (
-        select(
-            Group,
-            max_worthiness_subq.c.max_worthiness,
-            representative_post_subq.c.source_post_id,
-            representative_post_subq.c.source_author,
-        )
-        .outerjoin(max_worthiness_subq, Group.id == max_worthiness_subq.c.group_id)
-        .outerjoin(
-            representative_post_subq,
-            (Group.id == representative_post_subq.c.group_id) &
-            (representative_post_subq.c.rn == 1)
+    One JSON object per line with every group column, plus "research" and
+    "articles" lists (oldest first) unless disabled. Groups are read from a
+    server-side cursor; research and articles are loaded per batch of groups.
+
+    Filters: since/until on first_seen (ISO 8601, UTC; until is exclusive),
+    workflow state, archived and category.
+    """
+    import json
+    from app.models.group_articles import GroupArticle
+    from app.models.group_research import GroupResearch
+    from app.services.ndjson_export import ndjson_response, row_to_dict, stream_ndjson, time_range
+
+    since, until = time_range(since, until)
+    query = select(Group.__table__)
+    if since:
+        query = query.where(Group.first_seen >= since)
+    if until:
+        query = query.where(Group.first_seen < until)
+    if state:
+        query = query.where(Group.state == state)
+    if archived is not None:
+        query = query.where(Group.archived == archived)
+    if category:
+        query = query.where(Group.category == category)
+    query = query.order_by(Group.first_seen, Group.id)
+
+    async def nested(db, model, group_ids):
+        rows = await db.execute(
+            select(model.__table__)
+            .where(model.group_id.in_(group_ids))
+            .order_by(model.created_at, model.id)
         )
-        .where(Group.archived == False)
-        .order_by(Group.first_seen.desc())
-    )
-    results = db.execute(stmt).all()
-
-    return {"groups": [{
-        "id": g.id,
-        "representative_title": g.representative_title,
-        "representative_summary": g.representative_summary,
-        "category": g.category,
-        "first_seen": g.first_seen.isoformat() if g.first_seen else None,
-        "post_count": g.post_count,
-        "max_worthiness": max_w,
-        "source_post_id": source_post_id,
-        "source_author": source_author,
-        "source_url": _build_x_post_url(source_author, source_post_id),
-        "archived": g.archived,
-        "selected": g.selected,
-        "state": g.state or 'NEW'
-    } for g, max_w, source_post_id, source_author in results]}
-
-
-@router.get("/archived")
-async def get_archived_groups(db: Session = Depends(get_db)):
-    """Get all archived groups (V-14)"""
-    groups = db.execute(
-        select(Group).where(Group.archived == True).order_by(Group.first_seen.desc())
-    ).scalars().all()
-
-    return {"groups": [{
-        "id": g.id,
-        "representative_title": g.representative_title,
-        "representative_summary": g.representative_summary,
-        "category": g.category,
-        "first_seen": g.first_seen.isoformat() if g.first_seen else None,
-        "post_count": g.post_count,
-        "archived": g.archived,
-        "selected": g.selected,
-        "state": g.state or 'NEW'
-    } for g in groups]}
-
-
-@router.get("/{group_id}/posts")
-async def get_posts_by_group(group_id: int, db: Session = Depends(get_db)):
+        by_group = {}
+        for row in rows:
+            by_group.setdefault(row.group_id, []).append(row_to_dict(row))
+        return by_group
+
+    async def expand(db, items):
+        group_ids = [item["id"] for item in items]
+        if include_research:
+            research = await nested(db, GroupResearch, group_ids)
+            for entries in research.values():
+                for entry in entries:
+                    # Stored as a JSON array string (same parsing as GET /{group_id}/research/)
+                    entry["sources"] = json.loads(entry["sources"]) if entry["sources"] else []
+            for item in items:
+                item["research"] = research.get(item["id"], [])
+        if include_articles:
+            articles = await nested(db, GroupArticle, group_ids)
+            for item in items:
+                item["articles"] = articles.get(item["id"], [])
+
+    return ndjson_response("groups", stream_ndjson("groups", query, expand=expand))
+
+
+@router.get("/{group_id}/posts", response_model=GroupPostList, response_class=ORJSONResponse)
+async def get_posts_by_group(group_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get all posts belonging to a specific group (V-3: visibility inherited from group)"""
-    posts = db.execute(
-        select(Post)
+    # Returned columns only (not article_text/entities); idx_posts_group_created serves the order
+    posts = (await db.execute(
+        select(
+            Post.id,
+            Post.post_id,
+            Post.original_text,
+            Post.author,
+            Post.created_at,
+            Post.ai_title,
+            Post.ai_summary,
+            Post.category,
+            Post.worthiness_score,
+        )
         .where(Post.group_id == group_id)
         .order_by(Post.created_at.desc())
-    ).scalars().all()
+    )).all()
 
-    return {"posts": [{
-        "id": p.id,
-        "post_id": p.post_id,
-        "original_text": p.original_text,
-        "author": p.author,
-        "created_at": p.created_at.isoformat() if p.created_at else None,
-        "ai_title": p.ai_title,
-        "ai_summary": p.ai_summary,
-        "category": p.category,
-        "worthiness_score": p.worthiness_score
-    } for p in posts]}
+    return ORJSONResponse(GroupPostList(posts=[GroupPostItem(
+        id=p.id,
+        post_id=p.post_id,
+        original_text=p.original_text,
+        author=p.author,
+        created_at=p.created_at,
+        ai_title=p.ai_title,
+        ai_summary=p.ai_summary,
+        category=p.category,
+        worthiness_score=p.worthiness_score
+    ) for p in posts]))
 
 
 @router.post("/{group_id}/select")
@@ -129,6 +239,7 @@ async def select_group(group_id: int, db: Session = Depends(get_db)):
     result = db.execute(
         update(Group).where(Group.id == group_id).values(selected=True)
     )
+    resource_versions.bump(db, resource_versions.GROUPS)
     db.commit()
 
     if result.rowcount == 0:
@@ -145,6 +256,7 @@ async def archive_group(group_id: int, db: Session = Depends(get_db)):
     result = db.execute(
         update(Group).where(Group.id == group_id).values(archived=True)
     )
+    resource_versions.bump(db, resource_versions.GROUPS)
     db.commit()
 
     if result.rowcount == 0:
@@ -161,6 +273,7 @@ async def unarchive_group(group_id: int, db: Session = Depends(get_db)):
     result = db.execute(
         update(Group).where(Group.id == group_id).values(archived=False)
     )
+    resource_versions.bump(db, resource_versions.GROUPS)
     db.commit()
 
     if result.rowcount == 0:
@@ -223,6 +336,7 @@ async def transition_group_state(
     db.execute(
         update(Group).where(Group.id == group_id).values(state=target_state)
     )
+    resource_versions.bump(db, resource_versions.GROUPS)
     db.commit()
 
     return {"message": f"Group transitioned to {target_state}", "group_id": group_id, "state": target_state}
@@ -38,6 +38,9 @@ async def get_all_lists(db: Session = Depends(get_db)):
         "description": lst.description,
         "enabled": lst.enabled,
         "last_tweet_id": lst.last_tweet_id,
+        "catchup_pending": lst.catchup_token is not None,
+        "lag_seconds": lst.lag_seconds,
+        "last_fetched_at": lst.last_fetched_at.isoformat() if lst.last_fetched_at else None,
         "created_at": lst.created_at.isoformat() if lst.created_at else None,
         "updated_at": lst.updated_at.isoformat() if lst.updated_at else None
     } for lst in lists]}
@@ -1,17 +1,42 @@
 """Logs API endpoints for viewing and managing system logs"""
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import select, desc, func, delete
+from sqlalchemy import select, desc, func
 from datetime import datetime, timedelta
 
+from app.api.schemas import LogDetail, LogItem, LogPage, LogStats
 from app.database import get_db
 from app.models.system_log import SystemLog
 
 router = APIRouter()
 
 
-@router.get("/")
+def _window(query, hours: int):
+    """Restrict to the last `hours` by timestamp
+
+    Every time-window query goes through here: on Postgres the timestamp bound
+    lets the planner prune system_logs down to the daily partitions it covers.
+    """
+    return query.where(SystemLog.timestamp >= datetime.utcnow() - timedelta(hours=hours))
+
+
+def _filter(query, level, category, logger_name, search):
+    from app.services.log_search import search_condition
+
+    if level:
+        query = query.where(SystemLog.level == level.upper())
+    if category:
+        query = query.where(SystemLog.category == category)
+    if logger_name:
+        query = query.where(SystemLog.logger_name == logger_name)
+    if search:
+        query = query.where(search_condition(search))
+    return query
+
+
+@router.get("/", response_model=LogPage, response_class=ORJSONResponse)
 async def get_logs(
     level: Optional[str] = None,
     category: Optional[str] = None,
@@ -20,79 +45,92 @@ async def get_logs(
     hours: int = Query(24, ge=1, le=168),  # Last 24 hours by default, max 1 week
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
     db: Session = Depends(get_db)
 ):
     """Get system logs with filtering and pagination
 
+    Pages are ordered newest first by (timestamp, id). Pass the previous
+    response's next_cursor to continue after its last row (keyset pagination,
+    constant cost at any depth); offset is still accepted but ignored when a
+    cursor is given.
+
     Args:
         level: Filter by log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         category: Filter by category (api, scheduler, external_api, database)
         logger_name: Filter by specific logger
-        search: Search in message text
+        search: Case-insensitive substring search in message and exception type/message
         hours: Time window in hours (default 24, max 168)
         limit: Maximum number of logs to return (default 100, max 1000)
         offset: Number of logs to skip for pagination
+        cursor: next_cursor from the previous page
+        count: "exact" (COUNT(*)), "estimated" (planner estimate, no scan) or "none"
 
     Returns:
-        Paginated logs with total count
+        Paginated logs with total count (null for count=none), total_is_estimate and next_cursor
     """
-    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    from sqlalchemy.orm import defer
+    from app.services.log_search import estimate_count
+    from app.services.pagination import after, decode_cursor, encode_cursor
 
-    query = select(SystemLog).where(SystemLog.timestamp >= cutoff_time)
-
-    # Apply filters
-    if level:
-        query = query.where(SystemLog.level == level.upper())
-    if category:
-        query = query.where(SystemLog.category == category)
-    if logger_name:
-        query = query.where(SystemLog.logger_name == logger_name)
-    if search:
-        query = query.where(SystemLog.message.ilike(f'%{search}%'))
+    query = _filter(_window(select(SystemLog), hours), level, category, logger_name, search)
 
     # Get total count for pagination
-    count_query = select(func.count(SystemLog.id)).where(SystemLog.timestamp >= cutoff_time)
-    if level:
-        count_query = count_query.where(SystemLog.level == level.upper())
-    if category:
-        count_query = count_query.where(SystemLog.category == category)
-    if logger_name:
-        count_query = count_query.where(SystemLog.logger_name == logger_name)
-    if search:
-        count_query = count_query.where(SystemLog.message.ilike(f'%{search}%'))
-
-    total = db.execute(count_query).scalar()
-
-    # Get paginated logs
+    total_is_estimate = False
+    if count == "exact":
+        count_query = _filter(_window(select(func.count(SystemLog.id)), hours), level, category, logger_name, search)
+        total = db.execute(count_query).scalar()
+    elif count == "estimated":
+        total = estimate_count(db, query)
+        total_is_estimate = True
+    else:
+        total = None
+
+    page_query = query.options(defer(SystemLog.stack_trace))
+    if cursor:
+        try:
+            cursor_timestamp, cursor_id = decode_cursor(cursor, datetime, int)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        page_query = page_query.where(after((SystemLog.timestamp, SystemLog.id), (cursor_timestamp, cursor_id)))
+    else:
+        page_query = page_query.offset(offset)
+
+    # Get paginated logs (one extra row tells whether another page exists)
     logs = db.execute(
-        query.order_by(desc(SystemLog.timestamp))
-        .limit(limit)
-        .offset(offset)
+        page_query.order_by(desc(SystemLog.timestamp), desc(SystemLog.id))
+        .limit(limit + 1)
     ).scalars().all()
-
-    return {
-        "logs": [
-            {
-                "id": log.id,
-                "timestamp": log.timestamp.isoformat() if log.timestamp else None,
-                "level": log.level,
-                "logger_name": log.logger_name,
-                "message": log.message,
-                "category": log.category,
-                "exception_type": log.exception_type,
-                "exception_message": log.exception_message,
-                "context": log.context,
-                "correlation_id": log.correlation_id
-            }
+    has_more = len(logs) > limit
+    logs = logs[:limit]
+    next_cursor = encode_cursor(logs[-1].timestamp, logs[-1].id) if has_more else None
+
+    return ORJSONResponse(LogPage(
+        logs=[
+            LogItem(
+                id=log.id,
+                timestamp=log.timestamp,
+                level=log.level,
+                logger_name=log.logger_name,
+                message=log.message,
+                category=log.category,
+                exception_type=log.exception_type,
+                exception_message=log.exception_message,
+                context=log.context,
+                correlation_id=log.correlation_id
+            )
             for log in logs
         ],
-        "total": total,
-        "offset": offset,
-        "limit": limit
-    }
+        total=total,
+        total_is_estimate=total_is_estimate,
+        offset=offset,
+        limit=limit,
+        next_cursor=next_cursor
+    ))
 
 
-@router.get("/stats")
+@router.get("/stats", response_model=LogStats, response_class=ORJSONResponse)
 async def get_log_stats(
     hours: int = Query(24, ge=1, le=168),
     db: Session = Depends(get_db)
@@ -105,39 +143,58 @@ async def get_log_stats(
     Returns:
         Statistics including total logs, error count, counts by level and category
     """
-    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-    # Count by level
-    level_counts = db.execute(
-        select(SystemLog.level, func.count(SystemLog.id))
-        .where(SystemLog.timestamp >= cutoff_time)
-        .group_by(SystemLog.level)
-    ).all()
-
-    # Count by category
-    category_counts = db.execute(
-        select(SystemLog.category, func.count(SystemLog.id))
-        .where(SystemLog.timestamp >= cutoff_time)
-        .group_by(SystemLog.category)
-    ).all()
-
-    # Error count
-    error_count = db.execute(
-        select(func.count(SystemLog.id))
-        .where(SystemLog.timestamp >= cutoff_time)
-        .where(SystemLog.level.in_(['ERROR', 'CRITICAL']))
-    ).scalar()
+    from app.services.log_rollups import ERROR_LEVELS, window_counts
 
-    return {
-        "time_window_hours": hours,
-        "total_logs": sum(count for _, count in level_counts),
-        "error_count": error_count,
-        "by_level": {level: count for level, count in level_counts},
-        "by_category": {cat: count for cat, count in category_counts if cat}
-    }
+    # Hourly rollups for whole hours + raw rows for the leading partial hour
+    by_level, by_category = window_counts(db, hours)
+
+    return ORJSONResponse(LogStats(
+        time_window_hours=hours,
+        total_logs=sum(by_level.values()),
+        error_count=sum(by_level.get(level, 0) for level in ERROR_LEVELS),
+        by_level=by_level,
+        by_category=by_category
+    ))
+
+
+@router.get("/export")
+async def export_logs(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    level: Optional[str] = None,
+    category: Optional[str] = None,
+    logger_name: Optional[str] = None,
+    search: Optional[str] = None
+):
+    """Stream system logs as NDJSON, oldest first
 
+    One JSON object per line with every column, stack traces included. Rows
+    come from a server-side cursor, so any retained range can be exported
+    with constant memory; on Postgres since/until also prune the daily
+    partitions that are read.
+
+    Args:
+        since: Start of the range (ISO 8601, UTC; default: oldest retained log)
+        until: End of the range, exclusive (default: now)
+        level, category, logger_name, search: Same filters as GET /api/logs/
+
+    Returns:
+        application/x-ndjson attachment (logs-<timestamp>.ndjson)
+    """
+    from app.services.ndjson_export import ndjson_response, stream_ndjson, time_range
 
-@router.get("/{log_id}")
+    since, until = time_range(since, until)
+    query = _filter(select(SystemLog.__table__), level, category, logger_name, search)
+    if since:
+        query = query.where(SystemLog.timestamp >= since)
+    if until:
+        query = query.where(SystemLog.timestamp < until)
+    query = query.order_by(SystemLog.timestamp, SystemLog.id)
+
+    return ndjson_response("logs", stream_ndjson("logs", query))
+
+
+@router.get("/{log_id}", response_model=LogDetail, response_class=ORJSONResponse)
 async def get_log_detail(
     log_id: int,
     db: Session = Depends(get_db)
@@ -157,19 +214,19 @@ async def get_log_detail(
     if not log:
         raise HTTPException(status_code=404, detail="Log not found")
 
-    return {
-        "id": log.id,
-        "timestamp": log.timestamp.isoformat() if log.timestamp else None,
-        "level": log.level,
-        "logger_name": log.logger_name,
-        "message": log.message,
-        "category": log.category,
-        "exception_type": log.exception_type,
-        "exception_message": log.exception_message,
-        "stack_trace": log.stack_trace,
-        "context": log.context,
-        "correlation_id": log.correlation_id
-    }
+    return ORJSONResponse(LogDetail(
+        id=log.id,
+        timestamp=log.timestamp,
+        level=log.level,
+        logger_name=log.logger_name,
+        message=log.message,
+        category=log.category,
+        exception_type=log.exception_type,
+        exception_message=log.exception_message,
+        stack_trace=log.stack_trace,
+        context=log.context,
+        correlation_id=log.correlation_id
+    ))
 
 
 @router.delete("/cleanup")
@@ -179,21 +236,24 @@ async def cleanup_old_logs(
 ):
     """Delete logs older than specified days
 
+    On Postgres whole daily partitions are dropped (deleted_count is then the
+    planner's row estimate for them); elsewhere rows are deleted.
+
     Args:
         days: Number of days to retain (minimum 7, maximum 90, default 30)
 
     Returns:
-        Number of deleted logs
+        Number of deleted logs and the partitions dropped
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    from app.services.log_partitions import enforce_retention
+    from app.services.settings_service import SettingsService
 
-    result = db.execute(
-        delete(SystemLog).where(SystemLog.timestamp < cutoff_date)
-    )
+    result = enforce_retention(db, days, SettingsService(db).get('log_partitions_ahead_days', 3))
 
     db.commit()
 
     return {
         "message": f"Deleted logs older than {days} days",
-        "deleted_count": result.rowcount
+        "deleted_count": result['deleted_count'],
+        "dropped_partitions": result['dropped_partitions']
     }
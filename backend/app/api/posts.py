@@ -1,17 +1,80 @@
 """Posts API endpoints"""
-from typing import List
-from fastapi import APIRouter, Depends, Path
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Path, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.api.schemas import PostItem, PostPage, RecommendedPosts
+from app.database import get_db, get_async_db
 from app.models.post import Post
 from app.services.settings_service import SettingsService
 
 router = APIRouter()
 
-
-@router.get("/")
-async def get_all_posts(db: Session = Depends(get_db)):
+# Columns returned by the list endpoints (no article_text/entities or other large fields)
+POST_LIST_COLUMNS = (
+    Post.id,
+    Post.post_id,
+    Post.original_text,
+    Post.author,
+    Post.created_at,
+    Post.ai_title,
+    Post.ai_summary,
+    Post.category,
+    Post.categorization_score,
+    Post.worthiness_score,
+    Post.group_id,
+    Post.ingested_at,
+)
+
+
+def _post_item(p) -> PostItem:
+    return PostItem(
+        id=p.id,
+        post_id=p.post_id,
+        original_text=p.original_text,
+        author=p.author,
+        created_at=p.created_at,
+        ai_title=p.ai_title,
+        ai_summary=p.ai_summary,
+        category=p.category,
+        categorization_score=p.categorization_score,
+        worthiness_score=p.worthiness_score,
+        group_id=p.group_id
+    )
+
+
+def _page_by_ingested_at(query, cursor: Optional[str], limit: int):
+    """Newest first by (ingested_at, id), continuing after cursor; fetches limit + 1 rows"""
+    from app.services.pagination import after, decode_cursor
+
+    if cursor:
+        try:
+            values = decode_cursor(cursor, datetime, int)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(after((Post.ingested_at, Post.id), values))
+    return query.order_by(Post.ingested_at.desc(), Post.id.desc()).limit(limit + 1)
+
+
+def _split_page(rows: list, limit: int):
+    """(rows of this page, cursor of the next page or None) from a limit + 1 fetch"""
+    from app.services.pagination import encode_cursor
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].ingested_at, rows[-1].id)
+
+
+@router.get("/", response_model=PostPage, response_class=ORJSONResponse)
+async def get_all_posts(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Retrieve all posts from the database (Frontend → Backend)
 
@@ -26,6 +89,10 @@ async def get_all_posts(db: Session = Depends(get_db)):
     - Excludes archived posts (old/irrelevant posts)
     - Ordered by ingestion date (newest first)
 
+    **Pagination:**
+    - `limit` posts per page (default 100, max 500)
+    - Pass the response's `next_cursor` as `cursor` for the next page (null on the last page)
+
     **Returns:**
     - Post text, author, timestamps
     - AI-generated title, summary, category
@@ -36,30 +103,24 @@ async def get_all_posts(db: Session = Depends(get_db)):
     from app.models.group import Group
 
     # V-3: Posts inherit visibility from their group - JOIN to filter by Group.archived
-    posts = db.execute(
-        select(Post)
+    posts = (await db.execute(_page_by_ingested_at(
+        select(*POST_LIST_COLUMNS)
         .join(Group, Post.group_id == Group.id)
-        .where(Group.archived == False)
-        .order_by(Post.ingested_at.desc())
-    ).scalars().all()
-
-    return {"posts": [{
-        "id": p.id,
-        "post_id": p.post_id,
-        "original_text": p.original_text,
-        "author": p.author,
-        "created_at": p.created_at.isoformat() if p.created_at else None,
-        "ai_title": p.ai_title,
-        "ai_summary": p.ai_summary,
-        "category": p.category,
-        "categorization_score": p.categorization_score,
-        "worthiness_score": p.worthiness_score,
-        "group_id": p.group_id
-    } for p in posts]}
-
-
-@router.get("/recommended")
-async def get_recommended_posts(db: Session = Depends(get_db)):
+        .where(Group.archived == False),
+        cursor, limit
+    ))).all()
+
+    posts, next_cursor = _split_page(posts, limit)
+
+    return ORJSONResponse(PostPage(posts=[_post_item(p) for p in posts], next_cursor=next_cursor))
+
+
+@router.get("/recommended", response_model=RecommendedPosts, response_class=ORJSONResponse)
+async def get_recommended_posts(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Get AI-filtered recommended posts for article generation (Frontend → Backend)
 
@@ -78,6 +139,11 @@ async def get_recommended_posts(db: Session = Depends(get_db)):
     - Not yet selected (available for article creation)
     - Grouped by category (Product, Engineering, HR, etc.)
 
+    **Pagination:**
+    - Pages hold the `limit` most recently ingested matching posts (default 100, max 500)
+    - The body stays a category mapping, so the next page's cursor is sent in
+      the `X-Next-Cursor` response header (absent on the last page)
+
     **Returns:**
     - Grouped by category (dict with category names as keys)
     - Sorted by worthiness score within each category (best first)
@@ -90,42 +156,74 @@ async def get_recommended_posts(db: Session = Depends(get_db)):
     from sqlalchemy import select
 
     # V-13: Read worthiness threshold from settings
-    settings_svc = SettingsService(db)
-    worthiness_threshold = settings_svc.get('worthiness_threshold', 0.6)
+    worthiness_threshold = await SettingsService.get_async(db, 'worthiness_threshold', 0.6)
 
     from app.models.group import Group
 
     # V-3: Posts inherit visibility from their group - JOIN to filter by Group.archived/selected
-    posts = db.execute(
-        select(Post)
+    posts = (await db.execute(_page_by_ingested_at(
+        select(*POST_LIST_COLUMNS)
         .join(Group, Post.group_id == Group.id)
         .where(Post.worthiness_score > worthiness_threshold)
         .where(Group.archived == False)
-        .where(Group.selected == False)
-        .order_by(Post.category, Post.worthiness_score.desc())
-    ).scalars().all()
+        .where(Group.selected == False),
+        cursor, limit
+    ))).all()
+
+    posts, next_cursor = _split_page(posts, limit)
 
-    # Group by category
+    # Group by category (category order, best first within the page)
     grouped = {}
-    for post in posts:
+    for post in sorted(posts, key=lambda p: (p.category or '', -(p.worthiness_score or 0))):
         category = post.category or "Uncategorized"
         if category not in grouped:
             grouped[category] = []
-        grouped[category].append({
-            "id": post.id,
-            "post_id": post.post_id,
-            "original_text": post.original_text,
-            "author": post.author,
-            "created_at": post.created_at.isoformat() if post.created_at else None,
-            "ai_title": post.ai_title,
-            "ai_summary": post.ai_summary,
-            "category": post.category,
-            "categorization_score": post.categorization_score,
-            "worthiness_score": post.worthiness_score,
-            "group_id": post.group_id
-        })
-
-    return grouped
+        grouped[category].append(_post_item(post))
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return ORJSONResponse(grouped, headers=headers)
+
+
+@router.get("/export")
+async def export_posts(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    category: Optional[str] = None,
+    archived: Optional[bool] = None
+):
+    """
+    Stream posts as NDJSON, oldest first (Frontend → Backend)
+
+    One JSON object per line with every stored post column (including
+    article text and entities). Rows are streamed from a server-side cursor,
+    so exporting months of posts does not load them into memory.
+
+    **Filters:**
+    - `since` / `until`: ingestion time range (ISO 8601, UTC; until is exclusive)
+    - `category`: exact category
+    - `archived`: only posts of archived (true) or active (false) groups
+
+    **Returns:**
+    - `application/x-ndjson` attachment (posts-<timestamp>.ndjson)
+    """
+    from sqlalchemy import select
+    from app.models.group import Group
+    from app.services.ndjson_export import ndjson_response, stream_ndjson, time_range
+
+    since, until = time_range(since, until)
+    query = select(Post.__table__)
+    if since:
+        query = query.where(Post.ingested_at >= since)
+    if until:
+        query = query.where(Post.ingested_at < until)
+    if category:
+        query = query.where(Post.category == category)
+    if archived is not None:
+        # V-3: Posts inherit visibility from their group
+        query = query.where(Post.group_id.in_(select(Group.id).where(Group.archived == archived)))
+    query = query.order_by(Post.ingested_at, Post.id)
+
+    return ndjson_response("posts", stream_ndjson("posts", query))
 
 
 @router.get("/{post_id}")
@@ -0,0 +1,176 @@
+"""Typed response schemas for the read endpoints (posts, groups, articles, logs)
+
+Slotted dataclasses, filled straight from result rows and returned in an
+ORJSONResponse: orjson serializes dataclasses and datetimes natively (naive
+datetimes as the same ISO 8601 text .isoformat() gives). Handlers return the
+response object, which skips FastAPI's generic jsonable_encoder pass; the
+schemas are also declared as response_model so /docs shows them.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+# Posts
+
+@dataclass(slots=True)
+class PostItem:
+    id: int
+    post_id: str
+    original_text: str
+    author: Optional[str]
+    created_at: Optional[datetime]
+    ai_title: Optional[str]
+    ai_summary: Optional[str]
+    category: Optional[str]
+    categorization_score: Optional[float]
+    worthiness_score: Optional[float]
+    group_id: Optional[int]
+
+
+@dataclass(slots=True)
+class PostPage:
+    posts: List[PostItem]
+    next_cursor: Optional[str]
+
+
+# Category -> posts (GET /api/posts/recommended)
+RecommendedPosts = Dict[str, List[PostItem]]
+
+
+# Groups
+
+@dataclass(slots=True)
+class BoardGroup:
+    id: int
+    representative_title: str
+    representative_summary: Optional[str]
+    category: str
+    first_seen: Optional[datetime]
+    post_count: int
+    max_worthiness: Optional[float]
+    source_post_id: Optional[str]
+    source_author: Optional[str]
+    source_url: Optional[str]
+    archived: bool
+    selected: bool
+    state: str
+
+
+@dataclass(slots=True)
+class GroupBoard:
+    groups: List[BoardGroup]
+
+
+@dataclass(slots=True)
+class ArchivedGroup:
+    id: int
+    representative_title: str
+    representative_summary: Optional[str]
+    category: str
+    first_seen: Optional[datetime]
+    post_count: int
+    archived: bool
+    selected: bool
+    state: str
+
+
+@dataclass(slots=True)
+class ArchivedGroupPage:
+    groups: List[ArchivedGroup]
+    next_cursor: Optional[str]
+
+
+@dataclass(slots=True)
+class GroupPostItem:
+    id: int
+    post_id: str
+    original_text: str
+    author: Optional[str]
+    created_at: Optional[datetime]
+    ai_title: Optional[str]
+    ai_summary: Optional[str]
+    category: Optional[str]
+    worthiness_score: Optional[float]
+
+
+@dataclass(slots=True)
+class GroupPostList:
+    posts: List[GroupPostItem]
+
+
+# Group articles
+
+@dataclass(slots=True)
+class ArticleItem:
+    id: int
+    group_id: int
+    style: str
+    title: Optional[str]
+    preview: Optional[str]
+    content: str
+    posted_to_teams: Optional[datetime]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+@dataclass(slots=True)
+class ArticlePage:
+    articles: List[ArticleItem]
+    count: int
+    next_cursor: Optional[str]
+
+
+@dataclass(slots=True)
+class ArticleDetail:
+    article: ArticleItem
+
+
+# Logs
+
+@dataclass(slots=True)
+class LogItem:
+    id: int
+    timestamp: Optional[datetime]
+    level: str
+    logger_name: str
+    message: str
+    category: Optional[str]
+    exception_type: Optional[str]
+    exception_message: Optional[str]
+    context: Optional[str]
+    correlation_id: Optional[str]
+
+
+@dataclass(slots=True)
+class LogPage:
+    logs: List[LogItem]
+    total: Optional[int]
+    total_is_estimate: bool
+    offset: int
+    limit: int
+    next_cursor: Optional[str]
+
+
+@dataclass(slots=True)
+class LogDetail:
+    id: int
+    timestamp: Optional[datetime]
+    level: str
+    logger_name: str
+    message: str
+    category: Optional[str]
+    exception_type: Optional[str]
+    exception_message: Optional[str]
+    stack_trace: Optional[str]
+    context: Optional[str]
+    correlation_id: Optional[str]
+
+
+@dataclass(slots=True)
+class LogStats:
+    time_window_hours: int
+    total_logs: int
+    error_count: int
+    by_level: Dict[str, int]
+    by_category: Dict[str, int]
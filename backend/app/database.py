@@ -1,13 +1,97 @@
 """Database setup and session management"""
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
 
-engine = create_engine(settings.database_url)
+
+def _async_database_url(url: str) -> str:
+    """Same database through its asyncio driver (asyncpg for Postgres, aiosqlite for SQLite)"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+def _engine_options(url: str, name: str, pool_size: int, max_overflow: int, is_async: bool) -> dict:
+    """Pool sizing, recycling, pre-ping and statement timeout from config (DB_* env vars)"""
+    from app.services.db_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool
+
+    if url.startswith("sqlite") and ":memory:" in url:
+        return {}  # Single shared connection; no pool to size
+
+    options = {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_logging_name": name,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if settings.db_statement_timeout_ms and url.startswith(("postgresql", "postgres")):
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(settings.db_statement_timeout_ms)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={settings.db_statement_timeout_ms}"}
+    return options
+
+
+def create_db_engine(name: str, pool_size: int = None, max_overflow: int = None):
+    """Create a configured, instrumented sync engine (metrics: /api/admin/db-pool)"""
+    from app.services.db_metrics import instrument_engine
+
+    db_engine = create_engine(settings.database_url, **_engine_options(
+        settings.database_url,
+        name,
+        settings.db_pool_size if pool_size is None else pool_size,
+        settings.db_max_overflow if max_overflow is None else max_overflow,
+        is_async=False
+    ))
+    instrument_engine(db_engine, name)
+    return db_engine
+
+
+def create_async_db_engine(name: str, pool_size: int = None, max_overflow: int = None):
+    """Create a configured, instrumented AsyncEngine on the asyncio driver"""
+    from app.services.db_metrics import instrument_engine
+
+    url = _async_database_url(settings.database_url)
+    db_engine = create_async_engine(url, **_engine_options(
+        url,
+        name,
+        settings.db_pool_size if pool_size is None else pool_size,
+        settings.db_max_overflow if max_overflow is None else max_overflow,
+        is_async=True
+    ))
+    instrument_engine(db_engine.sync_engine, name)
+    return db_engine
+
+
+engine = create_db_engine("app")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async path: queries awaited on the event loop instead of blocking it.
+# expire_on_commit=False because expired attributes cannot lazy-load in async code.
+async_engine = create_async_db_engine("async")
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# Log writes get their own small pool so a busy app pool never blocks logging
+# (shared by every DatabaseLogHandler)
+log_engine = create_db_engine("logging", pool_size=settings.db_log_pool_size, max_overflow=settings.db_log_max_overflow)
+LogSessionLocal = sessionmaker(bind=log_engine)
+
+# Streaming exports get their own small pool: a long download never holds an
+# app connection, and concurrent exports queue here instead of starving the API
+export_engine = create_async_db_engine(
+    "export", pool_size=settings.db_export_pool_size, max_overflow=settings.db_export_max_overflow
+)
+ExportSessionLocal = async_sessionmaker(export_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -20,6 +104,12 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for FastAPI to get an async database session (non-blocking queries)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def run_migrations():
     """Run any pending database migrations"""
     db = SessionLocal()
@@ -46,6 +136,28 @@ def run_migrations():
             db.execute(text("ALTER TABLE posts ADD COLUMN ingestion_fallback_reason VARCHAR"))
             db.commit()
 
+        # Catch-up fetching: per-list pagination cursor and lag
+        try:
+            db.execute(text("SELECT catchup_token FROM list_metadata LIMIT 1"))
+        except Exception:
+            db.rollback()
+            db.execute(text("ALTER TABLE list_metadata ADD COLUMN catchup_token VARCHAR"))
+            db.execute(text("ALTER TABLE list_metadata ADD COLUMN catchup_until_id VARCHAR"))
+            db.execute(text("ALTER TABLE list_metadata ADD COLUMN lag_seconds INTEGER"))
+            db.execute(text("ALTER TABLE list_metadata ADD COLUMN last_fetched_at TIMESTAMP"))
+            db.commit()
+
+        # Write-time group aggregates (filled by group_aggregates.backfill_group_aggregates)
+        try:
+            db.execute(text("SELECT max_worthiness FROM groups LIMIT 1"))
+        except Exception:
+            db.rollback()
+            db.execute(text("ALTER TABLE groups ADD COLUMN max_worthiness FLOAT"))
+            db.execute(text("ALTER TABLE groups ADD COLUMN representative_post_id INTEGER"))
+            db.execute(text("ALTER TABLE groups ADD COLUMN source_post_id VARCHAR"))
+            db.execute(text("ALTER TABLE groups ADD COLUMN source_author VARCHAR"))
+            db.commit()
+
         # V-11: Add article_pipeline_enabled feature flag default
         try:
             result = db.execute(text("SELECT value FROM system_settings WHERE key = 'article_pipeline_enabled'"))
@@ -58,6 +170,15 @@ def run_migrations():
         except Exception:
             # Setting already exists or system_settings table issue
             pass
+
+        # Query indexes added after release (new databases get them from create_all)
+        from app.models.post import Post
+        from app.models.group import Group
+        from app.models.group_articles import GroupArticle
+        for table in (Post.__table__, Group.__table__, GroupArticle.__table__):
+            for index in table.indexes:
+                if index.name.startswith('idx_'):
+                    index.create(bind=engine, checkfirst=True)
     except Exception:
         db.rollback()
     finally:
@@ -108,7 +229,61 @@ def initialize_default_settings():
                 key='posts_per_fetch',
                 value='5',
                 value_type='int',
-                description='Number of posts to fetch per list',
+                description='Number of posts per X API page (catch-up may fetch several pages per list)',
+                category='scheduling',
+                min_value=1.0,
+                max_value=100.0
+            ),
+            SystemSettings(
+                key='ingest_concurrency',
+                value='4',
+                value_type='int',
+                description='Number of posts enriched in parallel during ingestion',
+                category='scheduling',
+                min_value=1.0,
+                max_value=16.0
+            ),
+            SystemSettings(
+                key='fetch_concurrency',
+                value='3',
+                value_type='int',
+                description='Maximum number of X lists fetched in parallel per ingestion run',
+                category='scheduling',
+                min_value=1.0,
+                max_value=10.0
+            ),
+            SystemSettings(
+                key='catchup_enabled',
+                value='true',
+                value_type='bool',
+                description='Page back through busy lists until the last fetched tweet is reached',
+                category='scheduling',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='catchup_max_pages',
+                value='5',
+                value_type='int',
+                description='Maximum X API pages fetched per list per ingestion run',
+                category='scheduling',
+                min_value=1.0,
+                max_value=50.0
+            ),
+            SystemSettings(
+                key='catchup_max_posts',
+                value='200',
+                value_type='int',
+                description='Maximum posts fetched per list per ingestion run',
+                category='scheduling',
+                min_value=5.0,
+                max_value=800.0
+            ),
+            SystemSettings(
+                key='checkpoint_batch_size',
+                value='10',
+                value_type='int',
+                description='Stored posts per ingestion checkpoint commit (interrupted runs keep committed work)',
                 category='scheduling',
                 min_value=1.0,
                 max_value=100.0
@@ -149,6 +324,123 @@ def initialize_default_settings():
                 min_value=0.7,
                 max_value=0.95
             ),
+            SystemSettings(
+                key='single_call_enrichment',
+                value='false',
+                value_type='bool',
+                description='Categorize, title, summarize and score each post in one structured-output call',
+                category='filtering',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='prefilter_min_chars',
+                value='20',
+                value_type='int',
+                description='Minimum post length without URLs; shorter (link-only) posts are skipped before any LLM call',
+                category='filtering',
+                min_value=0.0,
+                max_value=280.0
+            ),
+            SystemSettings(
+                key='prefilter_allowed_languages',
+                value='[]',
+                value_type='json',
+                description='X language codes to keep, e.g. ["en", "de"] (empty = all languages)',
+                category='filtering',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='prefilter_spam_patterns',
+                value='["\\\\bgiveaway\\\\b", "\\\\bairdrop\\\\b", "follow\\\\s*(\\\\+|&|and)\\\\s*(rt|retweet)", "\\\\bpromo code\\\\b"]',
+                value_type='json',
+                description='Regular expressions; matching posts are skipped as spam before any LLM call',
+                category='filtering',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='prefilter_max_hashtags',
+                value='8',
+                value_type='int',
+                description='Posts with more hashtags are skipped as spam (0 = no limit)',
+                category='filtering',
+                min_value=0.0,
+                max_value=50.0
+            ),
+            SystemSettings(
+                key='prefilter_near_duplicate_enabled',
+                value='true',
+                value_type='bool',
+                description='Skip reposts and near-copies of recently ingested posts (SimHash)',
+                category='filtering',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='prefilter_near_duplicate_window_hours',
+                value='48',
+                value_type='int',
+                description='How far back ingested posts are checked for near-copies',
+                category='filtering',
+                min_value=1.0,
+                max_value=336.0
+            ),
+            SystemSettings(
+                key='prefilter_near_duplicate_max_distance',
+                value='3',
+                value_type='int',
+                description='Maximum differing SimHash bits (of 64) to count as a near-copy',
+                category='filtering',
+                min_value=0.0,
+                max_value=10.0
+            ),
+            SystemSettings(
+                key='grouping_mode',
+                value='embedding',
+                value_type='string',
+                description="Topic grouping strategy: 'embedding' (vector top-k lookup) or 'llm' (compare against every group)",
+                category='filtering',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='grouping_embedder',
+                value='openai',
+                value_type='string',
+                description="Embedder used for grouping: 'openai' or 'hashing' (local, offline)",
+                category='filtering',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='embedding_match_threshold',
+                value='0.85',
+                value_type='float',
+                description='Cosine similarity at or above which a post joins a group without an LLM check',
+                category='filtering',
+                min_value=0.5,
+                max_value=0.99
+            ),
+            SystemSettings(
+                key='embedding_tiebreak_threshold',
+                value='0.7',
+                value_type='float',
+                description='Cosine similarity above which candidates are confirmed by the LLM tie-breaker',
+                category='filtering',
+                min_value=0.3,
+                max_value=0.99
+            ),
+            SystemSettings(
+                key='grouping_llm_tiebreak',
+                value='true',
+                value_type='bool',
+                description='Use LLM title comparison for borderline embedding matches',
+                category='filtering',
+                min_value=None,
+                max_value=None
+            ),
             SystemSettings(
                 key='scheduler_paused',
                 value='false',
@@ -232,6 +524,76 @@ def initialize_default_settings():
                 category='system',
                 min_value=7.0,
                 max_value=90.0
+            ),
+            SystemSettings(
+                key='llm_cache_enabled',
+                value='true',
+                value_type='bool',
+                description='Serve identical LLM requests (same model, prompt and input) from the response cache',
+                category='system',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='llm_cache_bypass',
+                value='[]',
+                value_type='json',
+                description='Operations that always call the LLM, e.g. ["score_worthiness"]',
+                category='system',
+                min_value=None,
+                max_value=None
+            ),
+            SystemSettings(
+                key='llm_cache_ttl_hours',
+                value='168',
+                value_type='int',
+                description='Hours a cached LLM response stays valid',
+                category='system',
+                min_value=1.0,
+                max_value=2160.0
+            ),
+            SystemSettings(
+                key='llm_cache_max_entries',
+                value='50000',
+                value_type='int',
+                description='Maximum cached LLM responses kept (least recently used are evicted)',
+                category='system',
+                min_value=1000.0,
+                max_value=1000000.0
+            ),
+            SystemSettings(
+                key='loop_monitor_enabled',
+                value='true',
+                value_type='bool',
+                description='Sample event loop lag and capture stacks of blocking calls (applies on restart)',
+                category='system'
+            ),
+            SystemSettings(
+                key='loop_monitor_interval_ms',
+                value='100',
+                value_type='int',
+                description='Event loop lag sampling interval in milliseconds (applies on restart)',
+                category='system',
+                min_value=10.0,
+                max_value=5000.0
+            ),
+            SystemSettings(
+                key='loop_block_threshold_ms',
+                value='200',
+                value_type='int',
+                description='Loop stalls longer than this are recorded with the blocking stack (applies on restart)',
+                category='system',
+                min_value=20.0,
+                max_value=60000.0
+            ),
+            SystemSettings(
+                key='log_partitions_ahead_days',
+                value='3',
+                value_type='int',
+                description='Daily system_logs partitions created in advance (Postgres only)',
+                category='system',
+                min_value=1.0,
+                max_value=30.0
             )
         ]
 
@@ -4,10 +4,15 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.api import posts, articles
-from app.database import engine, Base, initialize_default_settings, run_migrations
+from app.database import engine, async_engine, export_engine, Base, initialize_default_settings, run_migrations
 from app.models import Post, Article, ListMetadata, SystemSettings
 from app.models.group_research import GroupResearch
 from app.models.group_articles import GroupArticle
+from app.models.group_embedding import GroupEmbedding
+from app.models.llm_cache import LLMCacheEntry
+from app.models.ingestion_run import IngestionRun, IngestionRunList
+from app.models.log_rollup import LogHourlyRollup
+from app.models.resource_version import ResourceVersion
 
 
 def seed_or_upgrade_prompts():
@@ -139,9 +144,21 @@ app = FastAPI(
 # Start background scheduler
 from app.services.scheduler import start_scheduler
 from app.services.logging_config import setup_logging
+from app.services.openai_client import openai_pool
+from app.services.http_clients import start_http_clients, close_http_clients
+from app.services.loop_monitor import loop_monitor
+from app.services.logging_handler import log_writer
+from app.services.log_partitions import setup_log_partitions
+from app.services.log_search import setup_log_search
+from app.services import log_rollups
+from app.services import resource_versions
+from app.services.group_aggregates import backfill_group_aggregates
+from app.services.ingestion_metrics import ingestion_run_recorder
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+import asyncio
 import jwt
+import re
 
 @app.on_event("startup")
 async def startup_event():
@@ -154,16 +171,48 @@ async def startup_event():
     Base.metadata.create_all(bind=engine)
     # Run pending migrations
     run_migrations()
+    # Daily system_logs partitions (Postgres only)
+    setup_log_partitions(engine)
+    # Keyset and trigram search indexes on system_logs
+    setup_log_search(engine)
+    # Hourly log counts for /api/logs/stats (one-time build from existing logs)
+    log_rollups.backfill(engine)
+    # Version counters behind the group board ETag
+    resource_versions.seed(engine, resource_versions.GROUPS)
+    # Board aggregates on groups (fills groups that predate the columns)
+    backfill_group_aggregates()
+    # Ingestion runs cut off by the last shutdown/crash are no longer running
+    ingestion_run_recorder.close_interrupted()
     # Initialize default settings (V-21)
     initialize_default_settings()
     # Auto-seed prompts (V-22)
     seed_or_upgrade_prompts()
     # Setup logging
     setup_logging()
+    # Shared upstream HTTP clients (X API, Teams, OpenAI keep-alive pools)
+    start_http_clients()
+    openai_pool.start()
+    # Event loop lag sampling / blocking-call detection
+    loop_monitor.start()
     # Start scheduler
     start_scheduler()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Close pooled upstream connections
+    await openai_pool.close()
+    await close_http_clients()
+    # LLM cache hits served from memory since the last write-back
+    from app.services.llm_cache import llm_cache
+    await llm_cache.flush_touches()
+    await async_engine.dispose()
+    await export_engine.dispose()
+    await loop_monitor.stop()
+    # Flush queued log rows last so shutdown messages are kept
+    await asyncio.to_thread(log_writer.stop)
+
+
 class AuthMiddleware(BaseHTTPMiddleware):
     """JWT authentication middleware (V-5)"""
 
@@ -215,6 +264,21 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         return await call_next(request)
 
+class LoopActivityMiddleware:
+    """Attribute event loop time to the request route (see loop_monitor)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        # Collapse numeric IDs so /api/groups/12/posts and /api/groups/13/posts share a label
+        path = re.sub(r"/\d+(?=/|$)", "/{id}", scope["path"])
+        with loop_monitor.activity(f"{scope['method']} {path}"):
+            await self.app(scope, receive, send)
+
+
 # CORS configuration - allow both local dev and production
 import os
 
@@ -238,7 +302,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Cursor of the next page for endpoints whose body cannot carry it (/api/posts/recommended)
+    expose_headers=["X-Next-Cursor"],
 )
+# Outermost, so the route label also covers time spent in auth and CORS handling
+app.add_middleware(LoopActivityMiddleware)
 
 # Include routers
 app.include_router(posts.router, prefix="/api/posts", tags=["posts"])
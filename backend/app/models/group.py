@@ -1,5 +1,5 @@
 """Group model (news story grouping entity)"""
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, func, Index
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Float, func, Index
 
 from app.database import Base
 
@@ -28,6 +28,23 @@ class Group(Base):
     # State machine (NEW → COOKING → REVIEW → PUBLISHED)
     state = Column(String, default='NEW', nullable=False, index=True)
 
+    # Aggregates over the group's posts, maintained at write time (see group_aggregates)
+    max_worthiness = Column(Float, nullable=True)
+    representative_post_id = Column(Integer, nullable=True)  # posts.id of the best-scored post
+    source_post_id = Column(String, nullable=True)  # X post ID of that post (for the source link)
+    source_author = Column(String, nullable=True)
+
     # Timestamps
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+# Keyset pagination of the archive: archived = true ORDER BY first_seen DESC, id DESC
+Index('idx_groups_archived_first_seen_id', Group.archived, Group.first_seen, Group.id)
+# The board: archived = false ORDER BY first_seen DESC, id DESC. Partial, so it
+# stays the size of the active set while archived groups accumulate.
+Index(
+    'idx_groups_active_first_seen_id', Group.first_seen, Group.id,
+    postgresql_where=Group.archived == False,
+    sqlite_where=Group.archived == False
+)
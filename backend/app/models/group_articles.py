@@ -1,5 +1,5 @@
 """GroupArticle model for storing generated articles (V-18)"""
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func, Index
 
 from app.database import Base
 
@@ -27,3 +27,9 @@ class GroupArticle(Base):
     # Timestamps
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+# Keyset pagination per group: ORDER BY created_at DESC, id DESC
+Index('idx_group_articles_group_created_id', GroupArticle.group_id, GroupArticle.created_at, GroupArticle.id)
+# Latest article of a group: WHERE group_id = ? ORDER BY updated_at DESC
+Index('idx_group_articles_group_updated', GroupArticle.group_id, GroupArticle.updated_at)
@@ -0,0 +1,26 @@
+"""GroupEmbedding model for vector-based topic grouping"""
+from sqlalchemy import Column, Integer, String, LargeBinary, ForeignKey, DateTime, func, Index
+
+from app.database import Base
+
+
+class GroupEmbedding(Base):
+    """Embedding of a group's representative title + summary"""
+    __tablename__ = "group_embeddings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    group_id = Column(Integer, ForeignKey("groups.id"), nullable=False, index=True)
+
+    # Denormalized so a category's vectors load with a single indexed query
+    category = Column(String, nullable=False)
+
+    # Embedder that produced the vector (vectors from different embedders are not comparable)
+    embedder = Column(String, nullable=False)
+    dim = Column(Integer, nullable=False)
+    vector = Column(LargeBinary, nullable=False)  # float32, L2-normalized
+
+    created_at = Column(DateTime, server_default=func.now())
+
+
+Index('idx_group_embeddings_embedder_category', GroupEmbedding.embedder, GroupEmbedding.category)
+Index('idx_group_embeddings_group_embedder', GroupEmbedding.group_id, GroupEmbedding.embedder, unique=True)
@@ -0,0 +1,52 @@
+"""IngestionRun models for persisted ingestion run history"""
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, func, Index
+
+from app.database import Base
+
+
+class IngestionRun(Base):
+    """One execution of ingest_posts_job (scheduled or manual)"""
+    __tablename__ = "ingestion_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    trigger_source = Column(String, nullable=False)  # scheduled | manual
+    status = Column(String, nullable=False, default='running')  # running | completed | failed
+    started_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+    finished_at = Column(DateTime, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+
+    # Counts (same meaning as the stats dict returned by ingest_posts_job)
+    lists_processed = Column(Integer, nullable=False, default=0)
+    posts_fetched = Column(Integer, nullable=False, default=0)
+    new_posts_added = Column(Integer, nullable=False, default=0)
+    duplicates_skipped = Column(Integer, nullable=False, default=0)
+    prefilter_skipped = Column(Integer, nullable=False, default=0)
+    low_worthiness_skipped = Column(Integer, nullable=False, default=0)
+    api_errors = Column(Integer, nullable=False, default=0)
+    enrichment_parse_errors = Column(Integer, nullable=False, default=0)
+
+    # JSON: {stage: {count, total_seconds, p50_seconds, p95_seconds, max_seconds}}
+    stage_timings = Column(Text, nullable=True)
+    error_message = Column(Text, nullable=True)
+
+
+class IngestionRunList(Base):
+    """Per-list results of one ingestion run"""
+    __tablename__ = "ingestion_run_lists"
+
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey("ingestion_runs.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    list_id = Column(String, nullable=False)
+    list_name = Column(String, nullable=True)
+    pages = Column(Integer, nullable=False, default=0)
+    posts_fetched = Column(Integer, nullable=False, default=0)
+    posts_added = Column(Integer, nullable=False, default=0)
+    fetch_seconds = Column(Float, nullable=False, default=0.0)
+    caught_up = Column(Boolean, nullable=True)
+    lag_seconds = Column(Integer, nullable=True)
+    error = Column(String, nullable=True)
+
+
+Index('idx_ingestion_run_lists_list_run', IngestionRunList.list_id, IngestionRunList.run_id)
@@ -16,6 +16,12 @@ class ListMetadata(Base):
     # Last tweet ID fetched from this list (for since_id parameter)
     last_tweet_id = Column(String, nullable=True)
 
+    # Catch-up cursor: older tweets left unfetched when a run hit its page budget
+    catchup_token = Column(String, nullable=True)  # X pagination_token to resume from
+    catchup_until_id = Column(String, nullable=True)  # Stop paging once this tweet ID is reached
+    lag_seconds = Column(Integer, nullable=True)  # Time span still unfetched (0 = caught up)
+    last_fetched_at = Column(DateTime, nullable=True)
+
     # V-8: List management columns
     enabled = Column(Boolean, nullable=False, default=True)
     list_name = Column(String, nullable=True)  # User-friendly name
@@ -0,0 +1,26 @@
+"""LLMCacheEntry model for content-addressed LLM response caching"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, func
+
+from app.database import Base
+
+
+class LLMCacheEntry(Base):
+    """Cached chat completion keyed by a hash of model, prompt, parameters and input"""
+    __tablename__ = "llm_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), unique=True, nullable=False, index=True)  # sha256 hex
+
+    # Metadata (for stats and debugging, not part of the key)
+    operation = Column(String, nullable=False, index=True)  # e.g. 'categorize_post'
+    model = Column(String, nullable=True)
+
+    # Serialized ChatCompletion (JSON)
+    response = Column(Text, nullable=False)
+
+    # TTL + LRU bookkeeping
+    expires_at = Column(DateTime, nullable=False, index=True)
+    last_accessed_at = Column(DateTime, nullable=False, index=True)
+    hit_count = Column(Integer, default=0, nullable=False)
+
+    created_at = Column(DateTime, server_default=func.now())
@@ -0,0 +1,20 @@
+"""LogHourlyRollup model: per-hour log counts for /api/logs/stats"""
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.database import Base
+
+
+class LogHourlyRollup(Base):
+    """Number of system_logs rows per hour x level x category x logger
+
+    Maintained incrementally by the log writer in the same transaction as the
+    rows it counts (see app.services.log_rollups).
+    """
+    __tablename__ = "log_hourly_rollups"
+
+    hour = Column(DateTime, primary_key=True)  # UTC, truncated to the hour
+    level = Column(String, primary_key=True)
+    category = Column(String, primary_key=True)  # '' for logs without a category
+    logger_name = Column(String, primary_key=True)
+
+    count = Column(Integer, nullable=False, default=0)
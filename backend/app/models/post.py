@@ -1,5 +1,5 @@
 """Post model (X/Twitter posts from curated lists)"""
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, func, Index
 
 from app.database import Base
 
@@ -49,3 +49,9 @@ class Post(Base):
     def is_article(self) -> bool:
         """Derived boolean: true when content_type is article or quote_article (V-8)"""
         return self.content_type in ('article', 'quote_article')
+
+
+# Keyset pagination of the post lists: ORDER BY ingested_at DESC, id DESC
+Index('idx_posts_ingested_at_id', Post.ingested_at, Post.id)
+# Posts of a group: WHERE group_id = ? ORDER BY created_at DESC
+Index('idx_posts_group_created', Post.group_id, Post.created_at)
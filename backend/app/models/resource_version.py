@@ -0,0 +1,17 @@
+"""ResourceVersion model: change counters behind ETag handling"""
+from sqlalchemy import Column, BigInteger, String, DateTime, func
+
+from app.database import Base
+
+
+class ResourceVersion(Base):
+    """Monotonic version of a cached API resource (e.g. 'groups' for the board)
+
+    Bumped in the same transaction as every write that changes the resource
+    (see app.services.resource_versions).
+    """
+    __tablename__ = "resource_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -36,3 +36,5 @@ class SystemLog(Base):
 # Composite indexes for common queries
 Index('idx_timestamp_level', SystemLog.timestamp, SystemLog.level)
 Index('idx_category_timestamp', SystemLog.category, SystemLog.timestamp)
+# Keyset pagination: ORDER BY timestamp DESC, id DESC
+Index('idx_timestamp_id', SystemLog.timestamp, SystemLog.id)
@@ -0,0 +1,177 @@
+"""Connection pool and statement metrics for the SQLAlchemy engines (see database.create_db_engine)"""
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+SLOW_STATEMENT_SECONDS = 0.5
+
+
+class PoolMonitor:
+    """Counters for one engine: checkout waits, overflow, timeouts and statement timings"""
+
+    WINDOW = 2000  # recent samples kept for percentiles
+    SLOW_KEPT = 20
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connections_opened = 0
+        self.overflow_checkouts = 0
+        self.peak_overflow = 0
+        self.invalidations = 0
+        self.statements = 0
+        self.statement_errors = 0
+        self.statement_timeouts = 0
+        self.statement_seconds = 0.0
+        self._waits: deque = deque(maxlen=self.WINDOW)
+        self._durations: deque = deque(maxlen=self.WINDOW)
+        self._slow: deque = deque(maxlen=self.SLOW_KEPT)
+
+    def record_checkout(self, seconds: float):
+        self.checkouts += 1
+        self._waits.append(seconds)
+
+    def record_statement(self, statement: str, seconds: float):
+        self.statements += 1
+        self.statement_seconds += seconds
+        self._durations.append(seconds)
+        if seconds >= SLOW_STATEMENT_SECONDS:
+            self._slow.append({
+                'duration_ms': round(seconds * 1000, 1),
+                'statement': ' '.join(statement.split())[:500],
+                'at': datetime.utcnow().isoformat()
+            })
+
+    def stats(self) -> dict:
+        from app.services.ingestion_metrics import percentile
+
+        waits = sorted(self._waits)
+        durations = sorted(self._durations)
+
+        def ms(value):
+            return round(value * 1000, 2) if value is not None else None
+
+        pool = self.pool
+        return {
+            "pool": {
+                "class": type(pool).__name__ if pool is not None else None,
+                "size": pool.size() if hasattr(pool, 'size') else None,
+                "checked_out": pool.checkedout() if hasattr(pool, 'checkedout') else None,
+                "checked_in": pool.checkedin() if hasattr(pool, 'checkedin') else None,
+                # Negative while the pool has not yet opened pool_size connections
+                "overflow": pool.overflow() if hasattr(pool, 'overflow') else None
+            },
+            "checkouts": self.checkouts,
+            "checkout_wait_ms": {
+                "p50": ms(percentile(waits, 50)),
+                "p95": ms(percentile(waits, 95)),
+                "max": ms(waits[-1]) if waits else None
+            },
+            "checkout_timeouts": self.checkout_timeouts,
+            "connections_opened": self.connections_opened,
+            "overflow_checkouts": self.overflow_checkouts,
+            "peak_overflow": self.peak_overflow,
+            "invalidations": self.invalidations,
+            "statements": {
+                "count": self.statements,
+                "total_seconds": round(self.statement_seconds, 3),
+                "p50_ms": ms(percentile(durations, 50)),
+                "p95_ms": ms(percentile(durations, 95)),
+                "errors": self.statement_errors,
+                "timeouts": self.statement_timeouts,
+                "slow_recent": list(reversed(self._slow))
+            }
+        }
+
+
+# Engine name ("app", "async", "logging") -> monitor
+monitors: Dict[str, PoolMonitor] = {}
+
+
+class _TimedCheckout:
+    """Pool mixin timing connect() (queue wait + pre-ping) per checkout
+
+    The monitor is looked up by pool logging name, which survives
+    pool.recreate() on engine.dispose().
+    """
+
+    # Log under SQLAlchemy's namespace (WARN by default) like the stock pools
+    _sqla_logger_namespace = "sqlalchemy.pool.impl"
+
+    def connect(self):
+        monitor = monitors.get(self._orig_logging_name)
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            if monitor is not None:
+                monitor.checkout_timeouts += 1
+            raise
+        finally:
+            if monitor is not None:
+                monitor.pool = self
+                monitor.record_checkout(time.perf_counter() - started)
+                overflow = self.overflow()
+                if overflow > 0:
+                    # Served while more than pool_size connections are open
+                    monitor.overflow_checkouts += 1
+                    monitor.peak_overflow = max(monitor.peak_overflow, overflow)
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def _is_statement_timeout(error: Optional[BaseException]) -> bool:
+    # Postgres SQLSTATE 57014 (query_canceled), raised when statement_timeout fires
+    return getattr(error, 'pgcode', None) == '57014' or getattr(error, 'sqlstate', None) == '57014'
+
+
+def instrument_engine(sync_engine, name: str) -> PoolMonitor:
+    """Attach pool/statement listeners to an Engine (for AsyncEngine pass .sync_engine)"""
+    monitor = monitors.setdefault(name, PoolMonitor(name))
+    monitor.pool = sync_engine.pool
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        monitor.connections_opened += 1
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        monitor.invalidations += 1
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('statement_started', []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get('statement_started')
+        if started:
+            monitor.record_statement(statement, time.perf_counter() - started.pop())
+
+    @event.listens_for(sync_engine, "handle_error")
+    def on_error(context):
+        monitor.statement_errors += 1
+        started = context.connection.info.get('statement_started') if context.connection is not None else None
+        if started:
+            started.pop()
+        original = context.original_exception
+        if _is_statement_timeout(original) or _is_statement_timeout(getattr(original, '__cause__', None)):
+            monitor.statement_timeouts += 1
+
+    return monitor
+
+
+def get_pool_stats() -> dict:
+    return {name: monitor.stats() for name, monitor in monitors.items()}
@@ -0,0 +1,136 @@
+"""Write-time group aggregates: post_count, max_worthiness and the representative source post
+
+The representative post of a group is its highest-worthiness post (NULL
+scores count as 0), the most recently created one on ties - the ordering the
+board used to compute per request with row_number() over all posts.
+Ingestion folds each stored post into its group (fold_post); the repair job
+recomputes every group from posts and fixes any drift.
+"""
+from datetime import datetime, timezone
+from typing import Optional
+import logging
+
+logger = logging.getLogger('klaus_news.group_aggregates')
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """X timestamps are tz-aware, stored ones are naive UTC; compare them as naive UTC"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def fold_post(db, group, post):
+    """Update group's aggregates for a newly stored post (db: AsyncSession; post flushed, caller holds db_lock)"""
+    from app.models.post import Post
+
+    worthiness = post.worthiness_score
+    previous_max = group.max_worthiness
+    if worthiness is not None and (previous_max is None or worthiness > previous_max):
+        group.max_worthiness = worthiness
+
+    # The representative's (coalesced) score is the previous max
+    replace = group.representative_post_id is None or (worthiness or 0) > (previous_max or 0)
+    if not replace and (worthiness or 0) == (previous_max or 0):
+        current = await db.get(Post, group.representative_post_id)
+        replace = current is None or _naive_utc(post.created_at) > _naive_utc(current.created_at)
+    if replace:
+        group.representative_post_id = post.id
+        group.source_post_id = post.post_id
+        group.source_author = post.author
+
+
+def _computed_aggregates_query(only_missing: bool = False):
+    """Per group: post count, max worthiness and the representative post, computed from posts"""
+    from sqlalchemy import func, select
+    from app.models.group import Group
+    from app.models.post import Post
+
+    posts = select(Post).where(Post.group_id.isnot(None))
+    if only_missing:
+        posts = posts.where(Post.group_id.in_(
+            select(Group.id).where(Group.representative_post_id.is_(None))
+        ))
+    posts = posts.subquery()
+
+    ranked = (
+        select(
+            posts.c.group_id.label('group_id'),
+            posts.c.id.label('post_id'),
+            posts.c.post_id.label('source_post_id'),
+            posts.c.author.label('source_author'),
+            func.count().over(partition_by=posts.c.group_id).label('post_count'),
+            func.max(posts.c.worthiness_score).over(partition_by=posts.c.group_id).label('max_worthiness'),
+            func.row_number().over(
+                partition_by=posts.c.group_id,
+                order_by=[func.coalesce(posts.c.worthiness_score, 0).desc(), posts.c.created_at.desc()]
+            ).label('rn')
+        )
+        .subquery()
+    )
+    query = (
+        select(
+            Group.id,
+            Group.post_count,
+            Group.max_worthiness,
+            Group.representative_post_id,
+            Group.source_post_id,
+            Group.source_author,
+            ranked.c.post_count,
+            ranked.c.max_worthiness,
+            ranked.c.post_id,
+            ranked.c.source_post_id,
+            ranked.c.source_author,
+        )
+        .outerjoin(ranked, (ranked.c.group_id == Group.id) & (ranked.c.rn == 1))
+    )
+    if only_missing:
+        query = query.where(Group.representative_post_id.is_(None))
+    return query
+
+
+def repair_group_aggregates(db, only_missing: bool = False) -> int:
+    """Recompute aggregates from posts and fix groups that drifted (db: Session; commits)
+
+    only_missing limits the work to groups without a representative yet
+    (startup backfill after the columns were added). Returns groups fixed.
+    """
+    from sqlalchemy import update
+    from app.models.group import Group
+    from app.services import resource_versions
+
+    fixes = []
+    for row in db.execute(_computed_aggregates_query(only_missing)).all():
+        (group_id, stored_count, stored_max, stored_rep, stored_source_id, stored_author,
+         post_count, max_worthiness, rep_id, source_post_id, source_author) = row
+        # Groups without posts have no ranked row
+        computed = (post_count or 0, max_worthiness, rep_id, source_post_id, source_author)
+        if computed != (stored_count, stored_max, stored_rep, stored_source_id, stored_author):
+            fixes.append({
+                'id': group_id,
+                'post_count': post_count or 0,
+                'max_worthiness': max_worthiness,
+                'representative_post_id': rep_id,
+                'source_post_id': source_post_id,
+                'source_author': source_author
+            })
+
+    if fixes:
+        # Bulk UPDATE by primary key (executemany)
+        db.execute(update(Group), fixes)
+        resource_versions.bump(db, resource_versions.GROUPS)
+    db.commit()
+    return len(fixes)
+
+
+def backfill_group_aggregates():
+    """Startup: fill aggregates for groups that have none yet (no-op once populated)"""
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        fixed = repair_group_aggregates(db, only_missing=True)
+        if fixed:
+            logger.info("Backfilled group aggregates", extra={'groups_updated': fixed})
+    finally:
+        db.close()
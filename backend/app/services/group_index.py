@@ -0,0 +1,217 @@
+"""Embedding-based vector index for topic grouping
+
+Replaces the O(groups) LLM title comparison loop with one vectorized cosine
+similarity lookup per post. Group vectors are persisted in group_embeddings
+and loaded into an in-process NumPy matrix per category.
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import contextlib
+import hashlib
+import logging
+import re
+
+import numpy as np
+
+
+logger = logging.getLogger('klaus_news.group_index')
+
+
+class OpenAIEmbedder:
+    """Embedder backed by the OpenAI embeddings API"""
+
+    def __init__(self, model: str = "text-embedding-3-small"):
+        self.model = model
+        self.name = f"openai:{model}"
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        from app.services.openai_client import openai_pool
+
+        client = openai_pool.get_client()
+        response = await client.embeddings.create(model=self.model, input=texts)
+        return np.array([item.embedding for item in response.data], dtype=np.float32)
+
+
+class HashingEmbedder:
+    """Local feature-hashing embedder (word unigrams + bigrams, no network)
+
+    Lower quality than a learned model but deterministic and free, so grouping
+    can run and be benchmarked offline.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing:{dim}"
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        return np.vstack([self._embed_one(text) for text in texts]) if texts else np.zeros((0, self.dim), dtype=np.float32)
+
+    def _embed_one(self, text: str) -> np.ndarray:
+        tokens = re.findall(r"[a-z0-9]+", text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature in features:
+            digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'little')
+            vector[digest % self.dim] += -1.0 if digest >> 63 else 1.0
+        return vector
+
+
+# Registry of available embedders (selected via the grouping_embedder setting)
+EMBEDDERS: Dict[str, Callable[[], object]] = {
+    "openai": OpenAIEmbedder,
+    "hashing": HashingEmbedder,
+}
+
+
+def register_embedder(name: str, factory: Callable[[], object]):
+    """Register a custom embedder factory under a setting-selectable name"""
+    EMBEDDERS[name] = factory
+
+
+def get_embedder(name: str):
+    """Instantiate the embedder registered under name (falls back to openai)"""
+    factory = EMBEDDERS.get(name)
+    if factory is None:
+        logger.warning("Unknown embedder, falling back to openai", extra={'embedder': name})
+        factory = EMBEDDERS["openai"]
+    return factory()
+
+
+def group_text(title: Optional[str], summary: Optional[str]) -> str:
+    """Text embedded for a group or a candidate post"""
+    return f"{title or ''}\n{summary or ''}".strip()
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+@dataclass
+class CategoryIndex:
+    """Normalized group vectors for one category"""
+    group_ids: List[int] = field(default_factory=list)
+    matrix: Optional[np.ndarray] = None
+
+    def add(self, group_id: int, vector: np.ndarray):
+        self.group_ids.append(group_id)
+        row = vector.reshape(1, -1)
+        self.matrix = row if self.matrix is None else np.vstack([self.matrix, row])
+
+    def top_k(self, vector: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        if self.matrix is None or not self.group_ids:
+            return []
+        scores = self.matrix @ vector
+        k = min(k, len(self.group_ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.group_ids[i], float(scores[i])) for i in top]
+
+
+class GroupVectorIndex:
+    """Process-wide per-category cosine similarity index over group embeddings"""
+
+    BACKFILL_BATCH_SIZE = 256
+
+    def __init__(self):
+        self.embedder = None
+        self._categories: Dict[str, CategoryIndex] = {}
+
+    def reset(self, embedder):
+        """Switch embedder and drop cached categories (reloaded lazily from DB)"""
+        self.embedder = embedder
+        self._categories.clear()
+
+    async def embed(self, title: Optional[str], summary: Optional[str]) -> np.ndarray:
+        """Embed a single title + summary into a normalized vector"""
+        vectors = await self.embedder.embed([group_text(title, summary)])
+        return _normalize(vectors)[0]
+
+    async def load_category(self, db, category: str, db_lock: Optional[asyncio.Lock] = None) -> CategoryIndex:
+        """Load a category's vectors, embedding any groups that have none yet (db: AsyncSession)
+
+        db_lock, if given, guards the session: it is held for the reads and
+        the writes but released while the backfill calls the embedder, so
+        other tasks sharing the session are not stuck behind network calls.
+        Callers serialize loads of the same category (ingestion's category lock).
+        """
+        if category in self._categories:
+            return self._categories[category]
+
+        from sqlalchemy import select
+        from app.models.group import Group
+        from app.models.group_embedding import GroupEmbedding
+
+        db_lock = db_lock or contextlib.nullcontext()
+        index = CategoryIndex()
+        async with db_lock:
+            rows = (await db.execute(
+                select(GroupEmbedding.group_id, GroupEmbedding.vector)
+                .where(GroupEmbedding.embedder == self.embedder.name)
+                .where(GroupEmbedding.category == category)
+            )).all()
+            groups = (await db.execute(
+                select(Group.id, Group.representative_title, Group.representative_summary)
+                .where(Group.category == category)
+            )).all()
+        if rows:
+            index.group_ids = [group_id for group_id, _ in rows]
+            index.matrix = np.vstack([np.frombuffer(vector, dtype=np.float32) for _, vector in rows])
+
+        # Backfill groups created before embeddings existed (or under another embedder)
+        embedded_ids = set(index.group_ids)
+        missing = [row for row in groups if row.id not in embedded_ids]
+        # Embed every batch before persisting so a failed batch leaves nothing half-added
+        backfilled = []
+        for start in range(0, len(missing), self.BACKFILL_BATCH_SIZE):
+            batch = missing[start:start + self.BACKFILL_BATCH_SIZE]
+            vectors = _normalize(await self.embedder.embed([
+                group_text(row.representative_title, row.representative_summary) for row in batch
+            ]))
+            backfilled.extend(zip(batch, vectors))
+        if backfilled:
+            async with db_lock:
+                for row, vector in backfilled:
+                    self._persist(db, category, row.id, vector)
+                await db.flush()
+            index.group_ids.extend(row.id for row, _ in backfilled)
+            new_rows = np.vstack([vector for _, vector in backfilled])
+            index.matrix = new_rows if index.matrix is None else np.vstack([index.matrix, new_rows])
+            logger.info("Backfilled group embeddings", extra={
+                'category': category,
+                'embedder': self.embedder.name,
+                'backfilled': len(backfilled)
+            })
+
+        self._categories[category] = index
+        return index
+
+    async def search(
+        self, db, category: str, vector: np.ndarray, k: int = 3, db_lock: Optional[asyncio.Lock] = None
+    ) -> List[Tuple[int, float]]:
+        """Return up to k (group_id, cosine similarity) pairs, best first (db_lock: see load_category)"""
+        index = await self.load_category(db, category, db_lock)
+        return index.top_k(vector, k)
+
+    def add(self, db, category: str, group_id: int, vector: np.ndarray):
+        """Persist and index the vector of a newly created group"""
+        self._persist(db, category, group_id, vector)
+        if category in self._categories:
+            self._categories[category].add(group_id, vector)
+
+    def _persist(self, db, category: str, group_id: int, vector: np.ndarray):
+        from app.models.group_embedding import GroupEmbedding
+
+        db.add(GroupEmbedding(
+            group_id=group_id,
+            category=category,
+            embedder=self.embedder.name,
+            dim=int(vector.shape[0]),
+            vector=vector.astype(np.float32).tobytes()
+        ))
+
+
+# Global instance
+group_index = GroupVectorIndex()
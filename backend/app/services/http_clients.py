@@ -0,0 +1,160 @@
+"""App-scoped keep-alive HTTP clients, one per upstream (X API, Teams, OpenAI)"""
+from datetime import datetime
+from typing import Optional
+import logging
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger('klaus_news.http_clients')
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class ManagedHTTPClient:
+    """Lazily created httpx.AsyncClient with a keep-alive pool and reuse counters
+
+    Started on app startup and closed on shutdown (see main.py). get_client()
+    also creates the client on first use so jobs and scripts work without startup.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_connections: int,
+        max_keepalive_connections: int,
+        timeout: httpx.Timeout,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False
+    ):
+        self.name = name
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = timeout
+        self.http2 = http2 and _http2_available()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._created_at: Optional[datetime] = None
+        self._requests = 0
+        self._connections_opened = 0
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self.start()
+        return self._client
+
+    def start(self):
+        """Create the shared client (no-op if already running)"""
+        if self._client is not None and not self._client.is_closed:
+            return
+        self._client = httpx.AsyncClient(
+            limits=self.limits,
+            timeout=self.timeout,
+            http2=self.http2,
+            event_hooks={'request': [self._on_request]}
+        )
+        self._created_at = datetime.utcnow()
+        logger.info("Shared HTTP client created", extra={
+            'upstream': self.name,
+            'http2': self.http2,
+            'max_connections': self.limits.max_connections
+        })
+
+    async def close(self):
+        """Close the client and its pooled connections"""
+        if self._client is None:
+            return
+        client, self._client = self._client, None
+        await client.aclose()
+        logger.info("Shared HTTP client closed", extra=self.stats())
+
+    async def _on_request(self, request):
+        """httpx request hook: count requests and trace new TCP connections"""
+        self._requests += 1
+        request.extensions["trace"] = self._on_trace
+
+    async def _on_trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self._connections_opened += 1
+
+    def stats(self) -> dict:
+        """Pool statistics (connections_opened < requests means connections are reused)"""
+        pooled = []
+        if self._client is not None:
+            transport = getattr(self._client, '_transport', None)
+            pooled = list(getattr(getattr(transport, '_pool', None), 'connections', []))
+        reused = max(0, self._requests - self._connections_opened)
+        return {
+            "upstream": self.name,
+            "active": self._client is not None,
+            "http2": self.http2,
+            "created_at": self._created_at.isoformat() if self._created_at else None,
+            "requests": self._requests,
+            "connections_opened": self._connections_opened,
+            "requests_on_reused_connections": reused,
+            "reuse_ratio": round(reused / self._requests, 3) if self._requests else None,
+            "pooled_connections": len(pooled),
+            "idle_connections": sum(1 for c in pooled if c.is_idle()),
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections
+        }
+
+
+# X API: one request per list per run, fetched concurrently (see fetch_concurrency)
+x_api_http = ManagedHTTPClient(
+    'x_api',
+    max_connections=settings.x_api_max_connections,
+    max_keepalive_connections=settings.x_api_max_connections,
+    timeout=httpx.Timeout(settings.x_api_timeout_seconds, connect=5.0),
+    http2=settings.upstream_http2
+)
+
+# Teams webhooks: low volume, mostly one channel host
+teams_http = ManagedHTTPClient(
+    'teams',
+    max_connections=5,
+    max_keepalive_connections=2,
+    timeout=httpx.Timeout(settings.teams_timeout_seconds, connect=5.0),
+    http2=settings.upstream_http2
+)
+
+# OpenAI: wrapped by openai_client.OpenAIConnectionPool
+# Long read timeout: research modes can run for minutes
+openai_http = ManagedHTTPClient(
+    'openai',
+    max_connections=settings.openai_max_connections,
+    max_keepalive_connections=settings.openai_max_keepalive_connections,
+    keepalive_expiry=settings.openai_keepalive_expiry,
+    timeout=httpx.Timeout(settings.openai_timeout_seconds, connect=5.0),
+    http2=settings.upstream_http2
+)
+
+MANAGED_CLIENTS = [x_api_http, teams_http, openai_http]
+
+
+def start_http_clients():
+    """Create all shared upstream clients (app startup)"""
+    for managed in MANAGED_CLIENTS:
+        managed.start()
+
+
+async def close_http_clients():
+    """Close all shared upstream clients (app shutdown)"""
+    for managed in MANAGED_CLIENTS:
+        await managed.close()
+
+
+def get_http_client_stats() -> dict:
+    """Per-upstream pool statistics keyed by upstream name"""
+    return {managed.name: managed.stats() for managed in MANAGED_CLIENTS}
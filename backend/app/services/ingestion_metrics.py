@@ -0,0 +1,245 @@
+"""Per-stage timing and persisted history for ingestion runs (ingestion_runs table)"""
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import json
+import logging
+import math
+import time
+
+logger = logging.getLogger('klaus_news.ingestion_metrics')
+
+STAGES = ('fetching', 'categorizing', 'generating', 'scoring', 'embedding', 'grouping', 'storing')
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+class StageTimer:
+    """Collects wall-clock samples per ingestion stage
+
+    Stages overlap across concurrently processed posts, so totals are the sum
+    of per-call durations, not a breakdown of the run's wall-clock time.
+    """
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.setdefault(name, []).append(time.perf_counter() - start)
+
+    def summary(self) -> dict:
+        result = {}
+        for stage, values in self.samples.items():
+            ordered = sorted(values)
+            result[stage] = {
+                'count': len(ordered),
+                'total_seconds': round(sum(ordered), 4),
+                'p50_seconds': round(percentile(ordered, 50), 4) if ordered else None,
+                'p95_seconds': round(percentile(ordered, 95), 4) if ordered else None,
+                'max_seconds': round(ordered[-1], 4) if ordered else None
+            }
+        return result
+
+
+class IngestionRunRecorder:
+    """Writes ingestion_runs / ingestion_run_lists rows in a session of its own
+
+    Kept separate from the job's session so a run that fails (and rolls back)
+    is still recorded.
+    """
+
+    async def start(self, trigger_source: str) -> Optional[int]:
+        from app.database import AsyncSessionLocal
+        from app.models.ingestion_run import IngestionRun
+
+        db = AsyncSessionLocal()
+        try:
+            run = IngestionRun(trigger_source=trigger_source, status='running', started_at=datetime.utcnow())
+            db.add(run)
+            await db.commit()
+            return run.id
+        except Exception as e:
+            await db.rollback()
+            logger.warning("Failed to record ingestion run start", extra={'error_message': str(e)})
+            return None
+        finally:
+            await db.close()
+
+    async def finish(
+        self,
+        run_id: Optional[int],
+        stats: dict,
+        timer: StageTimer,
+        status: str,
+        error_message: Optional[str] = None
+    ):
+        if run_id is None:
+            return
+
+        from app.database import AsyncSessionLocal
+        from app.models.ingestion_run import IngestionRun, IngestionRunList
+
+        db = AsyncSessionLocal()
+        try:
+            run = await db.get(IngestionRun, run_id)
+            if run is None:
+                return
+            run.status = status
+            run.finished_at = datetime.utcnow()
+            run.duration_seconds = (run.finished_at - run.started_at).total_seconds()
+            for counter in ('lists_processed', 'posts_fetched', 'new_posts_added', 'duplicates_skipped',
+                            'low_worthiness_skipped', 'api_errors', 'enrichment_parse_errors'):
+                setattr(run, counter, stats.get(counter, 0))
+            run.prefilter_skipped = sum(stats.get('prefilter_skipped', {}).values())
+            run.stage_timings = json.dumps(timer.summary())
+            run.error_message = error_message[:2000] if error_message else None
+
+            for list_id, report in stats.get('list_lag', {}).items():
+                db.add(IngestionRunList(
+                    run_id=run_id,
+                    list_id=list_id,
+                    list_name=report.get('list_name'),
+                    pages=report.get('pages', 0),
+                    posts_fetched=report.get('posts_fetched', 0),
+                    posts_added=report.get('posts_added', 0),
+                    fetch_seconds=round(report.get('fetch_seconds', 0.0), 4),
+                    caught_up=report.get('caught_up'),
+                    lag_seconds=report.get('lag_seconds'),
+                    error=report.get('error')
+                ))
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.warning("Failed to record ingestion run result", extra={'run_id': run_id, 'error_message': str(e)})
+        finally:
+            await db.close()
+
+    def close_interrupted(self) -> int:
+        """Startup: mark runs left 'running' by a restart or crash as failed
+
+        No run can be in progress while the app starts, so any such row was
+        cut off before finish() ran. Returns the number of rows closed.
+        """
+        from sqlalchemy import update
+        from app.database import SessionLocal
+        from app.models.ingestion_run import IngestionRun
+
+        db = SessionLocal()
+        try:
+            closed = db.execute(
+                update(IngestionRun)
+                .where(IngestionRun.status == 'running')
+                .values(status='failed', error_message='interrupted')
+            ).rowcount
+            db.commit()
+            if closed:
+                logger.warning("Marked interrupted ingestion runs as failed", extra={'runs': closed})
+            return closed
+        except Exception as e:
+            db.rollback()
+            logger.warning("Failed to close interrupted ingestion runs", extra={'error_message': str(e)})
+            return 0
+        finally:
+            db.close()
+
+
+def serialize_run(run, lists=None) -> dict:
+    """API representation of an IngestionRun (lists: optional IngestionRunList rows)"""
+    data = {
+        "id": run.id,
+        "trigger_source": run.trigger_source,
+        "status": run.status,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+        "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+        "duration_seconds": run.duration_seconds,
+        "lists_processed": run.lists_processed,
+        "posts_fetched": run.posts_fetched,
+        "new_posts_added": run.new_posts_added,
+        "duplicates_skipped": run.duplicates_skipped,
+        "prefilter_skipped": run.prefilter_skipped,
+        "low_worthiness_skipped": run.low_worthiness_skipped,
+        "api_errors": run.api_errors,
+        "enrichment_parse_errors": run.enrichment_parse_errors,
+        "posts_per_minute": round(run.new_posts_added / run.duration_seconds * 60, 2) if run.duration_seconds else None,
+        "stage_timings": json.loads(run.stage_timings) if run.stage_timings else {},
+        "error_message": run.error_message
+    }
+    if lists is not None:
+        data["lists"] = [{
+            "list_id": row.list_id,
+            "list_name": row.list_name,
+            "pages": row.pages,
+            "posts_fetched": row.posts_fetched,
+            "posts_added": row.posts_added,
+            "fetch_seconds": row.fetch_seconds,
+            "caught_up": row.caught_up,
+            "lag_seconds": row.lag_seconds,
+            "error": row.error
+        } for row in lists]
+    return data
+
+
+def get_run_trends(db, days: int = 14) -> dict:
+    """Daily aggregates of completed/failed runs for spotting throughput regressions"""
+    from sqlalchemy import select
+    from app.models.ingestion_run import IngestionRun
+
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    runs = db.execute(
+        select(IngestionRun)
+        .where(IngestionRun.started_at >= cutoff)
+        .where(IngestionRun.status != 'running')
+        .order_by(IngestionRun.started_at)
+    ).scalars().all()
+
+    daily: Dict[str, dict] = {}
+    for run in runs:
+        day = daily.setdefault(run.started_at.date().isoformat(), {
+            'runs': 0, 'failed_runs': 0, 'posts_fetched': 0, 'new_posts_added': 0,
+            'durations': [], 'stage_p95': {stage: [] for stage in STAGES}
+        })
+        day['runs'] += 1
+        day['failed_runs'] += 1 if run.status == 'failed' else 0
+        day['posts_fetched'] += run.posts_fetched or 0
+        day['new_posts_added'] += run.new_posts_added or 0
+        if run.duration_seconds:
+            day['durations'].append(run.duration_seconds)
+        for stage, timing in (json.loads(run.stage_timings) if run.stage_timings else {}).items():
+            if timing.get('p95_seconds') is not None:
+                day['stage_p95'].setdefault(stage, []).append(timing['p95_seconds'])
+
+    series = []
+    for date, day in daily.items():
+        durations = sorted(day['durations'])
+        total_duration = sum(durations)
+        series.append({
+            "date": date,
+            "runs": day['runs'],
+            "failed_runs": day['failed_runs'],
+            "posts_fetched": day['posts_fetched'],
+            "new_posts_added": day['new_posts_added'],
+            "avg_duration_seconds": round(total_duration / len(durations), 2) if durations else None,
+            "p95_duration_seconds": percentile(durations, 95),
+            "posts_per_minute": round(day['new_posts_added'] / total_duration * 60, 2) if total_duration else None,
+            # Median across the day's runs of each run's p95 stage latency
+            "stage_p95_seconds": {
+                stage: percentile(sorted(values), 50) for stage, values in day['stage_p95'].items() if values
+            }
+        })
+
+    return {"days": days, "total_runs": len(runs), "daily": series}
+
+
+# Global instance
+ingestion_run_recorder = IngestionRunRecorder()
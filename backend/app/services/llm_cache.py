@@ -0,0 +1,284 @@
+"""Content-addressed LLM response cache (in-memory LRU front tier + llm_cache table)
+
+Keys are a sha256 over the full chat.completions.create kwargs (model, messages
+incl. prompt text and input, and all parameters), so any prompt or parameter
+change is a new key. Entries expire after llm_cache_ttl_hours; the table is
+bounded to llm_cache_max_entries by evicting least recently accessed rows.
+Hits served from memory are written back to the table in batches, so its
+LRU order also reflects keys that never leave the memory tier.
+"""
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger('klaus_news.llm_cache')
+
+
+class LLMResponseCache:
+    """Two-tier cache for serialized chat completions"""
+
+    MEMORY_MAX_ENTRIES = 2048
+    PRUNE_EVERY_WRITES = 100
+    # Memory hits are written back to the table at most this often (or once this many keys are pending)
+    TOUCH_FLUSH_SECONDS = 60
+    TOUCH_FLUSH_ENTRIES = 500
+
+    def __init__(self):
+        self._memory: "OrderedDict[str, tuple[str, datetime]]" = OrderedDict()
+        self._writes_since_prune = 0
+        self._counters: dict[str, dict[str, int]] = {}
+        self._evicted = 0
+        # cache_key -> (last memory hit, hits since the last write-back)
+        self._touched: dict[str, tuple[datetime, int]] = {}
+        self._touched_since = datetime.utcnow()
+
+    # --- configuration (SettingsService caches values for 60s) ---
+
+    async def _setting(self, key: str, default):
+        """Setting via the shared settings cache; the async session only connects on a cache miss"""
+        from app.database import AsyncSessionLocal
+        from app.services.settings_service import SettingsService
+        try:
+            async with AsyncSessionLocal() as db:
+                return await SettingsService.get_async(db, key, default)
+        except Exception:
+            return default
+
+    async def is_enabled(self, operation: str) -> bool:
+        """Cache is on globally and not bypassed for this operation"""
+        if not await self._setting('llm_cache_enabled', True):
+            return False
+        return operation not in (await self._setting('llm_cache_bypass', []) or [])
+
+    # --- keying ---
+
+    @staticmethod
+    def make_key(request_kwargs: dict) -> str:
+        """sha256 over the canonical JSON of the request (model, messages, params)"""
+        canonical = json.dumps(request_kwargs, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    # --- lookup / store ---
+
+    def _count(self, operation: str, counter: str):
+        op_counters = self._counters.setdefault(operation, {
+            'hits_memory': 0, 'hits_db': 0, 'misses': 0, 'writes': 0, 'bypassed': 0
+        })
+        op_counters[counter] += 1
+
+    def record_bypass(self, operation: str):
+        self._count(operation, 'bypassed')
+
+    async def get(self, key: str, operation: str) -> Optional[str]:
+        """Return the cached serialized response, or None on miss/expiry"""
+        now = datetime.utcnow()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            response, expires_at = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self._count(operation, 'hits_memory')
+                self._touch(key, now)
+                if (len(self._touched) >= self.TOUCH_FLUSH_ENTRIES
+                        or now - self._touched_since >= timedelta(seconds=self.TOUCH_FLUSH_SECONDS)):
+                    await self.flush_touches()
+                return response
+            del self._memory[key]
+
+        try:
+            from sqlalchemy import select
+            from app.database import AsyncSessionLocal
+            from app.models.llm_cache import LLMCacheEntry
+
+            async with AsyncSessionLocal() as db:
+                row = (await db.execute(
+                    select(LLMCacheEntry)
+                    .where(LLMCacheEntry.cache_key == key)
+                    .where(LLMCacheEntry.expires_at > now)
+                )).scalar_one_or_none()
+                if row is not None:
+                    row.last_accessed_at = now
+                    row.hit_count += 1
+                    await db.commit()
+                    self._remember(key, row.response, row.expires_at)
+                    self._count(operation, 'hits_db')
+                    return row.response
+        except Exception as e:
+            # Cache failures must never break the LLM call
+            logger.warning("LLM cache lookup failed", extra={'operation': operation, 'error_message': str(e)})
+
+        self._count(operation, 'misses')
+        return None
+
+    async def set(self, key: str, operation: str, model: Optional[str], response: str):
+        """Store a serialized response in both tiers"""
+        now = datetime.utcnow()
+        expires_at = now + timedelta(hours=await self._setting('llm_cache_ttl_hours', 168))
+        self._remember(key, response, expires_at)
+
+        try:
+            from sqlalchemy import select
+            from app.database import AsyncSessionLocal
+            from app.models.llm_cache import LLMCacheEntry
+
+            async with AsyncSessionLocal() as db:
+                row = (await db.execute(
+                    select(LLMCacheEntry).where(LLMCacheEntry.cache_key == key)
+                )).scalar_one_or_none()
+                if row is None:
+                    db.add(LLMCacheEntry(
+                        cache_key=key,
+                        operation=operation,
+                        model=model,
+                        response=response,
+                        expires_at=expires_at,
+                        last_accessed_at=now,
+                        hit_count=0
+                    ))
+                else:
+                    # Expired entry for the same key - refresh in place
+                    row.response = response
+                    row.expires_at = expires_at
+                    row.last_accessed_at = now
+                # Concurrent writers may race on the unique key; the other write wins
+                # (the session rolls back on exit)
+                await db.commit()
+            self._count(operation, 'writes')
+        except Exception as e:
+            logger.warning("LLM cache write failed", extra={'operation': operation, 'error_message': str(e)})
+            return
+
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= self.PRUNE_EVERY_WRITES:
+            self._writes_since_prune = 0
+            await self.prune()
+
+    def _touch(self, key: str, now: datetime):
+        _, hits = self._touched.get(key, (now, 0))
+        self._touched[key] = (now, hits + 1)
+
+    async def flush_touches(self):
+        """Write pending memory hits to last_accessed_at / hit_count (one executemany UPDATE)"""
+        from sqlalchemy import bindparam, update
+        from app.database import AsyncSessionLocal
+        from app.models.llm_cache import LLMCacheEntry
+
+        # Swap first: hits arriving while the UPDATE runs go to the next batch
+        touched, self._touched = self._touched, {}
+        self._touched_since = datetime.utcnow()
+        if not touched:
+            return
+
+        table = LLMCacheEntry.__table__
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(table)
+                    .where(table.c.cache_key == bindparam('b_key'))
+                    .values(
+                        last_accessed_at=bindparam('b_accessed_at'),
+                        hit_count=table.c.hit_count + bindparam('b_hits')
+                    ),
+                    [
+                        {'b_key': key, 'b_accessed_at': accessed_at, 'b_hits': hits}
+                        for key, (accessed_at, hits) in touched.items()
+                    ]
+                )
+                await db.commit()
+        except Exception as e:
+            # Only affects eviction order; the hits are dropped
+            logger.warning("LLM cache access write-back failed", extra={
+                'entries': len(touched),
+                'error_message': str(e)
+            })
+
+    def _remember(self, key: str, response: str, expires_at: datetime):
+        self._memory[key] = (response, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.MEMORY_MAX_ENTRIES:
+            self._memory.popitem(last=False)
+
+    # --- maintenance ---
+
+    async def prune(self) -> int:
+        """Delete expired rows, then least recently accessed rows beyond llm_cache_max_entries"""
+        from sqlalchemy import select, delete
+        from app.database import AsyncSessionLocal
+        from app.models.llm_cache import LLMCacheEntry
+
+        max_entries = await self._setting('llm_cache_max_entries', 50000)
+        # LRU order must include keys served only from memory
+        await self.flush_touches()
+        db = AsyncSessionLocal()
+        try:
+            expired = (await db.execute(
+                delete(LLMCacheEntry).where(LLMCacheEntry.expires_at <= datetime.utcnow())
+            )).rowcount
+            overflow_ids = select(LLMCacheEntry.id).order_by(
+                LLMCacheEntry.last_accessed_at.desc()
+            ).offset(max_entries).scalar_subquery()
+            overflow = (await db.execute(
+                delete(LLMCacheEntry).where(LLMCacheEntry.id.in_(overflow_ids)).execution_options(synchronize_session=False)
+            )).rowcount
+            await db.commit()
+            self._evicted += expired + overflow
+            if expired or overflow:
+                logger.info("LLM cache pruned", extra={'expired': expired, 'evicted_lru': overflow})
+            return expired + overflow
+        except Exception as e:
+            await db.rollback()
+            logger.warning("LLM cache prune failed", extra={'error_message': str(e)})
+            return 0
+        finally:
+            await db.close()
+
+    async def clear(self) -> int:
+        """Drop every cached response (both tiers)"""
+        from sqlalchemy import delete
+        from app.database import AsyncSessionLocal
+        from app.models.llm_cache import LLMCacheEntry
+
+        self._memory.clear()
+        self._touched.clear()
+        async with AsyncSessionLocal() as db:
+            deleted = (await db.execute(delete(LLMCacheEntry))).rowcount
+            await db.commit()
+            return deleted
+
+    def stats(self, db=None) -> dict:
+        """Hit/miss counters per operation plus table size"""
+        totals = {'hits_memory': 0, 'hits_db': 0, 'misses': 0, 'writes': 0, 'bypassed': 0}
+        for op_counters in self._counters.values():
+            for counter, value in op_counters.items():
+                totals[counter] += value
+        lookups = totals['hits_memory'] + totals['hits_db'] + totals['misses']
+
+        db_entries = None
+        enabled, bypassed = True, []
+        if db is not None:
+            from sqlalchemy import select, func
+            from app.models.llm_cache import LLMCacheEntry
+            from app.services.settings_service import SettingsService
+            db_entries = db.execute(select(func.count(LLMCacheEntry.id))).scalar()
+            settings_svc = SettingsService(db)
+            enabled = settings_svc.get('llm_cache_enabled', True)
+            bypassed = settings_svc.get('llm_cache_bypass', []) or []
+
+        return {
+            "enabled": enabled,
+            "bypassed_operations": bypassed,
+            "hit_ratio": round((totals['hits_memory'] + totals['hits_db']) / lookups, 3) if lookups else None,
+            "totals": totals,
+            "by_operation": self._counters,
+            "memory_entries": len(self._memory),
+            "db_entries": db_entries,
+            "evicted": self._evicted
+        }
+
+
+# Global instance
+llm_cache = LLMResponseCache()
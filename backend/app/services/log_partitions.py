@@ -0,0 +1,222 @@
+"""Daily range partitioning of system_logs (Postgres)
+
+On Postgres system_logs is a table partitioned by RANGE (timestamp) with one
+partition per UTC day (system_logs_pYYYYMMDD) plus a DEFAULT partition that
+catches rows outside the prepared range. Partitions are created
+log_partitions_ahead_days in advance, and retention drops whole expired
+partitions instead of running a row-by-row DELETE against the table the log
+writer is inserting into.
+
+Other databases (SQLite in development) keep the plain table and fall back
+to DELETE ... WHERE timestamp < cutoff.
+"""
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+import logging
+import re
+
+from sqlalchemy import text
+
+logger = logging.getLogger('klaus_news.log_partitions')
+
+TABLE = 'system_logs'
+DEFAULT_PARTITION = 'system_logs_default'
+PARTITION_NAME = re.compile(r'^system_logs_p(\d{8})$')
+
+
+def partition_name(day: date) -> str:
+    return f"{TABLE}_p{day:%Y%m%d}"
+
+
+def is_supported(conn) -> bool:
+    return conn.dialect.name == 'postgresql'
+
+
+def is_partitioned(conn) -> bool:
+    return conn.execute(text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"
+    ), {"table": TABLE}).first() is not None
+
+
+def list_partitions(conn) -> List[dict]:
+    """Daily partitions as [{name, day, estimated_rows}] oldest first (DEFAULT excluded)"""
+    rows = conn.execute(text(
+        "SELECT c.relname, c.reltuples FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(:table)"
+    ), {"table": TABLE}).all()
+    partitions = []
+    for name, reltuples in rows:
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions.append({
+                'name': name,
+                'day': datetime.strptime(match.group(1), '%Y%m%d').date(),
+                # -1 until the partition has been vacuumed/analyzed
+                'estimated_rows': max(int(reltuples), 0)
+            })
+    return sorted(partitions, key=lambda p: p['day'])
+
+
+def _create_partition(conn, day: date):
+    """Create the partition for day, moving any rows that landed in DEFAULT meanwhile"""
+    name = partition_name(day)
+    bounds = {"lo": day, "hi": day + timedelta(days=1)}
+    stranded = conn.execute(text(
+        f'SELECT 1 FROM {DEFAULT_PARTITION} WHERE "timestamp" >= :lo AND "timestamp" < :hi LIMIT 1'
+    ), bounds).first()
+    if stranded is None:
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{day.isoformat()}') TO ('{bounds['hi'].isoformat()}')"
+        ))
+        return
+    # Postgres refuses to add a partition whose range has rows in DEFAULT:
+    # build it standalone, move the rows over, then attach it
+    conn.execute(text(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)"))
+    moved = conn.execute(text(
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+        f'WHERE "timestamp" >= :lo AND "timestamp" < :hi RETURNING *) '
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ), bounds).rowcount
+    conn.execute(text(
+        f"ALTER TABLE {TABLE} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{day.isoformat()}') TO ('{bounds['hi'].isoformat()}')"
+    ))
+    logger.warning("Moved log rows out of the default partition", extra={
+        'partition': name,
+        'rows': moved
+    })
+
+
+def ensure_partitions(conn, days_ahead: int, start: Optional[date] = None) -> List[str]:
+    """Create missing daily partitions from start (default: today, UTC) through days_ahead"""
+    existing = {p['name'] for p in list_partitions(conn)}
+    today = datetime.utcnow().date()
+    created = []
+    day = start or today
+    while day <= today + timedelta(days=days_ahead):
+        if partition_name(day) not in existing:
+            _create_partition(conn, day)
+            created.append(partition_name(day))
+        day += timedelta(days=1)
+    return created
+
+
+def drop_expired_partitions(conn, retention_days: int) -> dict:
+    """Drop partitions whose whole day is older than the retention cutoff
+
+    A partition is only dropped once every row in it is past the cutoff, so
+    up to one extra day of logs is kept compared to the row DELETE.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    dropped = []
+    estimated_rows = 0
+    for partition in list_partitions(conn):
+        if datetime.combine(partition['day'] + timedelta(days=1), datetime.min.time()) > cutoff:
+            break
+        conn.execute(text(f"DROP TABLE {partition['name']}"))
+        dropped.append(partition['name'])
+        estimated_rows += partition['estimated_rows']
+
+    # Out-of-range stragglers in DEFAULT are few; delete them row by row
+    default_deleted = conn.execute(text(
+        f'DELETE FROM {DEFAULT_PARTITION} WHERE "timestamp" < :cutoff'
+    ), {"cutoff": cutoff}).rowcount
+
+    return {
+        'dropped_partitions': dropped,
+        'deleted_count': estimated_rows + default_deleted
+    }
+
+
+def convert_to_partitioned(conn, retention_days: int, days_ahead: int):
+    """Migrate a plain system_logs table to the partitioned layout (one transaction)
+
+    Rows within the retention window are copied into daily partitions; older
+    rows are discarded with the old table. The primary key becomes
+    (id, timestamp) because Postgres requires the partition key in every
+    unique constraint; id keeps its sequence.
+    """
+    from app.models.system_log import SystemLog
+
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    oldest = conn.execute(text(
+        f'SELECT min("timestamp") FROM {TABLE} WHERE "timestamp" >= :cutoff'
+    ), {"cutoff": cutoff}).scalar()
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": TABLE}).scalar()
+
+    conn.execute(text(f"ALTER TABLE {TABLE} RENAME TO {TABLE}_legacy"))
+    conn.execute(text(
+        f'CREATE TABLE {TABLE} (LIKE {TABLE}_legacy INCLUDING DEFAULTS) PARTITION BY RANGE ("timestamp")'
+    ))
+    conn.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT"))
+    ensure_partitions(conn, days_ahead, start=oldest.date() if oldest else None)
+
+    copied = conn.execute(text(
+        f'INSERT INTO {TABLE} SELECT * FROM {TABLE}_legacy WHERE "timestamp" >= :cutoff'
+    ), {"cutoff": cutoff}).rowcount
+    if sequence:
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {TABLE}.id"))
+    conn.execute(text(f"DROP TABLE {TABLE}_legacy"))
+
+    # Indexes are declared on the parent (so every partition gets them) once
+    # the legacy table and its identically named indexes are gone
+    conn.execute(text(f'ALTER TABLE {TABLE} ADD PRIMARY KEY (id, "timestamp")'))
+    for index in SystemLog.__table__.indexes:
+        index.create(bind=conn)
+
+    logger.info("Converted system_logs to daily partitions", extra={
+        'rows_copied': copied,
+        'retention_days': retention_days
+    })
+
+
+def setup_log_partitions(engine):
+    """Startup: convert system_logs on first run, then create upcoming partitions"""
+    from app.database import SessionLocal
+    from app.services.settings_service import SettingsService
+
+    if engine.dialect.name != 'postgresql':
+        return
+    db = SessionLocal()
+    try:
+        settings_svc = SettingsService(db)
+        retention_days = settings_svc.get('log_retention_days', 7)
+        days_ahead = settings_svc.get('log_partitions_ahead_days', 3)
+    finally:
+        db.close()
+
+    try:
+        with engine.begin() as conn:
+            if is_partitioned(conn):
+                ensure_partitions(conn, days_ahead)
+            else:
+                convert_to_partitioned(conn, retention_days, days_ahead)
+    except Exception:
+        # Rolled back as a whole: the table stays as it was and keeps accepting logs
+        logger.error("system_logs partition setup failed", exc_info=True)
+
+
+def enforce_retention(db, retention_days: int, days_ahead: int = 3) -> dict:
+    """Remove logs older than retention_days (db: Session; caller commits)
+
+    Partitioned: drop expired daily partitions and prepare upcoming ones.
+    Otherwise: plain DELETE of old rows. Expired hourly rollups go too.
+    """
+    from sqlalchemy import delete
+    from app.models.system_log import SystemLog
+    from app.services import log_rollups
+
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    log_rollups.prune(db, cutoff)
+
+    conn = db.connection()
+    if is_supported(conn) and is_partitioned(conn):
+        result = drop_expired_partitions(conn, retention_days)
+        result['created_partitions'] = ensure_partitions(conn, days_ahead)
+        result['mode'] = 'partitions'
+        return result
+
+    deleted = db.execute(delete(SystemLog).where(SystemLog.timestamp < cutoff)).rowcount
+    return {'mode': 'rows', 'deleted_count': deleted, 'dropped_partitions': [], 'created_partitions': []}
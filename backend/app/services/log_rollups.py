@@ -0,0 +1,116 @@
+"""Hourly log count rollups (log_hourly_rollups) behind /api/logs/stats
+
+The log writer adds every batch to the rollups with one upsert in the same
+transaction as the INSERT of the rows, so the rollups (including the current
+hour) always agree with system_logs. Stats for a window read the rollups for
+the whole hours it covers and count only the leading partial hour from
+system_logs.
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+import logging
+
+from sqlalchemy import delete, func, insert, select
+
+from app.models.log_rollup import LogHourlyRollup
+
+logger = logging.getLogger('klaus_news.log_rollups')
+
+ERROR_LEVELS = ('ERROR', 'CRITICAL')
+
+
+def hour_of(timestamp: datetime) -> datetime:
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def _dialect_insert(dialect_name: str):
+    """INSERT construct with on_conflict_do_update for this dialect"""
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert
+
+
+def add_batch(db, rows: List[dict]):
+    """Count a batch of system_logs rows into the rollups (caller commits)"""
+    counts = Counter(
+        (hour_of(row['timestamp']), row['level'], row['category'] or '', row['logger_name'])
+        for row in rows
+    )
+    if not counts:
+        return
+    dialect_insert = _dialect_insert(db.bind.dialect.name)
+    # Sorted keys: concurrent writers lock rollup rows in the same order
+    stmt = dialect_insert(LogHourlyRollup).values([
+        {'hour': hour, 'level': level, 'category': category, 'logger_name': logger_name, 'count': count}
+        for (hour, level, category, logger_name), count in sorted(counts.items())
+    ])
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=['hour', 'level', 'category', 'logger_name'],
+        set_={'count': LogHourlyRollup.count + stmt.excluded.count}
+    ))
+
+
+def backfill(engine):
+    """Startup: build rollups from existing system_logs once (when the table is empty)"""
+    from app.models.system_log import SystemLog
+
+    with engine.begin() as conn:
+        if conn.execute(select(LogHourlyRollup.hour).limit(1)).first() is not None:
+            return
+        if engine.dialect.name == 'postgresql':
+            hour = func.date_trunc('hour', SystemLog.timestamp)
+        else:
+            # Same text format SQLAlchemy stores SQLite DATETIMEs in
+            hour = func.strftime('%Y-%m-%d %H:00:00.000000', SystemLog.timestamp)
+        category = func.coalesce(SystemLog.category, '')
+        inserted = conn.execute(insert(LogHourlyRollup).from_select(
+            ['hour', 'level', 'category', 'logger_name', 'count'],
+            select(hour, SystemLog.level, category, SystemLog.logger_name, func.count())
+            .group_by(hour, SystemLog.level, category, SystemLog.logger_name)
+        )).rowcount
+    if inserted:
+        logger.info("Backfilled hourly log rollups", extra={'rollup_rows': inserted})
+
+
+def window_counts(db, hours: int) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Log counts by level and by category for the last `hours`
+
+    Whole hours come from the rollups; the partial hour at the start of the
+    window is counted from system_logs (at most an hour of rows).
+    """
+    from app.models.system_log import SystemLog
+
+    cutoff = datetime.utcnow() - timedelta(hours=hours)
+    first_hour = hour_of(cutoff)
+    if first_hour < cutoff:
+        first_hour += timedelta(hours=1)
+
+    counts = db.execute(
+        select(LogHourlyRollup.level, LogHourlyRollup.category, func.sum(LogHourlyRollup.count))
+        .where(LogHourlyRollup.hour >= first_hour)
+        .group_by(LogHourlyRollup.level, LogHourlyRollup.category)
+    ).all()
+    counts += db.execute(
+        select(SystemLog.level, SystemLog.category, func.count(SystemLog.id))
+        .where(SystemLog.timestamp >= cutoff)
+        .where(SystemLog.timestamp < first_hour)
+        .group_by(SystemLog.level, SystemLog.category)
+    ).all()
+
+    by_level: Dict[str, int] = {}
+    by_category: Dict[str, int] = {}
+    for level, category, count in counts:
+        by_level[level] = by_level.get(level, 0) + int(count)
+        if category:
+            by_category[category] = by_category.get(category, 0) + int(count)
+    return by_level, by_category
+
+
+def prune(db, cutoff: datetime) -> int:
+    """Delete rollup hours that ended before cutoff (caller commits)"""
+    return db.execute(
+        delete(LogHourlyRollup).where(LogHourlyRollup.hour < hour_of(cutoff))
+    ).rowcount
@@ -0,0 +1,175 @@
+"""Indexed text search and count estimates for system_logs
+
+Search keeps the substring semantics of ILIKE '%term%'. On Postgres, pg_trgm
+GIN indexes on message and the exception fields answer it with an index
+scan instead of a sequential scan (terms of 3+ characters). Other databases
+run the same ILIKE unindexed.
+"""
+import json
+import logging
+import threading
+import time
+
+from sqlalchemy import or_, text
+
+logger = logging.getLogger('klaus_news.log_search')
+
+# (index name, column) - GIN trigram indexes on system_logs (and every daily partition)
+TRIGRAM_INDEXES = [
+    ('idx_system_logs_message_trgm', 'message'),
+    ('idx_system_logs_exception_type_trgm', 'exception_type'),
+    ('idx_system_logs_exception_message_trgm', 'exception_message'),
+]
+KEYSET_INDEX = 'idx_timestamp_id'
+
+
+def setup_log_search(engine):
+    """Startup: create the keyset and trigram indexes if they are missing
+
+    On Postgres the indexes are built CONCURRENTLY in a background thread:
+    startup does not wait for them and log writes are not blocked while a
+    large system_logs table is indexed. Search runs unindexed until then.
+    """
+    from app.models.system_log import SystemLog
+
+    if engine.dialect.name != 'postgresql':
+        # (timestamp, id) keyset index; new databases get it from create_all
+        try:
+            for index in SystemLog.__table__.indexes:
+                if index.name == KEYSET_INDEX:
+                    index.create(bind=engine, checkfirst=True)
+        except Exception:
+            logger.error("Log search index setup failed", exc_info=True)
+        return
+
+    threading.Thread(
+        target=build_search_indexes, args=(engine,), name="log-search-indexes", daemon=True
+    ).start()
+
+
+def build_search_indexes(engine):
+    """Build missing search indexes without locking out writers (Postgres)
+
+    Runs in autocommit with statement_timeout disabled: CREATE INDEX
+    CONCURRENTLY cannot run in a transaction and may take long on a big table.
+    """
+    from app.services.log_partitions import is_partitioned
+
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT")
+            conn.execute(text("SET statement_timeout = 0"))
+            try:
+                trigram = True
+                try:
+                    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                except Exception:
+                    logger.warning("pg_trgm extension unavailable; log search stays unindexed", exc_info=True)
+                    trigram = False
+
+                indexes = [(KEYSET_INDEX, 'btree ("timestamp", id)')]
+                if trigram:
+                    indexes += [(name, f"gin ({column} gin_trgm_ops)") for name, column in TRIGRAM_INDEXES]
+
+                partitioned = is_partitioned(conn)
+                built = [
+                    name for name, definition in indexes
+                    if (_build_partitioned_index if partitioned else _build_index)(conn, name, definition)
+                ]
+            finally:
+                conn.execute(text("RESET statement_timeout"))
+    except Exception:
+        # Search keeps working unindexed; the next startup retries
+        logger.error("Log search index build failed", exc_info=True)
+        return
+    if built:
+        logger.info("Log search indexes built", extra={
+            'indexes': built,
+            'duration_ms': round((time.perf_counter() - started) * 1000)
+        })
+
+
+def _index_state(conn, name: str):
+    """None if the index does not exist, else whether it is valid"""
+    return conn.execute(text(
+        "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+    ), {"name": name}).scalar()
+
+
+def _build_index(conn, name: str, definition: str) -> bool:
+    """CREATE INDEX CONCURRENTLY on the plain table; True if it was built"""
+    state = _index_state(conn, name)
+    if state:
+        return False
+    if state is False:
+        # Left INVALID by an interrupted concurrent build
+        conn.execute(text(f"DROP INDEX CONCURRENTLY {name}"))
+    conn.execute(text(f"CREATE INDEX CONCURRENTLY {name} ON system_logs USING {definition}"))
+    return True
+
+
+def _build_partitioned_index(conn, name: str, definition: str) -> bool:
+    """Index on the partitioned parent, built one partition at a time
+
+    Postgres cannot build a partitioned index CONCURRENTLY: the parent index
+    is created ON ONLY (instant, invalid), each partition gets a concurrent
+    build that is attached to it, and the parent turns valid once every
+    partition is attached. Partitions created later inherit the index.
+    """
+    if _index_state(conn, name):
+        return False
+    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY system_logs USING {definition}"))
+
+    partitions = conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'system_logs'::regclass"
+    )).scalars().all()
+    for partition in partitions:
+        attached = conn.execute(text(
+            "SELECT 1 FROM pg_inherits i JOIN pg_index x ON x.indexrelid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:parent) AND x.indrelid = to_regclass(:partition)"
+        ), {"parent": name, "partition": partition}).first()
+        if attached:
+            continue
+        # e.g. idx_system_logs_message_trgm_p20260101
+        partition_index = name + partition[len('system_logs'):]
+        state = _index_state(conn, partition_index)
+        if state is False:
+            conn.execute(text(f"DROP INDEX CONCURRENTLY {partition_index}"))
+        if not state:
+            conn.execute(text(
+                f"CREATE INDEX CONCURRENTLY {partition_index} ON {partition} USING {definition}"
+            ))
+        conn.execute(text(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}"))
+    return True
+
+
+def search_condition(term: str):
+    """Case-insensitive substring match on message or the exception fields"""
+    from app.models.system_log import SystemLog
+
+    # '/' as escape character: no backslash quoting differences between dialects
+    escaped = term.replace('/', '//').replace('%', '/%').replace('_', '/_')
+    pattern = f'%{escaped}%'
+    return or_(
+        SystemLog.message.ilike(pattern, escape='/'),
+        SystemLog.exception_type.ilike(pattern, escape='/'),
+        SystemLog.exception_message.ilike(pattern, escape='/')
+    )
+
+
+def estimate_count(db, query) -> int:
+    """Planner row estimate for a SELECT (no scan); exact COUNT(*) off Postgres"""
+    from sqlalchemy import func, select
+
+    if db.bind.dialect.name != 'postgresql':
+        return db.execute(select(func.count()).select_from(query.subquery())).scalar()
+
+    compiled = query.compile(dialect=db.bind.dialect)
+    plan = db.connection().exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
@@ -21,9 +21,20 @@ def setup_logging():
         ('klaus_news.x_client', 'external_api'),
         ('klaus_news.openai_client', 'external_api'),
         ('klaus_news.teams_service', 'external_api'),
+        ('klaus_news.http_clients', 'external_api'),
+        ('klaus_news.llm_cache', 'external_api'),
         ('klaus_news.scheduler', 'scheduler'),
+        ('klaus_news.group_index', 'scheduler'),
+        ('klaus_news.prefilter', 'scheduler'),
+        ('klaus_news.ingestion_metrics', 'scheduler'),
+        ('klaus_news.group_aggregates', 'scheduler'),
         ('klaus_news.api', 'api'),
+        ('klaus_news.loop_monitor', 'api'),
+        ('klaus_news.exports', 'api'),
         ('klaus_news.database', 'database'),
+        ('klaus_news.log_partitions', 'database'),
+        ('klaus_news.log_search', 'database'),
+        ('klaus_news.log_rollups', 'database'),
     ]
 
     for logger_name, category in loggers_config:
@@ -1,73 +1,243 @@
-"""Custom logging handler that writes to system_logs database table"""
-import logging
+"""Custom logging handler that writes to system_logs database table
+
+emit() only converts the record to a row and enqueues it; a background
+writer thread inserts queued rows in bulk (multi-row INSERT) whenever
+log_batch_size rows are waiting or log_flush_interval_ms has passed, and
+updates the hourly rollups (log_rollups) in the same transaction.
+"""
+from datetime import datetime
+from typing import Optional
+import atexit
 import json
+import logging
+import queue
+import sys
+import threading
+import time
 import traceback
-from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
 
+# LogRecord attributes that are not user-supplied extra={} context
+RECORD_ATTRIBUTES = {
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'message', 'pathname', 'process', 'processName',
+    'relativeCreated', 'thread', 'threadName', 'exc_info',
+    'exc_text', 'stack_info', 'taskName'
+}
+
+
+class DatabaseLogWriter:
+    """Bounded queue + background thread that bulk-inserts SystemLog rows
+
+    Backpressure / drop policy when the queue is full:
+    - DEBUG/INFO rows are dropped immediately (never slow the caller down)
+    - WARNING and above wait up to log_queue_block_ms for room, then are dropped
+    Dropped rows are counted per level and reported by a WARNING row in the
+    next batch, so the loss is visible in the logs themselves.
+    """
+
+    def __init__(self):
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._dropped: dict[str, int] = {}
+        self._dropped_unreported = 0
+        self._in_flight = 0  # Rows of the batch being written
+        self.rows_written = 0
+        self.batches_written = 0
+        self.write_failures = 0
+        self.rows_lost_on_failure = 0
+        self.last_flush_ms: Optional[float] = None
+
+    # --- producer side (any thread, including the event loop) ---
+
+    def enqueue(self, row: dict, levelno: int):
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        try:
+            if levelno >= logging.WARNING:
+                self._queue.put(row, timeout=settings.log_queue_block_ms / 1000)
+            else:
+                self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self._dropped[row['level']] = self._dropped.get(row['level'], 0) + 1
+                self._dropped_unreported += 1
+
+    # --- lifecycle ---
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._queue is None:
+                self._queue = queue.Queue(maxsize=settings.log_queue_max_size)
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="db-log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Flush everything queued and stop the writer (called on shutdown)"""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            # Still writing: keep the reference so no second writer is started.
+            # Can't log this through ourselves; report on stderr.
+            print(
+                f"DatabaseLogWriter: writer still running after {timeout}s, "
+                f"{self._in_flight + self._queue.qsize()} log rows pending",
+                file=sys.stderr
+            )
+            return
+        self._thread = None
+
+    # --- writer thread ---
+
+    def _run(self):
+        batch_size = settings.log_batch_size
+        interval = settings.log_flush_interval_ms / 1000
+        while True:
+            batch = []
+            deadline = time.monotonic() + interval
+            while len(batch) < batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+                # Drain whatever is already waiting without further timeouts
+                while len(batch) < batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if self._stopping.is_set():
+                    break
+
+            self._in_flight = len(batch)
+            self._write(batch)
+            self._in_flight = 0
+            if self._stopping.is_set() and self._queue.empty():
+                return
+
+    def _write(self, batch: list):
+        with self._lock:
+            dropped, self._dropped_unreported = self._dropped_unreported, 0
+        if dropped:
+            batch.append({
+                'timestamp': datetime.utcnow(),
+                'level': 'WARNING',
+                'logger_name': 'klaus_news.logging',
+                'message': f"Log queue full: {dropped} log records dropped",
+                'context': json.dumps({'dropped': dropped, 'dropped_by_level': dict(self._dropped)}),
+                'exception_type': None,
+                'exception_message': None,
+                'stack_trace': None,
+                'correlation_id': None,
+                'category': 'database'
+            })
+        if not batch:
+            return
+
+        from sqlalchemy import insert
+        from app.database import LogSessionLocal
+        from app.models.system_log import SystemLog
+        from app.services import log_rollups
+
+        started = time.perf_counter()
+        db = LogSessionLocal()
+        try:
+            # One executemany; SQLAlchemy batches it into multi-row INSERTs
+            db.execute(insert(SystemLog), batch)
+            # Hourly counts for /api/logs/stats, committed together with the rows
+            log_rollups.add_batch(db, batch)
+            db.commit()
+            self.rows_written += len(batch)
+            self.batches_written += 1
+        except Exception as e:
+            # Never retry forever or log through ourselves; report on stderr
+            db.rollback()
+            self.write_failures += 1
+            self.rows_lost_on_failure += len(batch)
+            print(f"DatabaseLogWriter: failed to write {len(batch)} log rows: {e}", file=sys.stderr)
+        finally:
+            db.close()
+        self.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def stats(self) -> dict:
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "queue_max_size": settings.log_queue_max_size,
+            "batch_size": settings.log_batch_size,
+            "flush_interval_ms": settings.log_flush_interval_ms,
+            "rows_written": self.rows_written,
+            "batches_written": self.batches_written,
+            "avg_batch_rows": round(self.rows_written / self.batches_written, 1) if self.batches_written else None,
+            "last_flush_ms": self.last_flush_ms,
+            "dropped_by_level": dict(self._dropped),
+            "write_failures": self.write_failures,
+            "rows_lost_on_failure": self.rows_lost_on_failure
+        }
+
+
+# Global instance
+log_writer = DatabaseLogWriter()
+# Scripts and jobs run outside the app still flush queued rows on exit
+atexit.register(log_writer.stop)
+
 
 class DatabaseLogHandler(logging.Handler):
-    """Custom logging handler that writes logs to system_logs table"""
+    """Custom logging handler that writes logs to system_logs table (via log_writer)"""
 
     def __init__(self, category=None):
         super().__init__()
         self.category = category
-        # Use separate engine for logging to avoid interference with main app
-        self.engine = create_engine(settings.database_url, pool_pre_ping=True)
-        self.SessionLocal = sessionmaker(bind=self.engine)
 
     def emit(self, record):
-        """Write log record to database"""
+        """Convert the record to a system_logs row and queue it (non-blocking)"""
         try:
-            from app.models.system_log import SystemLog
-
-            db = self.SessionLocal()
-            try:
-                # Extract exception info if present
-                exception_type = None
-                exception_message = None
-                stack_trace = None
-
-                if record.exc_info:
-                    exc_type, exc_value, exc_tb = record.exc_info
-                    exception_type = exc_type.__name__ if exc_type else None
-                    exception_message = str(exc_value) if exc_value else None
-                    stack_trace = ''.join(traceback.format_exception(exc_type, exc_value, exc_tb))
-
-                # Build context from extra fields
-                context = {}
-                for key, value in record.__dict__.items():
-                    if key not in ['name', 'msg', 'args', 'created', 'filename', 'funcName',
-                                   'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                                   'message', 'pathname', 'process', 'processName',
-                                   'relativeCreated', 'thread', 'threadName', 'exc_info',
-                                   'exc_text', 'stack_info']:
-                        try:
-                            json.dumps(value)  # Test serializability
-                            context[key] = value
-                        except (TypeError, ValueError):
-                            context[key] = str(value)
-
-                log_entry = SystemLog(
-                    timestamp=datetime.utcnow(),
-                    level=record.levelname,
-                    logger_name=record.name,
-                    message=record.getMessage(),
-                    context=json.dumps(context) if context else None,
-                    exception_type=exception_type,
-                    exception_message=exception_message,
-                    stack_trace=stack_trace,
-                    correlation_id=context.get('correlation_id'),
-                    category=self.category or context.get('category')
-                )
-
-                db.add(log_entry)
-                db.commit()
-            finally:
-                db.close()
+            # Extract exception info if present
+            exception_type = None
+            exception_message = None
+            stack_trace = None
+
+            if record.exc_info:
+                exc_type, exc_value, exc_tb = record.exc_info
+                exception_type = exc_type.__name__ if exc_type else None
+                exception_message = str(exc_value) if exc_value else None
+                stack_trace = ''.join(traceback.format_exception(exc_type, exc_value, exc_tb))
+
+            # Build context from extra fields
+            context = {}
+            for key, value in record.__dict__.items():
+                if key not in RECORD_ATTRIBUTES:
+                    try:
+                        json.dumps(value)  # Test serializability
+                        context[key] = value
+                    except (TypeError, ValueError):
+                        context[key] = str(value)
+
+            log_writer.enqueue({
+                # Time the record was created, not when the batch is written
+                'timestamp': datetime.utcfromtimestamp(record.created),
+                'level': record.levelname,
+                'logger_name': record.name,
+                'message': record.getMessage(),
+                'context': json.dumps(context) if context else None,
+                'exception_type': exception_type,
+                'exception_message': exception_message,
+                'stack_trace': stack_trace,
+                'correlation_id': context.get('correlation_id'),
+                'category': self.category or context.get('category')
+            }, record.levelno)
         except Exception:
             # Silently fail - logging should never break the application
             self.handleError(record)
@@ -0,0 +1,227 @@
+"""Event loop lag sampler and blocking-call detector
+
+A sampler task sleeps for a fixed interval and records how late it wakes up
+(loop lag). A watchdog thread watches the sampler's heartbeat; when the loop
+has not come back for loop_block_threshold_ms, it captures the loop thread's
+stack and attributes the block to the route or scheduler job that owns the
+running task (see activity()/track()). A block's blocked_ms is the lag of the
+stalled tick, so it can undercount the block by up to one sampling interval.
+"""
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+import asyncio
+import functools
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+
+logger = logging.getLogger('klaus_news.loop_monitor')
+
+
+class LoopMonitor:
+    """Samples event loop lag and records blocking callbacks (started in main.py)"""
+
+    SAMPLE_WINDOW = 3000  # lag samples kept for percentiles (~5 minutes at 100ms)
+    RECENT_BLOCKS = 50
+    STACK_FRAMES = 25
+
+    def __init__(self):
+        self.interval = 0.1
+        self.block_threshold = 0.2
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._sampler: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._heartbeat = time.monotonic()
+        self._samples: deque = deque(maxlen=self.SAMPLE_WINDOW)
+        self._open_block: Optional[dict] = None
+        self._blocks: deque = deque(maxlen=self.RECENT_BLOCKS)
+        self._by_activity: dict[str, dict] = {}
+        self._started_at: Optional[datetime] = None
+        # Task -> "GET /api/..." or "job:<name>"; inherited by tasks they create
+        self._activities: "weakref.WeakKeyDictionary[asyncio.Task, str]" = weakref.WeakKeyDictionary()
+
+    # --- attribution ---
+
+    def _task_factory(self, loop, coro, **kwargs):
+        task = asyncio.Task(coro, loop=loop, **kwargs)
+        parent = asyncio.current_task(loop)
+        if parent is not None and parent in self._activities:
+            self._activities[task] = self._activities[parent]
+        return task
+
+    @contextmanager
+    def activity(self, label: str):
+        """Attribute the current task (and tasks it spawns) to label"""
+        task = asyncio.current_task()
+        if task is None:
+            yield
+            return
+        previous = self._activities.get(task)
+        self._activities[task] = label
+        try:
+            yield
+        finally:
+            if previous is None:
+                self._activities.pop(task, None)
+            else:
+                self._activities[task] = previous
+
+    def track(self, label: str):
+        """Decorator for coroutine jobs: run the job under activity(label)"""
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with self.activity(label):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _describe_running(self) -> str:
+        """Label of whatever the loop is running right now (called from the watchdog)"""
+        task = asyncio.current_task(self._loop)
+        if task is None:
+            return "loop callback"
+        label = self._activities.get(task)
+        if label:
+            return label
+        coro = task.get_coro()
+        return getattr(coro, '__qualname__', None) or task.get_name()
+
+    # --- lifecycle ---
+
+    def start(self):
+        """Start sampling on the running loop (settings: loop_monitor_*)"""
+        from app.services.settings_service import SettingsService
+
+        if self._sampler is not None and not self._sampler.done():
+            return
+        settings_svc = SettingsService()
+        if not settings_svc.get('loop_monitor_enabled', True):
+            logger.info("Event loop monitor disabled")
+            return
+        self.interval = settings_svc.get('loop_monitor_interval_ms', 100) / 1000
+        self.block_threshold = settings_svc.get('loop_block_threshold_ms', 200) / 1000
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        if self._loop.get_task_factory() is None:
+            self._loop.set_task_factory(self._task_factory)
+        self._heartbeat = time.monotonic()
+        self._started_at = datetime.utcnow()
+        self._stop.clear()
+        self._sampler = self._loop.create_task(self._sample())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info("Event loop monitor started", extra={
+            'interval_ms': self.interval * 1000,
+            'block_threshold_ms': self.block_threshold * 1000
+        })
+
+    async def stop(self):
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.cancel()
+            try:
+                await self._sampler
+            except asyncio.CancelledError:
+                pass
+            self._sampler = None
+
+    # --- sampling ---
+
+    async def _sample(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            self._heartbeat = now
+            self._samples.append(lag)
+
+            block = self._open_block
+            if block is not None:
+                # The loop is back: the block lasted as long as this tick was late
+                # (a capture racing a timely wake-up is discarded)
+                self._open_block = None
+                if lag >= self.block_threshold:
+                    block['blocked_ms'] = round(lag * 1000, 1)
+                    self._record_block(block)
+
+    def _watch(self):
+        poll = max(0.01, self.block_threshold / 4)
+        while not self._stop.wait(poll):
+            stalled = time.monotonic() - self._heartbeat - self.interval
+            if stalled < self.block_threshold or self._open_block is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.format_stack(frame)[-self.STACK_FRAMES:]
+            self._open_block = {
+                'detected_at': datetime.utcnow().isoformat(),
+                'activity': self._describe_running(),
+                'blocked_ms': None,
+                'stack': [line.rstrip() for line in stack]
+            }
+
+    def _record_block(self, block: dict):
+        self._blocks.append(block)
+        totals = self._by_activity.setdefault(block['activity'], {
+            'count': 0, 'total_blocked_ms': 0.0, 'max_blocked_ms': 0.0
+        })
+        totals['count'] += 1
+        totals['total_blocked_ms'] = round(totals['total_blocked_ms'] + block['blocked_ms'], 1)
+        totals['max_blocked_ms'] = max(totals['max_blocked_ms'], block['blocked_ms'])
+        # Innermost frame of the blocking code (the line that was running)
+        location = block['stack'][-1].strip().splitlines()[0] if block['stack'] else None
+        logger.warning("Event loop blocked", extra={
+            'activity': block['activity'],
+            'blocked_ms': block['blocked_ms'],
+            'location': location
+        })
+
+    # --- reporting ---
+
+    def stats(self) -> dict:
+        from app.services.ingestion_metrics import percentile
+
+        ordered = sorted(self._samples)
+
+        def ms(value):
+            return round(value * 1000, 2) if value is not None else None
+
+        return {
+            "running": self._sampler is not None and not self._sampler.done(),
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "interval_ms": self.interval * 1000,
+            "block_threshold_ms": self.block_threshold * 1000,
+            "samples": len(ordered),
+            "lag_ms": {
+                "p50": ms(percentile(ordered, 50)),
+                "p95": ms(percentile(ordered, 95)),
+                "p99": ms(percentile(ordered, 99)),
+                "max": ms(ordered[-1]) if ordered else None
+            },
+            "blocks_total": sum(totals['count'] for totals in self._by_activity.values()),
+            "blocks_by_activity": dict(sorted(
+                self._by_activity.items(), key=lambda item: -item[1]['total_blocked_ms']
+            )),
+            "recent_blocks": list(reversed(self._blocks))
+        }
+
+    def reset(self):
+        """Clear samples and recorded blocks"""
+        self._samples.clear()
+        self._blocks.clear()
+        self._by_activity.clear()
+
+
+# Global instance
+loop_monitor = LoopMonitor()
@@ -6,6 +6,119 @@ from app.config import settings
 
 logger = logging.getLogger('klaus_news.openai_client')
 
+# Phrases that mark scraped error pages / refusals rather than real post content
+ERROR_INDICATORS = [
+    "i'm sorry",
+    "i cannot access",
+    "can't access",
+    "cannot access external",
+    "please provide more details",
+    "unable to access",
+    "error fetching",
+    "i apologize",
+    "i don't have access",
+]
+
+
+def looks_like_error_content(text: str) -> bool:
+    """True if the text looks like an error message instead of post content"""
+    text_lower = text.lower()
+    return any(indicator in text_lower for indicator in ERROR_INDICATORS)
+
+
+class EnrichmentParseError(Exception):
+    """Exception raised when a structured enrichment response cannot be parsed"""
+    def __init__(self, raw_response: str, reason: str):
+        self.raw_response = raw_response
+        self.reason = reason
+        super().__init__(f"Unparseable enrichment response ({reason}): {raw_response[:200]}")
+
+
+def parse_enrichment(raw: str) -> tuple:
+    """(data, clamped worthiness) from an enrich_post response; raises EnrichmentParseError"""
+    import json
+
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        raise EnrichmentParseError(raw, "invalid JSON")
+    if not isinstance(data, dict):
+        raise EnrichmentParseError(raw, "not a JSON object")
+    missing = [key for key in ("category", "title", "summary", "worthiness") if key not in data]
+    if missing:
+        raise EnrichmentParseError(raw, f"missing keys: {', '.join(missing)}")
+    try:
+        worthiness = max(0.0, min(1.0, float(data["worthiness"])))  # Clamp to [0.0, 1.0]
+    except (TypeError, ValueError):
+        raise EnrichmentParseError(raw, "worthiness is not a number")
+    return data, worthiness
+
+
+def is_cacheable(response, validate=None) -> bool:
+    """True for a complete, non-empty answer that validate(content) accepts
+
+    Truncated (finish_reason "length"), filtered, refused or empty responses
+    are never cached: a bad answer would otherwise repeat for the same input
+    until the entry expires.
+    """
+    if not response.choices:
+        return False
+    choice = response.choices[0]
+    content = (choice.message.content or "").strip()
+    if choice.finish_reason != "stop" or not content or getattr(choice.message, "refusal", None):
+        return False
+    if validate is not None:
+        try:
+            validate(content)
+        except Exception:
+            return False
+    return True
+
+
+class OpenAIConnectionPool:
+    """Process-wide AsyncOpenAI client on the shared 'openai' keep-alive pool
+
+    The underlying httpx client (http_clients.openai_http) is started at app
+    startup and closed at shutdown; get_client() also works before startup.
+    """
+
+    def __init__(self):
+        self._client = None
+        self._http_client = None
+
+    def get_client(self):
+        """Return the shared AsyncOpenAI client, rebuilding it if the pool was recycled"""
+        from openai import AsyncOpenAI
+        from app.services.http_clients import openai_http
+
+        http_client = openai_http.get_client()
+        if self._client is None or self._http_client is not http_client:
+            self._client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
+            self._http_client = http_client
+        return self._client
+
+    def start(self):
+        """Create the shared client (no-op if already running)"""
+        self.get_client()
+
+    async def close(self):
+        """Close the shared client and its pooled connections"""
+        from app.services.http_clients import openai_http
+
+        self._client = None
+        self._http_client = None
+        await openai_http.close()
+
+    def stats(self) -> dict:
+        """Pool statistics (connections_opened < requests means connections are reused)"""
+        from app.services.http_clients import openai_http
+
+        return openai_http.stats()
+
+
+# Global instance
+openai_pool = OpenAIConnectionPool()
+
 
 class OpenAIClient:
     """Client for OpenAI API with database-backed prompt support (V-4)
@@ -69,6 +182,35 @@ class OpenAIClient:
             "max_completion_tokens": 500
         })
 
+    async def _chat_completion(self, operation: str, client, validate=None, **create_kwargs):
+        """chat.completions.create through the LLM response cache (see llm_cache)
+
+        Identical requests (same model, prompt, input and parameters) are served
+        from cache unless caching is disabled or bypassed for this operation.
+        Only responses that pass is_cacheable (with the caller's validate(content),
+        which raises on content the caller cannot parse) are stored; a cached
+        entry that fails it is fetched again.
+        """
+        from openai.types.chat import ChatCompletion
+        from app.services.llm_cache import llm_cache
+
+        if not await llm_cache.is_enabled(operation):
+            llm_cache.record_bypass(operation)
+            return await client.chat.completions.create(**create_kwargs)
+
+        cache_key = llm_cache.make_key(create_kwargs)
+        cached = await llm_cache.get(cache_key, operation)
+        if cached is not None:
+            response = ChatCompletion.model_validate_json(cached)
+            if is_cacheable(response, validate):
+                return response
+            # Stored before responses were checked: replaced by the fresh answer below
+
+        response = await client.chat.completions.create(**create_kwargs)
+        if is_cacheable(response, validate):
+            await llm_cache.set(cache_key, operation, create_kwargs.get("model"), response.model_dump_json())
+        return response
+
     async def generate_title_and_summary(self, post_text: str) -> Dict[str, str]:
         """Generate AI title and summary for a post
 
@@ -78,9 +220,9 @@ class OpenAIClient:
         Returns:
             Dict with keys: title, summary
         """
-        from openai import AsyncOpenAI, APIError
+        from openai import APIError
 
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         title_prompt = f"Generate a concise, informative title (maximum 100 characters) for this post: {post_text}. Return only the title, nothing else. Do not wrap the title in quotation marks."
         summary_prompt = f"Summarize this post in 2-3 sentences: {post_text}. Return only the summary, nothing else."
@@ -95,13 +237,15 @@ class OpenAIClient:
             # NOTE: gpt-5-mini is a reasoning model that only supports temperature=1 (default)
             # Do not specify temperature parameter - see GOTCHAS.md "gpt-5-mini Temperature Limitation"
             # Reasoning models need extra tokens for internal thinking
-            title_response = await client.chat.completions.create(
+            title_response = await self._chat_completion(
+                "generate_title_and_summary", client,
                 model=self.model,
                 messages=[{"role": "user", "content": title_prompt}],
                 max_completion_tokens=1000
             )
 
-            summary_response = await client.chat.completions.create(
+            summary_response = await self._chat_completion(
+                "generate_title_and_summary", client,
                 model=self.model,
                 messages=[{"role": "user", "content": summary_prompt}],
                 max_completion_tokens=1000
@@ -150,9 +294,9 @@ class OpenAIClient:
         Returns:
             Dict with keys: category (str), confidence (float)
         """
-        from openai import AsyncOpenAI, APIError
+        from openai import APIError
 
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         # V-13: Build prompt with assembled categories (with safety fallback)
         if hasattr(self, 'build_categorization_prompt'):
@@ -182,7 +326,7 @@ class OpenAIClient:
             if "temperature" in prompt_config:
                 create_kwargs["temperature"] = prompt_config["temperature"]
 
-            response = await client.chat.completions.create(**create_kwargs)
+            response = await self._chat_completion("categorize_post", client, **create_kwargs)
 
             ai_response = response.choices[0].message.content.strip()
             confidence = 1.0 if hasattr(response.choices[0], 'logprobs') else 0.8
@@ -231,9 +375,9 @@ class OpenAIClient:
         Returns:
             Generated article content (markdown)
         """
-        from openai import AsyncOpenAI, APIError
+        from openai import APIError
 
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         prompt = f"Write a comprehensive news article based on this post: {post_text}. Requirements: Informative headline, 3-5 paragraphs, Objective tone, Include context and background. Format as markdown."
 
@@ -280,36 +424,11 @@ class OpenAIClient:
             raise
 
 
-    async def score_worthiness(self, post_text: str, db=None, title: str | None = None, summary: str | None = None) -> float:
-        """Score post worthiness using AI (V-6)
+    def _get_worthiness_prompt(self, db=None) -> dict:
+        """Resolve the score_worthiness prompt (database first, then hardcoded)
 
-        Uses database prompts when available (via _get_prompt), falls back
-        to hardcoded prompts when db=None or prompt not found.
-
-        STCC-8 Safety: Works with or without V-4's _get_prompt method via hasattr check.
+        The model and token budget are fixed regardless of database values.
         """
-        from openai import AsyncOpenAI, APIError
-
-        # Early detection of error content - return 0.0 immediately
-        error_indicators = [
-            "i'm sorry",
-            "i cannot access",
-            "can't access",
-            "cannot access external",
-            "please provide more details",
-            "unable to access",
-            "error fetching",
-            "i apologize",
-            "i don't have access",
-        ]
-        post_lower = post_text.lower()
-        if any(indicator in post_lower for indicator in error_indicators):
-            logger.info("Detected error content in post, assigning score 0.0", extra={
-                'operation': 'score_worthiness',
-                'post_snippet': post_text[:100]
-            })
-            return 0.0
-
         # Get prompt config - try database first, then fallback to hardcoded
         prompt_config = None
 
@@ -344,8 +463,30 @@ class OpenAIClient:
         if "temperature" in prompt_config:
             del prompt_config["temperature"]
 
+        return prompt_config
+
+    async def score_worthiness(self, post_text: str, db=None, title: str | None = None, summary: str | None = None) -> float:
+        """Score post worthiness using AI (V-6)
+
+        Uses database prompts when available (via _get_prompt), falls back
+        to hardcoded prompts when db=None or prompt not found.
+
+        STCC-8 Safety: Works with or without V-4's _get_prompt method via hasattr check.
+        """
+        from openai import APIError
+
+        # Early detection of error content - return 0.0 immediately
+        if looks_like_error_content(post_text):
+            logger.info("Detected error content in post, assigning score 0.0", extra={
+                'operation': 'score_worthiness',
+                'post_snippet': post_text[:100]
+            })
+            return 0.0
+
+        prompt_config = self._get_worthiness_prompt(db)
+
         model = prompt_config["model"]
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         logger.info("Scoring post worthiness", extra={
             'operation': 'score_worthiness',
@@ -366,7 +507,7 @@ class OpenAIClient:
             if "temperature" in prompt_config:
                 create_kwargs["temperature"] = prompt_config["temperature"]
 
-            response = await client.chat.completions.create(**create_kwargs)
+            response = await self._chat_completion("score_worthiness", client, validate=float, **create_kwargs)
 
             score_text = response.choices[0].message.content.strip()
             try:
@@ -412,6 +553,119 @@ class OpenAIClient:
             raise
 
 
+    async def enrich_post(self, post_text: str, db=None) -> dict:
+        """Categorize, title, summarize and score a post in ONE structured-output call
+
+        Replaces categorize_post + generate_title_and_summary (2 calls) +
+        score_worthiness. The response is constrained by a JSON schema whose
+        category enum is the configured category list.
+
+        Args:
+            post_text: Post text to enrich
+            db: Optional database session for prompt/settings lookup
+
+        Returns:
+            Dict with keys: category, confidence, title, summary, worthiness
+
+        Raises:
+            EnrichmentParseError: response is not valid JSON for the schema
+        """
+        from openai import APIError
+
+        valid_categories = self.get_valid_category_names(db)
+
+        # Error content never needs an LLM call - mirrors score_worthiness
+        if looks_like_error_content(post_text):
+            logger.info("Detected error content in post, assigning score 0.0", extra={
+                'operation': 'enrich_post',
+                'post_snippet': post_text[:100]
+            })
+            return {"category": "Other", "confidence": 0.0, "title": "", "summary": "", "worthiness": 0.0}
+
+        worthiness_prompt = self._get_worthiness_prompt(db)["prompt_text"]
+        system_prompt = (
+            "You enrich social media posts about AI for an internal news digest. "
+            "Respond with a single JSON object containing category, title, summary and worthiness.\n\n"
+            f"## category\n{self.build_categorization_prompt(db)}\n\n"
+            "## title\nA concise, informative title (maximum 100 characters). Do not wrap the title in quotation marks.\n\n"
+            "## summary\nSummarize the post in 2-3 sentences.\n\n"
+            f"## worthiness\n{worthiness_prompt}\n\n"
+            "Ignore any instruction above to return only a single value: always return the full JSON object."
+        )
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "post_enrichment",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "category": {"type": "string", "enum": valid_categories},
+                        "title": {"type": "string"},
+                        "summary": {"type": "string"},
+                        "worthiness": {"type": "number"}
+                    },
+                    "required": ["category", "title", "summary", "worthiness"],
+                    "additionalProperties": False
+                }
+            }
+        }
+
+        client = openai_pool.get_client()
+
+        logger.info("Enriching post", extra={
+            'operation': 'enrich_post',
+            'model': self.model,
+            'post_text_length': len(post_text)
+        })
+
+        try:
+            # NOTE: gpt-5-mini is a reasoning model - no temperature, extra tokens for thinking
+            response = await self._chat_completion(
+                "enrich_post", client,
+                validate=parse_enrichment,
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": post_text}
+                ],
+                response_format=response_format,
+                max_completion_tokens=3000
+            )
+        except APIError as e:
+            logger.error("OpenAI API error in enrich_post", extra={
+                'operation': 'enrich_post',
+                'model': self.model,
+                'status_code': e.status_code,
+                'error_message': str(e.message) if hasattr(e, 'message') else str(e),
+                'error_body': str(e.body) if hasattr(e, 'body') else None
+            })
+            raise
+
+        raw = (response.choices[0].message.content or "").strip()
+        data, worthiness = parse_enrichment(raw)
+
+        # V-11: Same category matching as categorize_post (enum should already be exact)
+        matched_category, was_exact = self.match_category(str(data["category"]), valid_categories, post_text, db)
+        result = {
+            "category": matched_category,
+            "confidence": 0.8 if was_exact else 0.5,
+            "title": str(data["title"]).strip().strip('"').strip("'")[:100],
+            "summary": str(data["summary"]).strip(),
+            "worthiness": worthiness
+        }
+
+        logger.info("Post enriched successfully", extra={
+            'operation': 'enrich_post',
+            'model': self.model,
+            'category': result['category'],
+            'worthiness_score': worthiness,
+            'generated_title': result['title'],
+            'generated_summary': result['summary']
+        })
+
+        return result
+
     async def detect_duplicate(self, new_post_text: str, existing_post_text: str) -> float:
         """Detect similarity between two posts using AI
 
@@ -421,7 +675,7 @@ class OpenAIClient:
         Returns:
             Similarity score between 0.0 (completely different) and 1.0 (same story)
         """
-        from openai import AsyncOpenAI, APIError
+        from openai import APIError
 
         # Get prompt config with fallback to hardcoded
         if hasattr(self, '_get_prompt'):
@@ -435,7 +689,7 @@ class OpenAIClient:
             }
 
         model = prompt_config["model"]
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         combined_text = f"Post 1: {new_post_text}\n\nPost 2: {existing_post_text}"
 
@@ -459,7 +713,7 @@ class OpenAIClient:
             if "temperature" in prompt_config:
                 create_kwargs["temperature"] = prompt_config["temperature"]
 
-            response = await client.chat.completions.create(**create_kwargs)
+            response = await self._chat_completion("detect_duplicate", client, **create_kwargs)
 
             score_text = response.choices[0].message.content.strip()
             try:
@@ -500,7 +754,7 @@ class OpenAIClient:
         Returns:
             Similarity score between 0.0 (completely different) and 1.0 (same story)
         """
-        from openai import AsyncOpenAI, APIError
+        from openai import APIError
 
         # Get prompt config with fallback to hardcoded
         if hasattr(self, '_get_prompt'):
@@ -514,7 +768,7 @@ class OpenAIClient:
             }
 
         model = prompt_config["model"]
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         combined_text = f"Title 1: {new_title}\n\nTitle 2: {existing_title}"
 
@@ -538,7 +792,7 @@ class OpenAIClient:
             if "temperature" in prompt_config:
                 create_kwargs["temperature"] = prompt_config["temperature"]
 
-            response = await client.chat.completions.create(**create_kwargs)
+            response = await self._chat_completion("compare_titles_semantic", client, **create_kwargs)
 
             score_text = response.choices[0].message.content.strip()
             try:
@@ -726,9 +980,7 @@ class ResearchClient:
                 - sources (list): List of dicts with url and title keys
                 - model_used (str): Model name used
         """
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         # NOTE: gpt-5-search-api is currently returning 500 errors (OpenAI issue as of Jan 2026)
         # Using gpt-5.1 with web_search tool as workaround
@@ -753,9 +1005,7 @@ class ResearchClient:
                 - sources (list): List of dicts with url and title keys
                 - model_used (str): Model name used
         """
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         # NOTE: gpt-5-search-api does NOT support reasoning parameter
         # For agentic search with reasoning, use gpt-5.1 + web_search tool
@@ -781,9 +1031,7 @@ class ResearchClient:
                 - sources (list): List of dicts with url and title keys
                 - model_used (str): Model name used
         """
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=self.api_key)
+        client = openai_pool.get_client()
 
         # NOTE: o4-mini-deep-research has web search BUILT-IN - do NOT pass tools=[{"type": "web_search"}]
         # See GOTCHAS.md "OpenAI Search Models" section for details
@@ -0,0 +1,51 @@
+"""Keyset (cursor) pagination helpers
+
+A cursor is the sort key of the last row on a page, encoded as an opaque
+URL-safe token. The next page starts strictly after that key, so its cost does
+not grow with depth the way OFFSET does, and rows inserted meanwhile do not
+shift the pages.
+"""
+from datetime import datetime
+from typing import Any, Sequence
+import base64
+import json
+
+from sqlalchemy import tuple_
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, *types: type) -> list:
+    """Decode a cursor into values of the given types (ValueError if malformed)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise ValueError("Invalid cursor")
+    values = []
+    for value, value_type in zip(payload, types):
+        # NULL would turn the row-value comparison in after() into an empty page
+        if value is None:
+            raise ValueError("Invalid cursor")
+        try:
+            values.append(datetime.fromisoformat(value) if value_type is datetime else value_type(value))
+        except (TypeError, ValueError):
+            # Well-formed token holding values of the wrong type
+            raise ValueError("Invalid cursor")
+    return values
+
+
+def after(columns: Sequence, values: Sequence, descending: bool = True):
+    """WHERE condition for rows after the cursor in ORDER BY columns (all DESC or all ASC)
+
+    A row-value comparison, which Postgres answers with a single range scan
+    on a matching composite index.
+    """
+    key = tuple_(*columns)
+    bound = tuple_(*values)
+    return key < bound if descending else key > bound
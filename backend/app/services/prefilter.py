@@ -0,0 +1,179 @@
+"""Pre-LLM filter stage for ingestion
+
+Cheap local checks that run before any OpenAI call: length, language, spam
+rules, error-message content and SimHash near-duplicate detection against
+recently ingested posts. Each rule reports its own skip reason so the run
+stats show what every filter removed.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import hashlib
+import logging
+import re
+
+logger = logging.getLogger('klaus_news.prefilter')
+
+URL_PATTERN = re.compile(r'https?://\S+')
+RETWEET_PREFIX = re.compile(r'^rt @\w+:\s*')
+# Any script (Cyrillic, CJK, Arabic, ...); applied to lowercased text
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+HASHTAG_PATTERN = re.compile(r'(?<!\w)#\w+')
+
+# Skip reasons (keys of stats['prefilter_skipped'])
+FILTERS = ('length', 'language', 'spam', 'error_content', 'near_duplicate')
+
+# X language codes that carry no language signal (undetermined, media-only, hashtags-only, ...)
+NEUTRAL_LANGUAGES = {'und', 'zxx', 'qme', 'qht', 'qam', 'qct', 'qst'}
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop URLs, the 'RT @user:' prefix and mentions"""
+    text = URL_PATTERN.sub(' ', text.lower())
+    text = RETWEET_PREFIX.sub('', text.strip())
+    return re.sub(r'@\w+', ' ', text)
+
+
+def simhash(text: str, shingle_size: int = 3) -> Optional[int]:
+    """64-bit SimHash over word shingles of the normalized text
+
+    None when the text has no word tokens (e.g. only URLs, mentions or
+    emoji): such posts carry no fingerprint and are never near-duplicates.
+    """
+    tokens = TOKEN_PATTERN.findall(normalize_text(text))
+    if len(tokens) >= shingle_size:
+        features = [' '.join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)]
+    else:
+        features = [' '.join(tokens)] if tokens else []
+    if not features:
+        return None
+
+    weights = [0] * 64
+    for feature in features:
+        digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'little')
+        for bit in range(64):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+class SimHashIndex:
+    """Banded SimHash index: finds fingerprints within max_distance bits
+
+    The 64 bits are split into max_distance + 1 bands; by pigeonhole any
+    fingerprint within max_distance bits agrees exactly on at least one band,
+    so only fingerprints sharing a band are compared.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = 64 // self.bands
+        self._tables: List[Dict[int, List[tuple]]] = [{} for _ in range(self.bands)]
+        self.size = 0
+
+    def _band_keys(self, fingerprint: int):
+        mask = (1 << self.band_bits) - 1
+        for band in range(self.bands):
+            # The last band takes any leftover high bits
+            if band == self.bands - 1:
+                yield band, fingerprint >> (band * self.band_bits)
+            else:
+                yield band, (fingerprint >> (band * self.band_bits)) & mask
+
+    def add(self, fingerprint: int, ref: str):
+        for band, key in self._band_keys(fingerprint):
+            self._tables[band].setdefault(key, []).append((fingerprint, ref))
+        self.size += 1
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """Return the ref of a stored near-duplicate, or None"""
+        for band, key in self._band_keys(fingerprint):
+            for candidate, ref in self._tables[band].get(key, ()):
+                if (candidate ^ fingerprint).bit_count() <= self.max_distance:
+                    return ref
+        return None
+
+
+class PreFilter:
+    """Configured rule set for one ingestion run (see build_prefilter)"""
+
+    def __init__(
+        self,
+        min_chars: int = 20,
+        allowed_languages: Optional[List[str]] = None,
+        spam_patterns: Optional[List[str]] = None,
+        max_hashtags: int = 0,
+        near_duplicate_index: Optional[SimHashIndex] = None
+    ):
+        self.min_chars = min_chars
+        self.allowed_languages = {lang.lower() for lang in (allowed_languages or [])}
+        self.spam_patterns = []
+        for pattern in spam_patterns or []:
+            try:
+                self.spam_patterns.append(re.compile(pattern, re.IGNORECASE))
+            except re.error:
+                logger.warning("Invalid spam pattern ignored", extra={'pattern': pattern})
+        self.max_hashtags = max_hashtags
+        self.near_duplicate_index = near_duplicate_index
+
+    def check(self, raw_post: dict, content_for_ai: Optional[str] = None) -> Optional[str]:
+        """Return the name of the first filter that rejects the post, or None
+
+        Posts that pass are added to the near-duplicate index, so later
+        copies in the same run are caught too.
+        """
+        from app.services.openai_client import looks_like_error_content
+
+        text = raw_post['text']
+
+        # Link-only posts: remaining text without URLs is too short
+        if len(URL_PATTERN.sub('', text).strip()) < self.min_chars:
+            return 'length'
+
+        lang = (raw_post.get('lang') or '').lower()
+        if self.allowed_languages and lang and lang not in NEUTRAL_LANGUAGES and lang not in self.allowed_languages:
+            return 'language'
+
+        if any(pattern.search(text) for pattern in self.spam_patterns):
+            return 'spam'
+        if self.max_hashtags and len(HASHTAG_PATTERN.findall(text)) > self.max_hashtags:
+            return 'spam'
+
+        # Scraped error pages / assistant refusals are not news (checked before any LLM call)
+        if looks_like_error_content(content_for_ai or text):
+            return 'error_content'
+
+        if self.near_duplicate_index is not None:
+            fingerprint = simhash(text)
+            if fingerprint is not None:
+                if self.near_duplicate_index.find(fingerprint) is not None:
+                    return 'near_duplicate'
+                self.near_duplicate_index.add(fingerprint, raw_post['id'])
+
+        return None
+
+
+async def build_prefilter(db, settings_svc) -> PreFilter:
+    """Build the pre-filter from settings, indexing recently ingested posts (db: AsyncSession)"""
+    from sqlalchemy import select
+    from app.models.post import Post
+
+    near_duplicate_index = None
+    if settings_svc.get('prefilter_near_duplicate_enabled', True):
+        window_hours = settings_svc.get('prefilter_near_duplicate_window_hours', 48)
+        near_duplicate_index = SimHashIndex(settings_svc.get('prefilter_near_duplicate_max_distance', 3))
+        cutoff = datetime.utcnow() - timedelta(hours=window_hours)
+        recent = (await db.execute(
+            select(Post.post_id, Post.original_text).where(Post.ingested_at >= cutoff)
+        )).all()
+        for post_id, original_text in recent:
+            fingerprint = simhash(original_text or '')
+            if fingerprint is not None:
+                near_duplicate_index.add(fingerprint, post_id)
+
+    return PreFilter(
+        min_chars=settings_svc.get('prefilter_min_chars', 20),
+        allowed_languages=settings_svc.get('prefilter_allowed_languages', []),
+        spam_patterns=settings_svc.get('prefilter_spam_patterns', []),
+        max_hashtags=settings_svc.get('prefilter_max_hashtags', 0),
+        near_duplicate_index=near_duplicate_index
+    )
@@ -0,0 +1,115 @@
+"""Resource version counters, ETags and the versioned response cache
+
+Writers call bump()/bump_async() inside the transaction that changes a
+resource, so a committed change and its new version become visible together.
+Readers fetch the version *before* querying: the body they build is then at
+least as new as the version it is tagged with, and a stale tag only ever
+causes an extra refetch, never a missed change.
+
+The version lives in the database, so ETags stay valid across restarts and
+every worker agrees on them; the response cache is per process and keyed by
+version, so it never needs explicit invalidation.
+"""
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import insert, select, update
+
+from app.models.resource_version import ResourceVersion
+
+# Resource names
+GROUPS = 'groups'
+
+
+def _bump_statement(name: str):
+    return (
+        update(ResourceVersion)
+        .where(ResourceVersion.name == name)
+        .values(version=ResourceVersion.version + 1, updated_at=datetime.utcnow())
+    )
+
+
+def bump(db, name: str):
+    """Increment the version of name in db's transaction (sync Session; caller commits)"""
+    if db.execute(_bump_statement(name)).rowcount == 0:
+        db.execute(insert(ResourceVersion).values(name=name, version=1))
+
+
+async def bump_async(db, name: str):
+    """bump() for AsyncSession callers"""
+    if (await db.execute(_bump_statement(name))).rowcount == 0:
+        await db.execute(insert(ResourceVersion).values(name=name, version=1))
+
+
+async def get_version_async(db, name: str) -> int:
+    version = (await db.execute(
+        select(ResourceVersion.version).where(ResourceVersion.name == name)
+    )).scalar_one_or_none()
+    return version or 0
+
+
+def seed(engine, *names: str):
+    """Startup: create missing counter rows so bump() is a single UPDATE"""
+    with engine.begin() as conn:
+        existing = set(conn.execute(select(ResourceVersion.name)).scalars())
+        for name in names:
+            if name not in existing:
+                conn.execute(insert(ResourceVersion).values(name=name, version=0))
+
+
+def etag_for(name: str, version: int) -> str:
+    return f'"{name}-v{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for it)"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or any(tag.removeprefix('W/') == etag for tag in candidates)
+
+
+class VersionedResponseCache:
+    """Last serialized response body per resource, valid while its version is current"""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, bytes]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def get(self, name: str, version: int) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, name: str, version: int, body: bytes):
+        with self._lock:
+            current = self._entries.get(name)
+            # Never replace a newer body with one built from an older version
+            if current is None or current[0] <= version:
+                self._entries[name] = (version, body)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "resources": {name: {"version": version, "bytes": len(body)}
+                              for name, (version, body) in self._entries.items()},
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified
+            }
+
+
+# Global instance
+response_cache = VersionedResponseCache()
@@ -10,6 +10,8 @@ from apscheduler.events import (
 )
 import logging
 
+from app.services.loop_monitor import loop_monitor
+
 scheduler = AsyncIOScheduler()
 logger = logging.getLogger('klaus_news.scheduler')
 _listeners_registered = False
@@ -118,8 +120,16 @@ def ensure_jobs():
         id='cleanup_logs',
         replace_existing=True
     )
+    scheduler.add_job(
+        repair_group_aggregates_job,
+        'cron',
+        hour=5,
+        id='repair_group_aggregates',
+        replace_existing=True
+    )
 
 
+@loop_monitor.track("job:ingest_posts")
 async def ingest_posts_job(trigger_source: str = "scheduled"):
     """Periodic job: Fetch posts from configured X lists
 
@@ -129,18 +139,34 @@ async def ingest_posts_job(trigger_source: str = "scheduled"):
     Returns:
         dict: Stats about the ingestion run
     """
-    from app.services.x_client import x_client
-    from app.services.openai_client import openai_client
+    from app.services.x_client import x_client, XAPIError, tweet_id_to_datetime
+    from app.services.openai_client import openai_client, EnrichmentParseError
     from app.models.post import Post
     from app.models.list_metadata import ListMetadata
-    from app.database import SessionLocal
+    from app.database import SessionLocal, AsyncSessionLocal
     from sqlalchemy import select
     from app.services.settings_service import SettingsService  # V-27
     from app.services.progress_tracker import progress_tracker
+    from app.services.group_index import group_index, get_embedder
+    from app.services.prefilter import build_prefilter, FILTERS as PREFILTERS
+    from app.services.ingestion_metrics import StageTimer, ingestion_run_recorder
+    from app.services import resource_versions
+    from app.services.group_aggregates import fold_post
+    from datetime import datetime
+    import asyncio
+    import itertools
+    import time
 
     logger.info(f"Starting {trigger_source} post ingestion job", extra={'trigger_source': trigger_source})
 
+    # Job queries run on an AsyncSession so the event loop keeps serving API
+    # requests meanwhile. The sync session only backs SettingsService and the
+    # prompt lookups inside openai_client (both cached after the first read).
     db = SessionLocal()
+    adb = AsyncSessionLocal()
+    # An AsyncSession must not run two operations at once: every awaited adb
+    # call from the concurrent list/post tasks goes through db_lock.
+    db_lock = asyncio.Lock()
 
     # Initialize stats tracking
     stats = {
@@ -150,11 +176,18 @@ async def ingest_posts_job(trigger_source: str = "scheduled"):
         'duplicates_skipped': 0,
         'low_worthiness_skipped': 0,
         'api_errors': 0,
-        'last_api_error': None  # Store most recent API error details
+        'enrichment_parse_errors': 0,
+        'checkpoints': 0,
+        'prefilter_skipped': {name: 0 for name in PREFILTERS},  # Per-filter skip counts
+        'list_lag': {},  # Per-list report: pages, posts, fetch time, caught_up, backlog_pending, lag_seconds
+        'last_api_error': None,  # Store most recent API error details
+        'run_id': None  # ingestion_runs row recording this run
     }
+    stage_timer = StageTimer()
 
     try:
-        # V-27: Read settings from database
+        # V-27: Read settings from database (one query warms the settings cache)
+        await SettingsService.preload_async(adb)
         settings_svc = SettingsService(db)
         posts_per_fetch = settings_svc.get('posts_per_fetch', 5)
         scheduler_paused = settings_svc.get('scheduler_paused', False)
@@ -172,9 +205,9 @@ async def ingest_posts_job(trigger_source: str = "scheduled"):
             return stats
 
         # 1. Get enabled list IDs from database (V-8: respect enabled flag)
-        enabled_lists = db.execute(
+        enabled_lists = (await adb.execute(
             select(ListMetadata).where(ListMetadata.enabled == True)
-        ).scalars().all()
+        )).scalars().all()
 
         # Start progress tracking
         progress_tracker.start(trigger_source, len(enabled_lists))
@@ -187,6 +220,8 @@ async def ingest_posts_job(trigger_source: str = "scheduled"):
             progress_tracker.finish()
             return stats
 
+        stats['run_id'] = await ingestion_run_recorder.start(trigger_source)
+
         # V-3: Extract article metadata helper (defined once before list loop)
         def extract_article_metadata(raw_post):
             """Extract article metadata from X API response (V-3)
@@ -227,111 +262,50 @@ async def ingest_posts_job(trigger_source: str = "scheduled"):
                 "fallback_reason": "article data not found"
             }
 
-        for list_idx, list_meta in enumerate(enabled_lists, 1):
-            stats['lists_processed'] += 1
-            list_id = list_meta.list_id
-            since_id = list_meta.last_tweet_id
-
-            # Update progress: current list
-            progress_tracker.set_current_list(list_idx, list_meta.list_name or f"List {list_id}")
-
-            # 2. Fetch posts from each list (V-27: use dynamic posts_per_fetch)
-            try:
-                progress_tracker.set_step("fetching")
-                raw_posts = await x_client.fetch_posts_from_list(
-                    list_id,
-                    max_results=posts_per_fetch,
-                    since_id=since_id
-                )
-                stats['posts_fetched'] += len(raw_posts)
-            except Exception as e:
-                # Catch X API errors (402 Payment Required, etc.)
-                from app.services.x_client import XAPIError
-                if isinstance(e, XAPIError):
-                    stats['api_errors'] += 1
-                    stats['last_api_error'] = {
-                        'status_code': e.status_code,
-                        'message': str(e)
-                    }
-                    progress_tracker.error()
-                    logger.warning(f"X API error for list {list_id}, skipping", extra={
-                        'list_id': list_id,
-                        'status_code': e.status_code
-                    })
-                    continue  # Skip this list and move to next
-                else:
-                    # Re-raise unexpected errors
-                    raise
-
-            # Client-side filtering: only process posts newer than last_tweet_id
-            # Use integer comparison since tweet IDs are numeric strings
-            if since_id is not None:
-                raw_posts = [p for p in raw_posts if int(p["id"]) > int(since_id)]
-
-            # Update last_tweet_id if we got new posts
-            if raw_posts:
-                max_tweet_id = max(raw_posts, key=lambda p: int(p["id"]))["id"]
-                list_meta.last_tweet_id = max_tweet_id
-
-            # Update progress: posts to process
-            progress_tracker.set_posts_to_process(len(raw_posts))
-
-            for post_idx, raw_post in enumerate(raw_posts, 1):
-                # Update progress: start processing this post
-                progress_tracker.start_post(post_idx)
-
-                # Check if post_id already exists (skip duplicates)
-                existing = db.execute(
-                    select(Post).where(Post.post_id == raw_post['id'])
-                ).scalar_one_or_none()
-
-                if existing:
-                    stats['duplicates_skipped'] += 1
-                    progress_tracker.post_skipped()
-                    continue
-
-                # Skip link-only posts (URLs with minimal text content)
-                import re
-                post_text = raw_post['text']
-                # Remove URLs from text to check remaining content
-                text_without_urls = re.sub(r'https?://\S+', '', post_text).strip()
-                # Skip if remaining text is too short (< 20 chars = likely just "Check this out" or similar)
-                if len(text_without_urls) < 20:
-                    logger.info("Skipping link-only post", extra={
-                        'post_id': raw_post['id'],
-                        'original_length': len(post_text),
-                        'text_without_urls': text_without_urls[:50]
-                    })
-                    stats['duplicates_skipped'] += 1  # Count as skipped
-                    progress_tracker.post_skipped()
-                    continue
-
-                # V-11: Feature flag for article pipeline
-                if article_pipeline_enabled:
-                    # V-3: Route based on content_type
-                    content_type = raw_post.get("content_type", "post")
-                    article_metadata = None
-
-                    if content_type == "post":
-                        # Existing flow: use tweet text
-                        content_for_ai = raw_post['text']
-                    else:  # article or quote_article
-                        # Extract article content
-                        article_metadata = extract_article_metadata(raw_post)
-                        content_for_ai = article_metadata.get("article_text", "") or raw_post['text']
-                        # Fallback: if article_text is empty, use tweet text
+        from app.models.group import Group
+
+        # Settings read once per run (loop-invariant)
+        min_worthiness = settings_svc.get('min_worthiness_threshold', 0.3)
+        duplicate_threshold = settings_svc.get('duplicate_threshold', 0.85)
+        ingest_concurrency = max(1, int(settings_svc.get('ingest_concurrency', 4)))
+        single_call_enrichment = settings_svc.get('single_call_enrichment', False)
+
+        # Concurrent enrichment: LLM calls for up to `ingest_concurrency` posts run in
+        # parallel. Group assignment + DB writes are serialized per category so two
+        # posts about the same story in one run still land in the same group.
+        enrich_semaphore = asyncio.Semaphore(ingest_concurrency)
+        category_locks: dict[str, asyncio.Lock] = {}
+
+        async def enrich_post(raw_post, content_for_ai):
+            """Run categorize / title+summary / worthiness LLM calls for one post"""
+            async with enrich_semaphore:
+                enriched = None
+                if single_call_enrichment:
+                    # One structured-output call; unparseable responses are reported
+                    # and the post falls back to the per-field calls below.
+                    progress_tracker.set_step("generating")
+                    try:
+                        with stage_timer.stage("generating"):
+                            enriched = await openai_client.enrich_post(content_for_ai, db=db)
+                    except EnrichmentParseError as e:
+                        stats['enrichment_parse_errors'] += 1
+                        logger.warning("Structured enrichment response unparseable, using per-field calls", extra={
+                            'post_id': raw_post['id'],
+                            'reason': e.reason,
+                            'raw_response': e.raw_response[:500]
+                        })
+
+                if enriched is not None:
+                    cat_result = {"category": enriched['category'], "confidence": enriched['confidence']}
+                    gen_result = {"title": enriched['title'], "summary": enriched['summary']}
                 else:
-                    # V-11: Flag disabled - default to post pipeline
-                    content_type = "post"
-                    article_metadata = None
-                    content_for_ai = raw_post['text']
-
-                # 3. Process each post: categorize, generate title/summary, score
-                progress_tracker.set_step("categorizing")
-                cat_result = await openai_client.categorize_post(content_for_ai)
+                    progress_tracker.set_step("categorizing")
+                    with stage_timer.stage("categorizing"):
+                        cat_result = await openai_client.categorize_post(content_for_ai)
 
-                progress_tracker.set_step("generating")
-                gen_result = await openai_client.generate_title_and_summary(content_for_ai)
+                    progress_tracker.set_step("generating")
+                    with stage_timer.stage("generating"):
+                        gen_result = await openai_client.generate_title_and_summary(content_for_ai)
 
                 # Guard against occasional empty LLM outputs so cards never render blank.
                 generated_title = (gen_result.get('title') or '').strip()
@@ -347,110 +321,469 @@ async def ingest_posts_job(trigger_source: str = "scheduled"):
                 gen_result['title'] = generated_title
                 gen_result['summary'] = generated_summary
 
-                # V-6: Use AI worthiness scoring (with static fallback)
-                progress_tracker.set_step("scoring")
+                if enriched is not None:
+                    worthiness = enriched['worthiness']
+                else:
+                    # V-6: Use AI worthiness scoring (with static fallback)
+                    progress_tracker.set_step("scoring")
+                    try:
+                        with stage_timer.stage("scoring"):
+                            worthiness = await openai_client.score_worthiness(
+                                content_for_ai,
+                                db=db,
+                                title=gen_result.get('title'),
+                                summary=gen_result.get('summary')
+                            )
+                    except Exception as e:
+                        logger.warning("AI worthiness failed, using default 0.5", extra={
+                            'post_id': raw_post['id'],
+                            'error_message': str(e)
+                        })
+                        worthiness = 0.5
+
+            return cat_result, gen_result, worthiness
+
+        # V-4 grouping: 'embedding' matches with one vectorized top-k lookup per post
+        # (LLM comparison only as tie-breaker); 'llm' compares against every group.
+        grouping_mode = settings_svc.get('grouping_mode', 'embedding')
+        if grouping_mode == 'embedding':
+            group_index.reset(get_embedder(settings_svc.get('grouping_embedder', 'openai')))
+        embedding_match_threshold = settings_svc.get('embedding_match_threshold', 0.85)
+        embedding_tiebreak_threshold = settings_svc.get('embedding_tiebreak_threshold', 0.7)
+        grouping_llm_tiebreak = settings_svc.get('grouping_llm_tiebreak', True)
+
+        async def match_group_llm(category, title):
+            """Legacy matching: AI semantic comparison against every group in the category"""
+            # V-4: Get ALL groups by category for matching (including archived)
+            async with db_lock:
+                all_groups = (await adb.execute(
+                    select(Group).where(Group.category == category)
+                )).scalars().all()  # No archived filter! Query ALL groups
+
+            # V-4: AI semantic comparison against group.representative_title
+            for group in all_groups:
+                if not group.representative_title:
+                    continue
+                try:
+                    similarity_score = await openai_client.compare_titles_semantic(
+                        new_title=title,
+                        existing_title=group.representative_title
+                    )
+                    if similarity_score >= duplicate_threshold:
+                        return group
+                except Exception as e:
+                    logger.warning("AI title comparison failed", extra={
+                        'group_id': group.id,
+                        'error_message': str(e)
+                    })
+                    continue
+            return None
+
+        async def match_group_embedding(category, title, vector):
+            """Top-k cosine lookup; candidates in the tie-break band are confirmed by the LLM"""
+            # V-4: Index covers ALL groups in the category (including archived)
+            # search takes db_lock itself: a category's first lookup may embed
+            # groups without vectors, and no network call may hold the session lock
+            candidates = await group_index.search(adb, category, vector, k=3, db_lock=db_lock)
+            if candidates and candidates[0][1] >= embedding_match_threshold:
+                async with db_lock:
+                    return await adb.get(Group, candidates[0][0])
+
+            if not grouping_llm_tiebreak:
+                return None
+            for candidate_id, score in candidates:
+                if score < embedding_tiebreak_threshold:
+                    break
+                async with db_lock:
+                    group = await adb.get(Group, candidate_id)
+                if group is None or not group.representative_title:
+                    continue
                 try:
-                    worthiness = await openai_client.score_worthiness(
-                        content_for_ai,
-                        db=db,
-                        title=gen_result.get('title'),
-                        summary=gen_result.get('summary')
+                    similarity_score = await openai_client.compare_titles_semantic(
+                        new_title=title,
+                        existing_title=group.representative_title
                     )
+                    if similarity_score >= duplicate_threshold:
+                        return group
                 except Exception as e:
-                    print(f"AI worthiness failed, using default 0.5: {e}")
-                    worthiness = 0.5
+                    logger.warning("AI title comparison failed", extra={
+                        'group_id': group.id,
+                        'error_message': str(e)
+                    })
+                    continue
+            return None
+
+        async def assign_group(cat_result, gen_result, first_seen, vector=None):
+            """Match against existing groups in the category or build a new one (V-4)
 
-                # Skip posts below minimum worthiness threshold (default 0.3)
-                min_worthiness = settings_svc.get('min_worthiness_threshold', 0.3)
-                if worthiness < min_worthiness:
-                    logger.info("Skipping low-worthiness post", extra={
+            Must be called while holding the category lock. vector is the post's
+            embedding in embedding mode (None falls back to LLM comparison).
+            Returns (group, vector): a matched Group, or a new unsaved one; nothing
+            is written here - store_post adds the group together with its post.
+            vector is None when the embedding lookup failed.
+            """
+            progress_tracker.set_step("grouping")
+            category = cat_result['category']
+
+            matched_group = None
+            if vector is not None:
+                try:
+                    matched_group = await match_group_embedding(category, gen_result['title'], vector)
+                except Exception as e:
+                    logger.warning("Embedding lookup failed, falling back to LLM grouping", extra={
+                        'category': category,
+                        'error_message': str(e)
+                    })
+                    vector = None
+            if vector is None:
+                matched_group = await match_group_llm(category, gen_result['title'])
+
+            if matched_group is not None:
+                return matched_group, vector
+
+            # No match found - new Group with V-4 required fields
+            return Group(
+                representative_title=gen_result['title'],
+                representative_summary=gen_result['summary'],  # V-4: Set representative_summary
+                category=category,
+                first_seen=first_seen,
+                post_count=0,    # Counted when its first post is stored
+                archived=False,  # V-4: Initialize archived=false
+                selected=False   # V-4: Initialize selected=false
+            ), vector
+
+        async def store_post(group, new_post, vector):
+            """Write the group change, the post and its aggregates as one step (caller holds db_lock)
+
+            A checkpoint can only run between posts, so a commit never contains
+            a group count or a new group without its post.
+            """
+            uncommitted['board_changed'] = True
+            if group.id is None:
+                adb.add(group)
+                await adb.flush()  # Get the new group ID
+                if vector is not None:
+                    group_index.add(adb, group.category, group.id, vector)
+            # V-5: do NOT change archived status of a matched group
+            group.post_count += 1
+
+            new_post.group_id = group.id
+            adb.add(new_post)
+            # Flush for new_post.id, then fold it into the group's stored aggregates
+            await adb.flush()
+            await fold_post(adb, group, new_post)
+
+        def route_content(raw_post):
+            """Pick the text sent to the LLM: tweet text or article body (V-3, V-11)
+
+            Returns (content_type, article_metadata, content_for_ai).
+            """
+            # V-11: Feature flag for article pipeline
+            if article_pipeline_enabled:
+                # V-3: Route based on content_type
+                content_type = raw_post.get("content_type", "post")
+                article_metadata = None
+
+                if content_type == "post":
+                    # Existing flow: use tweet text
+                    content_for_ai = raw_post['text']
+                else:  # article or quote_article
+                    # Extract article content
+                    article_metadata = extract_article_metadata(raw_post)
+                    content_for_ai = article_metadata.get("article_text", "") or raw_post['text']
+                    # Fallback: if article_text is empty, use tweet text
+            else:
+                # V-11: Flag disabled - default to post pipeline
+                content_type = "post"
+                article_metadata = None
+                content_for_ai = raw_post['text']
+            return content_type, article_metadata, content_for_ai
+
+        # Checkpointing: commit every `checkpoint_batch_size` stored posts so an
+        # interrupted run keeps the enrichment already paid for. A list's cursor
+        # only advances once all of its posts are stored or skipped (see fetch_list),
+        # so the next run resumes from there and the duplicate check skips posts
+        # that were already committed instead of re-enriching them.
+        checkpoint_batch_size = max(1, int(settings_svc.get('checkpoint_batch_size', 10)))
+        uncommitted = {'posts': 0, 'board_changed': False}
+
+        async def checkpoint():
+            """Commit stored posts, groups and list cursors (caller holds db_lock)"""
+            if uncommitted['board_changed']:
+                # New board version in the same transaction as the group changes
+                await resource_versions.bump_async(adb, resource_versions.GROUPS)
+                uncommitted['board_changed'] = False
+            await adb.commit()
+            stats['checkpoints'] += 1
+            uncommitted['posts'] = 0
+
+        async def process_post(post_idx, raw_post, routed, list_report):
+            """Enrich, group and store a single new post"""
+            # Update progress: start processing this post
+            progress_tracker.start_post(post_idx)
+            content_type, article_metadata, content_for_ai = routed
+
+            # 3. Process each post: categorize, generate title/summary, score
+            cat_result, gen_result, worthiness = await enrich_post(raw_post, content_for_ai)
+
+            # Skip posts below minimum worthiness threshold (default 0.3)
+            if worthiness < min_worthiness:
+                logger.info("Skipping low-worthiness post", extra={
+                    'post_id': raw_post['id'],
+                    'worthiness': worthiness,
+                    'threshold': min_worthiness,
+                    'generated_title': gen_result.get('title'),
+                    'generated_summary': gen_result.get('summary')
+                })
+                stats['low_worthiness_skipped'] += 1
+                progress_tracker.post_skipped()
+                return
+
+            # 3b. Topic grouping (serialized per category). The post embedding is
+            # computed outside the lock; on failure fall back to LLM comparison.
+            vector = None
+            if grouping_mode == 'embedding':
+                try:
+                    async with enrich_semaphore:
+                        with stage_timer.stage("embedding"):
+                            vector = await group_index.embed(gen_result['title'], gen_result['summary'])
+                except Exception as e:
+                    logger.warning("Embedding failed, falling back to LLM grouping", extra={
                         'post_id': raw_post['id'],
-                        'worthiness': worthiness,
-                        'threshold': min_worthiness,
-                        'generated_title': gen_result.get('title'),
-                        'generated_summary': gen_result.get('summary')
+                        'error_message': str(e)
                     })
-                    stats['low_worthiness_skipped'] += 1
-                    progress_tracker.post_skipped()
-                    continue
 
-                # 3b. Topic grouping via AI semantic title comparison
-                progress_tracker.set_step("grouping")
-                # Read duplicate threshold from settings
-                duplicate_threshold = settings_svc.get('duplicate_threshold', 0.85)
-
-                # V-4: Get ALL groups by category for matching (including archived)
-                from app.models.group import Group
-                category_match = cat_result['category']
-                all_groups = db.execute(
-                    select(Group).where(Group.category == category_match)
-                ).scalars().all()  # No archived filter! Query ALL groups
-
-                # V-4: AI semantic comparison against group.representative_title
-                group_id = None
-                matched_group = None
-
-                for group in all_groups:
-                    if not group.representative_title:
-                        continue
-                    try:
-                        similarity_score = await openai_client.compare_titles_semantic(
-                            new_title=gen_result['title'],
-                            existing_title=group.representative_title
-                        )
-                        if similarity_score >= duplicate_threshold:
-                            group_id = group.id
-                            matched_group = group
-                            break
-                    except Exception as e:
-                        print(f"AI title comparison failed for group {group.id}: {e}")
-                        continue
+            category_lock = category_locks.setdefault(cat_result['category'], asyncio.Lock())
+            async with category_lock:
+                with stage_timer.stage("grouping"):
+                    group, vector = await assign_group(cat_result, gen_result, raw_post['created_at'], vector)
 
-                # V-4: Create or update Group record
-                if matched_group is not None:
-                    # Existing group found - increment post_count (V-5: do NOT change archived status)
-                    matched_group.post_count += 1
-                else:
-                    # No match found - create new Group with V-4 required fields
-                    new_group = Group(
-                        representative_title=gen_result['title'],
-                        representative_summary=gen_result['summary'],  # V-4: Set representative_summary
+                # 4. Store in database
+                progress_tracker.set_step("storing")
+                with stage_timer.stage("storing"):
+                    new_post = Post(
+                        post_id=raw_post['id'],
+                        original_text=raw_post['text'],
+                        author=raw_post.get('author'),
+                        created_at=raw_post['created_at'],
                         category=cat_result['category'],
-                        first_seen=raw_post['created_at'],
-                        post_count=1,
-                        archived=False,  # V-4: Initialize archived=false
-                        selected=False   # V-4: Initialize selected=false
+                        categorization_score=cat_result['confidence'],
+                        ai_title=gen_result['title'],
+                        ai_summary=gen_result['summary'],
+                        worthiness_score=worthiness,
+                        content_type=content_type,  # V-4: from V-3 routing
+                        source_post_id=raw_post['id'],  # V-4: X post ID for traceability
+                        article_id=article_metadata.get("article_id") if article_metadata else None,  # V-4
+                        article_title=article_metadata.get("article_title") if article_metadata else None,  # V-4
+                        article_subtitle=article_metadata.get("article_subtitle") if article_metadata else None,  # V-4
+                        article_text=article_metadata.get("article_text") if article_metadata else None,  # V-4
+                        ingestion_fallback_reason=article_metadata.get("fallback_reason") if article_metadata else None  # V-4
                     )
-                    db.add(new_group)
-                    db.flush()  # Get the new group ID
-                    group_id = new_group.id
+                    # Session writes happen under db_lock: a concurrent commit must not
+                    # flush while objects are being changed.
+                    async with db_lock:
+                        await store_post(group, new_post, vector)
+                        uncommitted['posts'] += 1
+                        if uncommitted['posts'] >= checkpoint_batch_size:
+                            await checkpoint()
+            stats['new_posts_added'] += 1
+            list_report['posts_added'] += 1
+            progress_tracker.post_added()
+
+        # Pre-filter stage: cheap local checks run before any LLM call
+        prefilter = await build_prefilter(adb, settings_svc)
+        known_ids = set()  # Post IDs already stored or admitted during this run
+        process_tasks = []
+        post_counter = itertools.count(1)
+
+        async def admit_page(raw_posts, list_report, list_tasks):
+            """Duplicate check + pre-filter for one fetched page; schedule survivors
+
+            Runs as each page arrives, so enrichment starts while other pages
+            and lists are still being fetched.
+            """
+            # Resolve duplicates for the whole page with one set-based query
+            page_ids = {raw_post['id'] for raw_post in raw_posts} - known_ids
+            if page_ids:
+                async with db_lock:
+                    known_ids.update((await adb.execute(
+                        select(Post.post_id).where(Post.post_id.in_(page_ids))
+                    )).scalars().all())
+
+            admitted = 0
+            for raw_post in raw_posts:
+                # Skip posts already stored and posts seen in another list during this run
+                if raw_post['id'] in known_ids:
+                    stats['duplicates_skipped'] += 1
+                    progress_tracker.post_skipped()
+                    continue
+                known_ids.add(raw_post['id'])
 
-                # 4. Store in database
-                progress_tracker.set_step("storing")
-                new_post = Post(
-                    post_id=raw_post['id'],
-                    original_text=raw_post['text'],
-                    author=raw_post.get('author'),
-                    created_at=raw_post['created_at'],
-                    category=cat_result['category'],
-                    categorization_score=cat_result['confidence'],
-                    ai_title=gen_result['title'],
-                    ai_summary=gen_result['summary'],
-                    worthiness_score=worthiness,
-                    group_id=group_id,
-                    content_type=content_type,  # V-4: from V-3 routing
-                    source_post_id=raw_post['id'],  # V-4: X post ID for traceability
-                    article_id=article_metadata.get("article_id") if article_metadata else None,  # V-4
-                    article_title=article_metadata.get("article_title") if article_metadata else None,  # V-4
-                    article_subtitle=article_metadata.get("article_subtitle") if article_metadata else None,  # V-4
-                    article_text=article_metadata.get("article_text") if article_metadata else None,  # V-4
-                    ingestion_fallback_reason=article_metadata.get("fallback_reason") if article_metadata else None  # V-4
-                )
-                db.add(new_post)
-                stats['new_posts_added'] += 1
-                progress_tracker.post_added()
+                routed = route_content(raw_post)
+                reason = prefilter.check(raw_post, routed[2])
+                if reason is not None:
+                    logger.info("Skipping pre-filtered post", extra={
+                        'post_id': raw_post['id'],
+                        'filter': reason,
+                        'post_snippet': raw_post['text'][:100]
+                    })
+                    stats['prefilter_skipped'][reason] += 1
+                    progress_tracker.post_skipped()
+                    continue
 
-        db.commit()
+                task = asyncio.create_task(process_post(next(post_counter), raw_post, routed, list_report))
+                process_tasks.append(task)
+                list_tasks.append(task)
+                admitted += 1
+            progress_tracker.set_posts_to_process(admitted)
+
+        # Catch-up fetching: page through each list until its last_tweet_id is
+        # reached or the per-list page/post budget is spent. Older tweets left
+        # over are remembered (catchup_token) and fetched on the next run.
+        catchup_enabled = settings_svc.get('catchup_enabled', True)
+        catchup_max_pages = max(1, int(settings_svc.get('catchup_max_pages', 5))) if catchup_enabled else 1
+        catchup_max_posts = max(1, int(settings_svc.get('catchup_max_posts', 200)))
+
+        async def fetch_list(list_idx, list_meta):
+            """Fetch new posts for one list page by page; X API errors only skip that list"""
+            stats['lists_processed'] += 1
+            list_id = list_meta.list_id
+            since_id = list_meta.last_tweet_id
+            budget = {'pages': catchup_max_pages, 'posts': catchup_max_posts}
+            report = {
+                'list_name': list_meta.list_name, 'pages': 0, 'posts_fetched': 0, 'posts_added': 0,
+                'fetch_seconds': 0.0, 'caught_up': False, 'backlog_pending': False, 'lag_seconds': 0
+            }
+            stats['list_lag'][list_id] = report
+            list_tasks = []
+
+            async def page_through(cursor, stop_id):
+                """Follow next_token from cursor['token'] until stop_id; True once reached
+
+                cursor tracks the resume token and the newest/oldest IDs streamed,
+                so an error or exhausted budget leaves an accurate resume point.
+                """
+                while budget['pages'] > 0 and budget['posts'] > 0:
+                    # 2. Fetch posts from each list (V-27: posts_per_fetch is the page size)
+                    async with fetch_semaphore:
+                        # Update progress: current list
+                        progress_tracker.set_current_list(list_idx, list_meta.list_name or f"List {list_id}")
+                        progress_tracker.set_step("fetching")
+                        fetch_started = time.perf_counter()
+                        with stage_timer.stage("fetching"):
+                            raw_posts, next_token = await x_client.fetch_list_page(
+                                list_id,
+                                max_results=min(posts_per_fetch, budget['posts']),
+                                pagination_token=cursor['token']
+                            )
+                        report['fetch_seconds'] += time.perf_counter() - fetch_started
+                    budget['pages'] -= 1
+                    budget['posts'] -= len(raw_posts)
+                    report['pages'] += 1
+                    report['posts_fetched'] += len(raw_posts)
+                    stats['posts_fetched'] += len(raw_posts)
+
+                    # Client-side filtering: only process posts newer than stop_id
+                    # Use integer comparison since tweet IDs are numeric strings
+                    new_posts = [p for p in raw_posts if stop_id is None or int(p["id"]) > int(stop_id)]
+                    if new_posts:
+                        ids = [int(p["id"]) for p in new_posts]
+                        cursor['newest_id'] = max(cursor['newest_id'] or 0, max(ids))
+                        cursor['oldest_id'] = min(cursor['oldest_id'] or max(ids), min(ids))
+                        await admit_page(new_posts, report, list_tasks)
+
+                    cursor['token'] = next_token
+                    if stop_id is None or len(new_posts) < len(raw_posts) or not next_token:
+                        # First fetch of a list only takes the newest page (no history backfill)
+                        return True
+                return False
+
+            head = {'token': None, 'newest_id': None, 'oldest_id': None}
+            backlog = {'token': list_meta.catchup_token, 'newest_id': None, 'oldest_id': None}
+            head_reached = backlog_reached = False
+            try:
+                head_reached = await page_through(head, since_id)
+                if head_reached and backlog['token']:
+                    backlog_reached = await page_through(backlog, list_meta.catchup_until_id)
+            except XAPIError as e:
+                # Catch X API errors (402 Payment Required, etc.) - other errors propagate
+                stats['api_errors'] += 1
+                stats['last_api_error'] = {
+                    'status_code': e.status_code,
+                    'message': str(e)
+                }
+                progress_tracker.error()
+                report['error'] = f"X API error {e.status_code}"
+                logger.warning(f"X API error for list {list_id}, skipping", extra={
+                    'list_id': list_id,
+                    'status_code': e.status_code
+                })
+                # Skip the rest of this list; other lists are unaffected
+
+            # Checkpoint: advance the cursor only after every post from this list is
+            # stored or skipped. On failure it stays put and the next run re-fetches;
+            # posts committed meanwhile are then skipped as duplicates.
+            results = await asyncio.gather(*list_tasks, return_exceptions=True)
+            if any(isinstance(result, BaseException) for result in results):
+                report['error'] = report.get('error') or "post processing failed"
+                return
+
+            # Cursor update + commit under db_lock (see process_post)
+            async with db_lock:
+                # Update last_tweet_id if we got new posts
+                if head['newest_id'] is not None:
+                    list_meta.last_tweet_id = str(head['newest_id'])
+                    if not head_reached:
+                        # Budget/error stopped the head before since_id: resume the gap next run
+                        if list_meta.catchup_token:
+                            logger.warning("Older catch-up backlog abandoned for newer gap", extra={
+                                'list_id': list_id,
+                                'catchup_until_id': list_meta.catchup_until_id
+                            })
+                        list_meta.catchup_token = head['token'] if catchup_enabled else None
+                        list_meta.catchup_until_id = since_id if catchup_enabled else None
+                        list_meta.lag_seconds = int((
+                            tweet_id_to_datetime(str(head['oldest_id'])) - tweet_id_to_datetime(since_id)
+                        ).total_seconds())
+                if backlog_reached or (head_reached and not list_meta.catchup_token):
+                    list_meta.catchup_token = None
+                    list_meta.catchup_until_id = None
+                    list_meta.lag_seconds = 0
+                elif backlog['oldest_id'] is not None:
+                    list_meta.catchup_token = backlog['token']
+                    list_meta.lag_seconds = int((
+                        tweet_id_to_datetime(str(backlog['oldest_id'])) - tweet_id_to_datetime(list_meta.catchup_until_id)
+                    ).total_seconds())
+                list_meta.last_fetched_at = datetime.utcnow()
+
+                await checkpoint()
+
+            report['caught_up'] = list_meta.catchup_token is None and head_reached
+            report['backlog_pending'] = list_meta.catchup_token is not None
+            report['lag_seconds'] = 0 if report['caught_up'] else (list_meta.lag_seconds or 0)
+            if report['backlog_pending']:
+                logger.info("List behind after page budget", extra={'list_id': list_id, **report})
+
+        # Fetch stage: pull all enabled lists concurrently (capped by fetch_concurrency);
+        # pages stream into enrichment as they arrive.
+        fetch_concurrency = max(1, int(settings_svc.get('fetch_concurrency', 3)))
+        fetch_semaphore = asyncio.Semaphore(fetch_concurrency)
+        fetch_results = await asyncio.gather(
+            *(fetch_list(list_idx, list_meta) for list_idx, list_meta in enumerate(enabled_lists, 1)),
+            return_exceptions=True
+        )
+
+        # Wait for every enrichment task before surfacing the first failure
+        # so no task is left writing to a closed session.
+        results = await asyncio.gather(*process_tasks, return_exceptions=True)
+        for result in [*fetch_results, *results]:
+            if isinstance(result, BaseException):
+                # Re-raise unexpected errors
+                raise result
+
+        if uncommitted['board_changed']:
+            await resource_versions.bump_async(adb, resource_versions.GROUPS)
+        await adb.commit()
 
         # Log completion with stats
         logger.info(f"{trigger_source.capitalize()} ingestion completed", extra={
@@ -459,20 +792,30 @@ async def ingest_posts_job(trigger_source: str = "scheduled"):
             'posts_fetched': stats['posts_fetched'],
             'new_posts_added': stats['new_posts_added'],
             'duplicates_skipped': stats['duplicates_skipped'],
+            'prefilter_skipped': stats['prefilter_skipped'],
             'low_worthiness_skipped': stats['low_worthiness_skipped']
         })
 
         # Mark progress as finished
         progress_tracker.finish()
+        await ingestion_run_recorder.finish(stats['run_id'], stats, stage_timer, 'completed')
 
         return stats
+    except asyncio.CancelledError:
+        # Shutdown cancelled the job mid-run
+        progress_tracker.finish()
+        await ingestion_run_recorder.finish(stats['run_id'], stats, stage_timer, 'failed', 'interrupted')
+        raise
     except Exception as e:
         progress_tracker.finish()
+        await ingestion_run_recorder.finish(stats['run_id'], stats, stage_timer, 'failed', str(e))
         raise
     finally:
+        await adb.close()
         db.close()
 
 
+@loop_monitor.track("job:archive_posts")
 async def archive_posts_job():
     """Periodic job: Archive old unselected groups (V-3: archiving is now group-level)"""
     from app.models.group import Group
@@ -480,6 +823,7 @@ async def archive_posts_job():
     from sqlalchemy import update
     from datetime import datetime, timedelta, timezone
     from app.services.settings_service import SettingsService  # V-27
+    from app.services import resource_versions
 
     db = SessionLocal()
     try:
@@ -496,25 +840,26 @@ async def archive_posts_job():
         # Groups are archived if first_seen < cutoff AND not selected AND not already archived
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=archive_age_days)
 
-        db.execute(
+        result = db.execute(
             update(Group)
             .where(Group.first_seen < cutoff_date)
             .where(Group.selected == False)
             .where(Group.archived == False)
             .values(archived=True)
         )
+        if result.rowcount:
+            resource_versions.bump(db, resource_versions.GROUPS)
 
         db.commit()
     finally:
         db.close()
 
 
+@loop_monitor.track("job:cleanup_logs")
 async def cleanup_logs_job():
-    """Periodic job: Delete system logs older than retention period"""
-    from app.models.system_log import SystemLog
+    """Periodic job: Drop system logs older than retention period and prepare upcoming log partitions"""
     from app.database import SessionLocal
-    from sqlalchemy import delete
-    from datetime import datetime, timedelta, timezone
+    from app.services.log_partitions import enforce_retention
     from app.services.settings_service import SettingsService
 
     logger.info("Starting scheduled log cleanup job")
@@ -531,21 +876,18 @@ async def cleanup_logs_job():
             logger.info("Scheduler paused, skipping log cleanup")
             return
 
-        # Calculate cutoff date
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
-
-        # Delete old logs
-        result = db.execute(
-            delete(SystemLog).where(SystemLog.timestamp < cutoff_date)
+        # Postgres: drop whole daily partitions; otherwise row DELETE
+        result = enforce_retention(
+            db, retention_days, settings_svc.get('log_partitions_ahead_days', 3)
         )
-
-        deleted_count = result.rowcount
         db.commit()
 
         logger.info("Log cleanup completed", extra={
             'retention_days': retention_days,
-            'deleted_count': deleted_count,
-            'cutoff_date': cutoff_date.isoformat()
+            'mode': result['mode'],
+            'deleted_count': result['deleted_count'],
+            'dropped_partitions': result['dropped_partitions'],
+            'created_partitions': result['created_partitions']
         })
     except Exception as e:
         logger.error("Log cleanup job failed", exc_info=True)
@@ -554,6 +896,34 @@ async def cleanup_logs_job():
         db.close()
 
 
+@loop_monitor.track("job:repair_group_aggregates")
+async def repair_group_aggregates_job():
+    """Periodic job: Recompute group board aggregates from posts and fix any drift"""
+    from app.database import SessionLocal
+    from app.services.group_aggregates import repair_group_aggregates
+    from app.services.progress_tracker import progress_tracker
+    from app.services.settings_service import SettingsService
+
+    db = SessionLocal()
+    try:
+        settings_svc = SettingsService(db)
+        if settings_svc.get('scheduler_paused', False):
+            logger.info("Scheduler paused, skipping group aggregate repair")
+            return
+        # Ingestion folds posts into groups as it goes; don't race it
+        if progress_tracker.progress.is_running:
+            logger.info("Ingestion running, skipping group aggregate repair")
+            return
+
+        fixed = repair_group_aggregates(db)
+        logger.info("Group aggregate repair completed", extra={'groups_updated': fixed})
+    except Exception as e:
+        logger.error("Group aggregate repair job failed", exc_info=True)
+        db.rollback()
+    finally:
+        db.close()
+
+
 def start_scheduler():
     """Start background scheduler with configured jobs (V-27: read from DB, V-16: respect pause state)"""
     from app.services.settings_service import SettingsService
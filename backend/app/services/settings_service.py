@@ -50,7 +50,37 @@ class SettingsService:
 
         return value
 
-    def _cast_value(self, value: str, value_type: str) -> Any:
+    @classmethod
+    async def get_async(cls, db, key: str, default: Any = None) -> Any:
+        """get() for AsyncSession callers (shares the same cache)"""
+        if key in cls._cache:
+            value, cached_at = cls._cache[key]
+            if datetime.now() - cached_at < timedelta(seconds=cls._cache_expiry_seconds):
+                return value
+
+        setting = (await db.execute(
+            select(SystemSettings).where(SystemSettings.key == key)
+        )).scalar_one_or_none()
+
+        if not setting:
+            return default
+
+        value = cls._cast_value(setting.value, setting.value_type)
+        cls._cache[key] = (value, datetime.now())
+        return value
+
+    @classmethod
+    async def preload_async(cls, db):
+        """Load every setting into the cache with one async query
+
+        Later get() calls within the cache window then never touch the database.
+        """
+        now = datetime.now()
+        for setting in (await db.execute(select(SystemSettings))).scalars().all():
+            cls._cache[setting.key] = (cls._cast_value(setting.value, setting.value_type), now)
+
+    @staticmethod
+    def _cast_value(value: str, value_type: str) -> Any:
         """Cast string value to appropriate type"""
         if value_type == 'int':
             return int(value)
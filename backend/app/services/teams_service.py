@@ -1,11 +1,11 @@
 """Teams integration service for multi-channel webhook support (V-14)"""
 import json
 import logging
-import httpx
 import re
 from html import unescape
 from typing import Optional
 from app.config import settings
+from app.services.http_clients import teams_http
 
 logger = logging.getLogger('klaus_news.teams_service')
 
@@ -452,29 +452,32 @@ async def send_to_teams(article_id: str, channel_name: str, db) -> dict:
     )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(webhook_url, json=card_payload, timeout=30.0)
-
-            # Accept both 200 (OK) and 202 (Accepted) as success
-            # Power Automate workflows return 202 when message is queued for delivery
-            if response.status_code in (200, 202):
-                # Update GroupArticle posted_to_teams timestamp if applicable
-                if group_article:
-                    from datetime import datetime
-                    group_article.posted_to_teams = datetime.now()
-
-                    # Transition group to PUBLISHED so it disappears from Serving
-                    # (group and posts remain in DB for duplicate detection)
-                    if group:
-                        group.state = 'PUBLISHED'
-
-                    db.commit()
-
-                logger.info(f"Article sent to Teams channel #{channel_name}")
-                return {"success": True, "message": f"Article sent to #{channel_name}"}
-            else:
-                logger.error(f"Teams webhook failed: {response.status_code} - {response.text[:200]}")
-                return {"success": False, "error": "Failed to send to Teams"}
+        client = teams_http.get_client()
+        response = await client.post(webhook_url, json=card_payload)
+
+        # Accept both 200 (OK) and 202 (Accepted) as success
+        # Power Automate workflows return 202 when message is queued for delivery
+        if response.status_code in (200, 202):
+            # Update GroupArticle posted_to_teams timestamp if applicable
+            if group_article:
+                from datetime import datetime
+                group_article.posted_to_teams = datetime.now()
+
+                # Transition group to PUBLISHED so it disappears from Serving
+                # (group and posts remain in DB for duplicate detection)
+                if group:
+                    from app.services import resource_versions
+
+                    group.state = 'PUBLISHED'
+                    resource_versions.bump(db, resource_versions.GROUPS)
+
+                db.commit()
+
+            logger.info(f"Article sent to Teams channel #{channel_name}")
+            return {"success": True, "message": f"Article sent to #{channel_name}"}
+        else:
+            logger.error(f"Teams webhook failed: {response.status_code} - {response.text[:200]}")
+            return {"success": False, "error": "Failed to send to Teams"}
     except Exception as e:
         logger.error(f"Teams send error: {str(e)}", exc_info=True)
         return {"success": False, "error": "Failed to send to Teams"}
@@ -1,5 +1,6 @@
 """X (Twitter) API client for fetching posts from curated lists"""
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 from app.config import settings
@@ -38,6 +39,15 @@ def detect_content_type(tweet_data, referenced_tweets_full):
     return "post"
 
 
+# Tweet IDs are snowflakes: milliseconds since this epoch, shifted left by 22 bits
+TWITTER_EPOCH_MS = 1288834974657
+
+
+def tweet_id_to_datetime(tweet_id: str) -> datetime:
+    """Creation time encoded in a tweet ID (UTC)"""
+    return datetime.fromtimestamp(((int(tweet_id) >> 22) + TWITTER_EPOCH_MS) / 1000, tz=timezone.utc)
+
+
 class XAPIError(Exception):
     """Exception raised when X API returns an error"""
     def __init__(self, status_code: int, response_body: str):
@@ -52,10 +62,10 @@ class XClient:
     def __init__(self):
         self.api_key = settings.x_api_key
         self.api_secret = settings.x_api_secret
-        # TODO: Initialize X API client (e.g., tweepy, httpx)
+        # HTTP connections come from the shared keep-alive pool (http_clients.x_api_http)
 
     async def fetch_posts_from_list(self, list_id: str, max_results: int = 100, since_id: str = None) -> List[Dict[str, Any]]:
-        """Fetch recent posts from a specific X list
+        """Fetch recent posts from a specific X list (first page only)
 
         Args:
             list_id: X list ID
@@ -64,13 +74,36 @@ class XClient:
         Returns:
             List of post dictionaries with fields: id, text, author, created_at
         """
-        import httpx
-        from datetime import datetime
+        posts, _ = await self.fetch_list_page(list_id, max_results=max_results)
+        if since_id is not None:
+            posts = [p for p in posts if int(p["id"]) > int(since_id)]
+        return posts
+
+    async def fetch_list_page(
+        self,
+        list_id: str,
+        max_results: int = 100,
+        pagination_token: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one page of a list timeline, newest first
+
+        The list tweets endpoint has no since_id parameter; callers page with
+        pagination_token until they reach a tweet they already have.
+
+        Args:
+            list_id: X list ID
+            max_results: Page size (X allows 1-100)
+            pagination_token: next_token of the previous page (None = newest page)
+
+        Returns:
+            (posts, next_token) - next_token is None on the last page
+        """
+        from app.services.http_clients import x_api_http
 
         logger.info("Fetching posts from X list", extra={
             'list_id': list_id,
             'max_results': max_results,
-            'since_id': since_id
+            'pagination_token': pagination_token
         })
 
         url = f"https://api.twitter.com/2/lists/{list_id}/tweets"
@@ -79,63 +112,66 @@ class XClient:
         }
         params = {
             "max_results": max_results,
-            "tweet.fields": "article,note_tweet,entities,referenced_tweets,text,suggested_source_links,card_uri,created_at,author_id",
+            "tweet.fields": "article,note_tweet,entities,referenced_tweets,text,suggested_source_links,card_uri,created_at,author_id,lang",
             "expansions": "referenced_tweets.id,article.cover_media,article.media_entities,author_id",
             "user.fields": "username"
         }
+        if pagination_token:
+            params["pagination_token"] = pagination_token
 
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-
-            if response.status_code != 200:
-                logger.error("X API request failed", extra={
-                    'list_id': list_id,
-                    'status_code': response.status_code,
-                    'response_body': response.text[:500]  # Truncate for storage
-                })
-                raise XAPIError(response.status_code, response.text)
-
-            data = response.json()
-            posts = []
-
-            # Build user lookup
-            users = {u["id"]: u["username"] for u in data.get("includes", {}).get("users", [])}
-
-            # Build referenced tweets lookup (for full RT text)
-            referenced_tweets = {t["id"]: t["text"] for t in data.get("includes", {}).get("tweets", [])}
-
-            # Build referenced tweets full object lookup (for article detection) — V-2
-            referenced_tweets_full = {t["id"]: t for t in data.get("includes", {}).get("tweets", [])}
-
-            for tweet in data.get("data", []):
-                # Get full text: for retweets, use the original tweet's full text
-                text = tweet["text"]
-                ref_tweets = tweet.get("referenced_tweets", [])
-                for ref in ref_tweets:
-                    if ref.get("type") == "retweeted" and ref.get("id") in referenced_tweets:
-                        # Replace truncated RT text with full original
-                        original_author = text.split(":")[0] if text.startswith("RT @") else ""
-                        full_original = referenced_tweets[ref["id"]]
-                        text = f"{original_author}: {full_original}" if original_author else full_original
-                        break
-
-                content_type = detect_content_type(tweet, referenced_tweets_full)  # V-2
-                posts.append({
-                    "id": tweet["id"],
-                    "text": text,
-                    "author": users.get(tweet["author_id"], "unknown"),
-                    "created_at": datetime.fromisoformat(tweet["created_at"].replace("Z", "+00:00")),
-                    "content_type": content_type,  # V-2
-                    "raw_tweet": tweet  # V-3: pass full tweet for article extraction
-                })
-
-            logger.info(f"Successfully fetched {len(posts)} posts from X list", extra={
+        client = x_api_http.get_client()
+        response = await client.get(url, headers=headers, params=params)
+
+        if response.status_code != 200:
+            logger.error("X API request failed", extra={
                 'list_id': list_id,
-                'post_count': len(posts)
+                'status_code': response.status_code,
+                'response_body': response.text[:500]  # Truncate for storage
+            })
+            raise XAPIError(response.status_code, response.text)
+
+        data = response.json()
+        posts = []
+
+        # Build user lookup
+        users = {u["id"]: u["username"] for u in data.get("includes", {}).get("users", [])}
+
+        # Build referenced tweets lookup (for full RT text)
+        referenced_tweets = {t["id"]: t["text"] for t in data.get("includes", {}).get("tweets", [])}
+
+        # Build referenced tweets full object lookup (for article detection) — V-2
+        referenced_tweets_full = {t["id"]: t for t in data.get("includes", {}).get("tweets", [])}
+
+        for tweet in data.get("data", []):
+            # Get full text: for retweets, use the original tweet's full text
+            text = tweet["text"]
+            ref_tweets = tweet.get("referenced_tweets", [])
+            for ref in ref_tweets:
+                if ref.get("type") == "retweeted" and ref.get("id") in referenced_tweets:
+                    # Replace truncated RT text with full original
+                    original_author = text.split(":")[0] if text.startswith("RT @") else ""
+                    full_original = referenced_tweets[ref["id"]]
+                    text = f"{original_author}: {full_original}" if original_author else full_original
+                    break
+
+            content_type = detect_content_type(tweet, referenced_tweets_full)  # V-2
+            posts.append({
+                "id": tweet["id"],
+                "text": text,
+                "author": users.get(tweet["author_id"], "unknown"),
+                "created_at": datetime.fromisoformat(tweet["created_at"].replace("Z", "+00:00")),
+                "content_type": content_type,  # V-2
+                "lang": tweet.get("lang"),  # X language code, used by the pre-filter
+                "raw_tweet": tweet  # V-3: pass full tweet for article extraction
             })
 
-            return posts
+        logger.info(f"Successfully fetched {len(posts)} posts from X list", extra={
+            'list_id': list_id,
+            'post_count': len(posts)
+        })
+
+        return posts, data.get("meta", {}).get("next_token")
 
     async def get_configured_lists(self, db) -> List[str]:
         """Get list of configured X list IDs from database
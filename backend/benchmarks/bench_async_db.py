@@ -0,0 +1,156 @@
+"""Concurrent throughput: sync SessionLocal vs AsyncSession for GET /api/groups/
+
+Serves the same groups query two ways through an in-process ASGI app:
+
+- sync:  `async def` handler using the blocking SessionLocal (the old pattern),
+         so every query stalls the event loop
+- async: the real board query (`list_active_groups`, bypassing the ETag /
+         response cache of GET /api/groups/) on get_async_db
+
+and fires N requests with C in flight at a time. A ticker task measures event
+loop lag during each run (how long other coroutines - the scheduler, OpenAI
+awaits - would have waited).
+
+Usage (from backend/, against the configured DATABASE_URL):
+
+    python -m benchmarks.bench_async_db --requests 500 --concurrency 10
+    python -m benchmarks.bench_async_db --sleep-ms 5   # add 5ms DB time per request
+
+--sleep-ms emulates network/DB round-trip time (pg_sleep on Postgres, a
+registered sleep() function on SQLite), which is where the async path wins:
+sync requests wait out the latency one after another. With a local SQLite
+file and no added latency the async path is slower (aiosqlite hops to a
+worker thread per call); the numbers that matter are Postgres over a network.
+
+Keep --concurrency within the sync pool (pool_size + max_overflow, 15 by
+default). Beyond that a sync handler blocks the loop waiting for a pool
+checkout that only a suspended request could return, and stalls until
+pool_timeout - the failure mode the async path removes.
+"""
+import argparse
+import asyncio
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import Depends, FastAPI
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import httpx
+
+from app.api import groups
+from app.database import async_engine, engine, get_async_db, get_db
+
+
+def percentile(sorted_values, pct):
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+class BlockingSession:
+    """Awaitable facade over a sync Session: same endpoint code, blocking query"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def execute(self, statement):
+        return self.db.execute(statement)
+
+
+def install_sqlite_sleep():
+    """Register sleep(seconds) on SQLite connections (runs in the driver's thread for aiosqlite)"""
+    for sync_engine in (engine, async_engine.sync_engine):
+        @event.listens_for(sync_engine, "connect")
+        def register(dbapi_connection, connection_record):
+            dbapi_connection.create_function("sleep", 1, time.sleep)
+
+
+def build_app(sleep_seconds: float) -> FastAPI:
+    app = FastAPI()
+    sleep_sql = text("SELECT pg_sleep(:s)" if engine.dialect.name == 'postgresql' else "SELECT sleep(:s)")
+
+    @app.get("/sync/groups")
+    async def sync_groups(db: Session = Depends(get_db)):
+        if sleep_seconds:
+            db.execute(sleep_sql, {"s": sleep_seconds})
+        return await groups.list_active_groups(BlockingSession(db))
+
+    @app.get("/async/groups")
+    async def async_groups(db: AsyncSession = Depends(get_async_db)):
+        if sleep_seconds:
+            await db.execute(sleep_sql, {"s": sleep_seconds})
+        return await groups.list_active_groups(db)
+
+    return app
+
+
+async def run(client: httpx.AsyncClient, path: str, requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    lag = {'max': 0.0}
+    done = asyncio.Event()
+
+    async def ticker(interval: float = 0.005):
+        while not done.is_set():
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            lag['max'] = max(lag['max'], time.perf_counter() - expected)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    ticker_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticker_task
+
+    latencies.sort()
+    return {
+        'req_per_s': requests / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'max_loop_lag_ms': lag['max'] * 1000
+    }
+
+
+async def main(args):
+    if engine.dialect.name == 'sqlite':
+        install_sqlite_sleep()
+
+    app = build_app(args.sleep_ms / 1000)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up connection pools and the groups query plan
+        for path in ("/sync/groups", "/async/groups"):
+            await run(client, path, min(20, args.requests), min(5, args.concurrency))
+
+        print(f"{args.requests} requests, concurrency {args.concurrency}, "
+              f"sleep {args.sleep_ms}ms, {engine.dialect.name}")
+        print(f"{'mode':<6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'loop lag ms':>12}")
+        results = {}
+        for mode in ("sync", "async"):
+            result = await run(client, f"/{mode}/groups", args.requests, args.concurrency)
+            results[mode] = result
+            print(f"{mode:<6} {result['req_per_s']:>9.1f} {result['p50_ms']:>9.1f} "
+                  f"{result['p95_ms']:>9.1f} {result['max_loop_lag_ms']:>12.1f}")
+        print(f"throughput gain: {results['async']['req_per_s'] / results['sync']['req_per_s']:.2f}x")
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--sleep-ms", type=float, default=0, help="emulated DB time per request")
+    asyncio.run(main(parser.parse_args()))
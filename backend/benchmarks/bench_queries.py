@@ -0,0 +1,488 @@
+"""Read endpoint latency and query plan regression suite
+
+Seeds a database with configurable volumes, then requests every read
+endpoint of posts, groups, logs and group articles through an in-process
+ASGI app (the real routers, without auth). Each case is timed over
+--iterations requests, and the SQL it issues is captured and explained:
+
+- Postgres: EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)
+- SQLite:   EXPLAIN QUERY PLAN
+
+A case fails when its p95 latency exceeds its budget, or when one of its
+statements sequentially scans a table of more than --seq-scan-rows rows that
+the case does not explicitly allow. Exit status is 1 on any failure.
+
+Usage (from backend/, DATABASE_URL pointing at a scratch database):
+
+    python -m benchmarks.bench_queries --seed --posts 100000 --groups 20000 --logs 1000000
+    python -m benchmarks.bench_queries                  # rerun against the seeded data
+    python -m benchmarks.bench_queries --plans plans/   # also write every plan to plans/<case>.txt
+
+--seed refuses to touch a database that already has posts; --reset drops and
+recreates every table first. Never point either at a real database.
+
+Budgets are p95 milliseconds for a local Postgres; scale them with
+--budget-scale for slower machines or a remote server.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from sqlalchemy import event, func, insert, select, text, update
+import httpx
+
+from app.api import group_articles, groups, logs, posts
+from app.database import Base, SessionLocal, async_engine, engine
+# Every model, as app.main registers them (create_all/drop_all cover all tables)
+from app.models import Post, Group, SystemLog, Article, ListMetadata, SystemSettings  # noqa: F401
+from app.models.group_research import GroupResearch  # noqa: F401
+from app.models.group_articles import GroupArticle
+from app.models.group_embedding import GroupEmbedding  # noqa: F401
+from app.models.llm_cache import LLMCacheEntry  # noqa: F401
+from app.models.ingestion_run import IngestionRun, IngestionRunList  # noqa: F401
+from app.models.log_rollup import LogHourlyRollup  # noqa: F401
+from app.models.resource_version import ResourceVersion  # noqa: F401
+from app.models.prompt import Prompt  # noqa: F401
+from app.services import resource_versions
+
+CATEGORIES = ['Technology', 'Politics', 'Business', 'Science', 'Health', 'Other']
+STATES = ['NEW', 'COOKING', 'REVIEW', 'PUBLISHED']
+LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+LOG_LEVEL_WEIGHTS = [20, 60, 12, 7, 1]
+LOGGERS = [
+    ('klaus_news.scheduler', 'scheduler'),
+    ('klaus_news.x_client', 'external_api'),
+    ('klaus_news.openai_client', 'external_api'),
+    ('klaus_news.api', 'api'),
+    ('klaus_news.database', 'database'),
+]
+LOG_MESSAGES = [
+    "Fetched {n} posts from list",
+    "Request completed in {n}ms",
+    "OpenAI request timeout after {n}s, retrying",
+    "Checkpoint committed {n} posts",
+    "Rate limit reached, sleeping {n}s",
+]
+CHUNK = 5000
+
+
+def percentile(sorted_values, pct):
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+# ---------------------------------------------------------------------------
+# Schema and data
+
+
+def prepare_schema(reset: bool):
+    """Same schema steps as app startup (tables, migrations, partitions, search indexes)"""
+    from app.database import initialize_default_settings, run_migrations
+    from app.services import log_rollups
+    from app.services.log_partitions import setup_log_partitions
+    from app.services.log_search import setup_log_search
+
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    run_migrations()
+    setup_log_partitions(engine)
+    setup_log_search(engine)
+    log_rollups.backfill(engine)
+    resource_versions.seed(engine, resource_versions.GROUPS)
+    initialize_default_settings()
+
+
+def _insert_chunks(db, model, rows: List[dict], on_chunk: Optional[Callable] = None):
+    for start in range(0, len(rows), CHUNK):
+        chunk = rows[start:start + CHUNK]
+        db.execute(insert(model), chunk)
+        if on_chunk:
+            on_chunk(db, chunk)
+        db.commit()
+
+
+def seed(args):
+    from app.services import log_rollups
+    from app.services.group_aggregates import repair_group_aggregates
+
+    rng = random.Random(args.random_seed)
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        if db.execute(select(Post.id).limit(1)).first() is not None:
+            sys.exit("Database already has posts: use --reset to recreate it (destroys all data)")
+
+        started = time.perf_counter()
+        # Groups over --days; like archive_posts_job, unselected groups older than a week are archived
+        group_rows = []
+        for i in range(args.groups):
+            first_seen = now - timedelta(seconds=rng.uniform(0, args.days * 86400))
+            selected = rng.random() < 0.05
+            group_rows.append({
+                'representative_title': f"Story {i}: {rng.choice(CATEGORIES)} update",
+                'representative_summary': f"Summary of story {i}. " * 8,
+                'category': rng.choice(CATEGORIES),
+                'first_seen': first_seen,
+                'post_count': 0,
+                'archived': not selected and first_seen < now - timedelta(days=7),
+                'selected': selected,
+                'state': rng.choice(STATES) if selected else 'NEW',
+            })
+        _insert_chunks(db, Group, group_rows)
+        first_seen_by_id = dict(db.execute(select(Group.id, Group.first_seen)).all())
+        group_ids = list(first_seen_by_id)
+
+        # Posts, skewed so a few groups are large (r ** 1.5 favours the front of a shuffled list:
+        # with the defaults the largest groups get a few hundred posts, most get a handful)
+        rng.shuffle(group_ids)
+        post_counts: Dict[int, int] = {}
+        post_rows = []
+        for i in range(args.posts):
+            group_id = group_ids[int(len(group_ids) * rng.random() ** 1.5)]
+            post_counts[group_id] = post_counts.get(group_id, 0) + 1
+            created_at = min(now, first_seen_by_id[group_id] + timedelta(minutes=rng.uniform(0, 48 * 60)))
+            post_rows.append({
+                'post_id': str(1_800_000_000_000_000_000 + i),
+                'original_text': f"Post {i} about story {group_id}. " + "Lorem ipsum dolor sit amet. " * 6,
+                'author': f"author{rng.randrange(500)}",
+                'created_at': created_at,
+                'ai_title': f"Title of post {i}",
+                'ai_summary': f"Summary of post {i}. " * 4,
+                'category': rng.choice(CATEGORIES),
+                'categorization_score': round(rng.random(), 2),
+                'worthiness_score': round(rng.random(), 2),
+                'group_id': group_id,
+                'content_type': 'post',
+                'ingested_at': min(now, created_at + timedelta(minutes=rng.uniform(1, 30))),
+            })
+        _insert_chunks(db, Post, post_rows)
+        db.execute(update(Group), [{'id': gid, 'post_count': count} for gid, count in post_counts.items()])
+        db.commit()
+        repair_group_aggregates(db)
+
+        # Articles for a tenth of the groups, several for a few
+        article_rows = []
+        for i in range(args.articles):
+            group_id = group_ids[int(len(group_ids) * rng.random() ** 2 / 10)]
+            created_at = min(now, first_seen_by_id[group_id] + timedelta(hours=rng.uniform(1, 72)))
+            article_rows.append({
+                'group_id': group_id,
+                'style': 'news_brief',
+                'prompt_used': "Write a news brief",
+                'title': f"Article {i}",
+                'preview': f"Preview of article {i}",
+                'content': f"Article {i} body. " * 60,
+                'created_at': created_at,
+                'updated_at': created_at,
+            })
+        _insert_chunks(db, GroupArticle, article_rows)
+
+        # Logs over --log-days (inside the default retention), counted into the rollups like the log writer does
+        oldest_log = now - timedelta(days=args.log_days)
+        if engine.dialect.name == 'postgresql':
+            from app.services.log_partitions import ensure_partitions, is_partitioned
+            with engine.begin() as conn:
+                if is_partitioned(conn):
+                    ensure_partitions(conn, 3, start=oldest_log.date())
+        for start in range(0, args.logs, CHUNK):
+            log_rows = []
+            for i in range(start, min(start + CHUNK, args.logs)):
+                level = rng.choices(LOG_LEVELS, LOG_LEVEL_WEIGHTS)[0]
+                logger_name, category = rng.choice(LOGGERS)
+                failed = level in ('ERROR', 'CRITICAL')
+                log_rows.append({
+                    'timestamp': oldest_log + timedelta(seconds=rng.uniform(0, args.log_days * 86400)),
+                    'level': level,
+                    'logger_name': logger_name,
+                    'message': rng.choice(LOG_MESSAGES).format(n=rng.randrange(1000)),
+                    'context': json.dumps({'iteration': i}),
+                    'exception_type': 'TimeoutError' if failed else None,
+                    'exception_message': 'Request timed out' if failed else None,
+                    'stack_trace': "Traceback (most recent call last):\n" + "  File \"x.py\", line 1\n" * 30 if failed else None,
+                    'correlation_id': None,
+                    'category': category,
+                })
+            _insert_chunks(db, SystemLog, log_rows, on_chunk=log_rollups.add_batch)
+
+        db.execute(text("ANALYZE"))
+        db.commit()
+        print(f"Seeded {args.groups} groups, {args.posts} posts, {args.articles} articles, "
+              f"{args.logs} logs in {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+
+# ---------------------------------------------------------------------------
+# Cases
+
+
+@dataclass
+class Case:
+    name: str
+    path: str
+    budget_ms: float
+    # Tables this case may scan sequentially (e.g. a count over a whole partition)
+    allow_seq_scan: Tuple[str, ...] = ()
+    headers: Dict[str, str] = field(default_factory=dict)
+    expect_status: int = 200
+    before: Optional[Callable] = None
+
+
+def build_app() -> FastAPI:
+    """The read routers under their real prefixes (see app.main)"""
+    app = FastAPI()
+    app.include_router(posts.router, prefix="/api/posts")
+    app.include_router(groups.router, prefix="/api/groups")
+    app.include_router(group_articles.router, prefix="/api/groups")
+    app.include_router(logs.router, prefix="/api/logs")
+    return app
+
+
+async def deep_cursor(client: httpx.AsyncClient, path: str, pages: int, header: Optional[str] = None) -> Optional[str]:
+    """Cursor of page pages + 1 (follows next_cursor, or the header for /recommended)"""
+    cursor = None
+    for _ in range(pages):
+        separator = '&' if '?' in path else '?'
+        response = await client.get(f"{path}{separator}cursor={cursor}" if cursor else path)
+        response.raise_for_status()
+        cursor = response.headers.get(header) if header else response.json().get('next_cursor')
+        if not cursor:
+            return None
+    return cursor
+
+
+async def build_cases(client: httpx.AsyncClient) -> List[Case]:
+    db = SessionLocal()
+    try:
+        largest_group = db.execute(select(Group.id).order_by(Group.post_count.desc()).limit(1)).scalar()
+        article_group = db.execute(
+            select(GroupArticle.group_id).group_by(GroupArticle.group_id)
+            .order_by(func.count().desc()).limit(1)
+        ).scalar()
+        log_id = db.execute(select(func.max(SystemLog.id))).scalar()
+    finally:
+        db.close()
+
+    board = await client.get("/api/groups/")
+    board_etag = board.headers.get("etag", "")
+
+    cases = [
+        Case("posts.list", "/api/posts/", 50),
+        Case("posts.recommended", "/api/posts/recommended", 50),
+        Case("posts.detail", "/api/posts/1", 10),
+        Case("groups.board", "/api/groups/", 150, before=resource_versions.response_cache.clear),
+        Case("groups.board_cached", "/api/groups/", 20),
+        Case("groups.board_304", "/api/groups/", 10, headers={"If-None-Match": board_etag}, expect_status=304),
+        Case("groups.archived", "/api/groups/archived", 50),
+        Case("logs.list", "/api/logs/?hours=24&count=none", 50),
+        Case("logs.list_estimated", "/api/logs/?hours=24&count=estimated", 50),
+        Case("logs.list_exact", "/api/logs/?hours=24", 250, allow_seq_scan=("system_logs",)),
+        Case("logs.level", "/api/logs/?hours=168&level=ERROR&count=none", 50),
+        Case("logs.category", "/api/logs/?hours=168&category=database&count=none", 50),
+        Case("logs.search", "/api/logs/?hours=24&search=timeout&count=none", 250, allow_seq_scan=("system_logs",)),
+        Case("logs.stats", "/api/logs/stats?hours=168", 50),
+    ]
+    if largest_group:
+        cases.append(Case("groups.posts", f"/api/groups/{largest_group}/posts", 50))
+    if article_group:
+        cases.append(Case("group_articles.list", f"/api/groups/{article_group}/articles/", 50))
+        cases.append(Case("group_articles.latest", f"/api/groups/{article_group}/article/", 20))
+    if log_id:
+        cases.append(Case("logs.detail", f"/api/logs/{log_id}", 10))
+
+    # Deep pages: keyset pagination must cost the same as the first page
+    deep = [
+        ("posts.list_page10", "/api/posts/", None),
+        ("posts.recommended_page10", "/api/posts/recommended", "x-next-cursor"),
+        ("groups.archived_page10", "/api/groups/archived", None),
+        ("logs.list_page10", "/api/logs/?hours=24&count=none", None),
+    ]
+    for name, path, header in deep:
+        cursor = await deep_cursor(client, path, 10, header)
+        if cursor:
+            separator = '&' if '?' in path else '?'
+            cases.append(Case(name, f"{path}{separator}cursor={cursor}", 50))
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Plans
+
+
+class StatementRecorder:
+    """Collects the SELECTs both engines send while recording is on"""
+
+    def __init__(self):
+        self.statements: Optional[List[Tuple[str, str, object]]] = None
+        for sync_engine, kind in ((engine, 'sync'), (async_engine.sync_engine, 'async')):
+            event.listen(sync_engine, "before_cursor_execute", self._recorder(kind))
+
+    def _recorder(self, kind: str):
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if self.statements is not None and statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+                self.statements.append((kind, statement, parameters))
+        return record
+
+
+def _relation_sizes() -> Dict[str, Tuple[str, float]]:
+    """relation -> (table it belongs to, row count); partitions map to their parent"""
+    with engine.connect() as conn:
+        if engine.dialect.name == 'postgresql':
+            rows = conn.execute(text(
+                "SELECT c.relname, coalesce(p.relname, c.relname), c.reltuples "
+                "FROM pg_class c "
+                "LEFT JOIN pg_inherits i ON i.inhrelid = c.oid "
+                "LEFT JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE c.relkind IN ('r', 'p') AND c.relnamespace = 'public'::regnamespace"
+            )).all()
+            return {name: (parent, float(count)) for name, parent, count in rows}
+        return {
+            table.name: (table.name, float(conn.execute(select(func.count()).select_from(table)).scalar()))
+            for table in Base.metadata.sorted_tables
+        }
+
+
+async def explain(kind: str, statement: str, parameters) -> Tuple[str, list]:
+    """(plan text, [(relation, rows)] of sequential scans) for one captured statement"""
+    postgres = engine.dialect.name == 'postgresql'
+    prefix = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " if postgres else "EXPLAIN QUERY PLAN "
+    if kind == 'sync':
+        with engine.connect() as conn:
+            rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+            conn.rollback()
+    else:
+        async with async_engine.connect() as conn:
+            rows = (await conn.exec_driver_sql(prefix + statement, parameters)).all()
+            await conn.rollback()
+
+    seq_scans = []
+    if postgres:
+        plan = rows[0][0]
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+
+        def walk(node):
+            if node.get('Node Type') == 'Seq Scan':
+                seq_scans.append(node.get('Relation Name'))
+            for child in node.get('Plans', []):
+                walk(child)
+        walk(plan[0]['Plan'])
+        return json.dumps(plan, indent=2), seq_scans
+
+    for row in rows:
+        match = re.match(r'SCAN (?:TABLE )?(\w+)$', row[-1])
+        if match:
+            seq_scans.append(match.group(1))
+    return "\n".join(row[-1] for row in rows), seq_scans
+
+
+# ---------------------------------------------------------------------------
+# Run
+
+
+async def run_case(client: httpx.AsyncClient, case: Case, iterations: int) -> dict:
+    latencies = []
+    gc.collect()  # don't bill the previous case's garbage to this one
+    for i in range(iterations + 2):
+        if case.before:
+            case.before()
+        started = time.perf_counter()
+        response = await client.get(case.path, headers=case.headers)
+        elapsed = time.perf_counter() - started
+        if response.status_code != case.expect_status:
+            raise RuntimeError(f"{case.name}: HTTP {response.status_code} {response.text[:200]}")
+        if i >= 2:  # first two warm up pools, caches and plans
+            latencies.append(elapsed)
+    latencies.sort()
+    return {'p50_ms': percentile(latencies, 50) * 1000, 'p95_ms': percentile(latencies, 95) * 1000}
+
+
+async def main(args):
+    recorder = StatementRecorder()
+    app = build_app()
+    failures = 0
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            cases = await build_cases(client)
+            if args.case:
+                cases = [case for case in cases if any(pattern in case.name for pattern in args.case)]
+            sizes = _relation_sizes()
+            if args.plans:
+                os.makedirs(args.plans, exist_ok=True)
+
+            print(f"{len(cases)} cases, {args.iterations} iterations, {engine.dialect.name}, "
+                  f"budget x{args.budget_scale}, seq scan limit {args.seq_scan_rows} rows")
+            print(f"{'case':<28} {'p50 ms':>8} {'p95 ms':>8} {'budget':>8}  result")
+            for case in cases:
+                timing = await run_case(client, case, args.iterations)
+
+                # One more request with SQL capture, then explain what it ran
+                if case.before:
+                    case.before()
+                recorder.statements = []
+                await client.get(case.path, headers=case.headers)
+                statements, recorder.statements = recorder.statements, None
+
+                problems = []
+                budget = case.budget_ms * args.budget_scale
+                if timing['p95_ms'] > budget:
+                    problems.append("p95 over budget")
+                plan_texts = []
+                for kind, statement, parameters in statements:
+                    plan_text, seq_scans = await explain(kind, statement, parameters)
+                    plan_texts.append(f"-- {statement}\n{plan_text}")
+                    for relation in seq_scans:
+                        table, rows = sizes.get(relation, (relation, 0.0))
+                        if rows >= args.seq_scan_rows and table not in case.allow_seq_scan:
+                            problems.append(f"seq scan on {relation} ({rows:.0f} rows)")
+                if args.plans:
+                    with open(os.path.join(args.plans, f"{case.name}.txt"), "w") as f:
+                        f.write("\n\n".join(plan_texts))
+
+                failures += bool(problems)
+                print(f"{case.name:<28} {timing['p50_ms']:>8.1f} {timing['p95_ms']:>8.1f} {budget:>8.0f}  "
+                      f"{'FAIL: ' + '; '.join(problems) if problems else 'ok'}")
+    finally:
+        await async_engine.dispose()
+
+    print(f"{failures} failing case(s)" if failures else "all cases within budget")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", action="store_true", help="seed the database before running")
+    parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first (destroys data)")
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--groups", type=int, default=20_000)
+    parser.add_argument("--articles", type=int, default=5_000)
+    parser.add_argument("--logs", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=90, help="age spread of groups and posts")
+    parser.add_argument("--log-days", type=int, default=7, help="age spread of logs")
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--budget-scale", type=float, default=1.0)
+    parser.add_argument("--seq-scan-rows", type=int, default=10_000,
+                        help="sequential scans of smaller tables are not flagged")
+    parser.add_argument("--case", action="append", help="only run cases whose name contains this (repeatable)")
+    parser.add_argument("--plans", help="directory to write each case's plans to")
+    args = parser.parse_args()
+
+    if args.seed or args.reset:
+        prepare_schema(args.reset)
+        seed(args)
+    sys.exit(1 if asyncio.run(main(args)) else 0)
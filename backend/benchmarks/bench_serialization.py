@@ -0,0 +1,153 @@
+"""Per-row response serialization cost: dicts + jsonable_encoder vs typed schemas + orjson
+
+Builds list payloads (posts, group articles, logs) from synthetic rows two ways:
+
+- before: hand-built dicts with .isoformat() datetimes, returned through
+          FastAPI's default path (jsonable_encoder, then JSONResponse / json.dumps)
+- after:  the typed schemas of app.api.schemas, rendered by ORJSONResponse
+          (what the read endpoints now return directly)
+
+and reports microseconds per row for building the payload, encoding it, and
+in total. Both paths are checked to produce the same JSON. No database
+connection is made, but app settings load as usual (AUTH_* variables set).
+
+Usage (from backend/):
+
+    python -m benchmarks.bench_serialization --rows 2000 --repeat 20
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.api.group_articles import _article_item
+from app.api.posts import _post_item
+from app.api.schemas import ArticlePage, LogItem, LogPage, PostPage
+
+
+def make_rows(kind: str, count: int) -> list:
+    started = datetime(2026, 1, 1, 12, 0, 0, 123456)
+    rows = []
+    for i in range(count):
+        at = started + timedelta(seconds=i * 37, microseconds=i)
+        if kind == 'posts':
+            rows.append(SimpleNamespace(
+                id=i, post_id=str(1_800_000_000_000_000_000 + i),
+                original_text="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+                author=f"author{i % 50}", created_at=at, ai_title=f"Title {i}",
+                ai_summary="Summary sentence. " * 6, category="Technology",
+                categorization_score=0.87, worthiness_score=(i % 100) / 100, group_id=i // 3
+            ))
+        elif kind == 'articles':
+            rows.append(SimpleNamespace(
+                id=i, group_id=i // 2, style="news_brief", title=f"Article {i}",
+                preview="Preview text. " * 5, content="Article body sentence. " * 60,
+                posted_to_teams=at if i % 2 else None, created_at=at, updated_at=at
+            ))
+        else:
+            rows.append(SimpleNamespace(
+                id=i, timestamp=at, level="INFO", logger_name="klaus_news.scheduler",
+                message=f"Checkpoint committed {i} posts", category="scheduler",
+                exception_type=None, exception_message=None,
+                context='{"list_id": "123", "posts": 5}', correlation_id=None
+            ))
+    return rows
+
+
+# before: the dict builders the endpoints used (datetimes pre-formatted)
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def legacy_payload(kind: str, rows: list) -> dict:
+    if kind == 'posts':
+        return {"posts": [{
+            "id": p.id, "post_id": p.post_id, "original_text": p.original_text, "author": p.author,
+            "created_at": _iso(p.created_at), "ai_title": p.ai_title, "ai_summary": p.ai_summary,
+            "category": p.category, "categorization_score": p.categorization_score,
+            "worthiness_score": p.worthiness_score, "group_id": p.group_id
+        } for p in rows], "next_cursor": None}
+    if kind == 'articles':
+        return {"articles": [{
+            "id": a.id, "group_id": a.group_id, "style": a.style, "title": a.title,
+            "preview": a.preview, "content": a.content, "posted_to_teams": _iso(a.posted_to_teams),
+            "created_at": _iso(a.created_at), "updated_at": _iso(a.updated_at)
+        } for a in rows], "count": len(rows), "next_cursor": None}
+    return {"logs": [{
+        "id": log.id, "timestamp": _iso(log.timestamp), "level": log.level,
+        "logger_name": log.logger_name, "message": log.message, "category": log.category,
+        "exception_type": log.exception_type, "exception_message": log.exception_message,
+        "context": log.context, "correlation_id": log.correlation_id
+    } for log in rows], "total": None, "total_is_estimate": False, "offset": 0,
+        "limit": len(rows), "next_cursor": None}
+
+
+def legacy_encode(payload) -> bytes:
+    # FastAPI's serialize_response without a response_model, then the default response class
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+# after: the typed schemas the endpoints return
+
+def typed_payload(kind: str, rows: list):
+    if kind == 'posts':
+        return PostPage(posts=[_post_item(p) for p in rows], next_cursor=None)
+    if kind == 'articles':
+        return ArticlePage(articles=[_article_item(a) for a in rows], count=len(rows), next_cursor=None)
+    return LogPage(logs=[LogItem(
+        id=log.id, timestamp=log.timestamp, level=log.level, logger_name=log.logger_name,
+        message=log.message, category=log.category, exception_type=log.exception_type,
+        exception_message=log.exception_message, context=log.context,
+        correlation_id=log.correlation_id
+    ) for log in rows], total=None, total_is_estimate=False, offset=0, limit=len(rows), next_cursor=None)
+
+
+def typed_encode(payload) -> bytes:
+    return ORJSONResponse(payload).body
+
+
+def best_of(repeat: int, fn, *args):
+    """(fastest wall time, result) over repeat calls"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main(args):
+    print(f"{args.rows} rows per payload, best of {args.repeat}; microseconds per row")
+    print(f"{'payload':<10} {'path':<7} {'build':>8} {'encode':>8} {'total':>8} {'speedup':>8}")
+    for kind in ('posts', 'articles', 'logs'):
+        rows = make_rows(kind, args.rows)
+        results = {}
+        for path, build, encode in (("before", legacy_payload, legacy_encode), ("after", typed_payload, typed_encode)):
+            build_time, payload = best_of(args.repeat, build, kind, rows)
+            encode_time, body = best_of(args.repeat, encode, payload)
+            results[path] = (build_time, encode_time, body)
+
+        if json.loads(results["before"][2]) != json.loads(results["after"][2]):
+            sys.exit(f"{kind}: typed response differs from the legacy response")
+        before_total = results["before"][0] + results["before"][1]
+        for path, (build_time, encode_time, _) in results.items():
+            total = build_time + encode_time
+            speedup = f"{before_total / total:.1f}x" if path == "after" else ""
+            print(f"{kind:<10} {path:<7} {build_time / args.rows * 1e6:>8.2f} "
+                  f"{encode_time / args.rows * 1e6:>8.2f} {total / args.rows * 1e6:>8.2f} {speedup:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,7 @@
+"""Test setup: app settings require the auth variables (V-11)"""
+import os
+import sys
+
+os.environ.setdefault('AUTH_PASSWORD', 'test')
+os.environ.setdefault('AUTH_JWT_SECRET', 'test')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
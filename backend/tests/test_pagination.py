@@ -0,0 +1,23 @@
+"""Keyset cursor decoding (app.services.pagination)"""
+from datetime import datetime
+
+import pytest
+
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+def test_round_trip():
+    cursor = encode_cursor(datetime(2026, 1, 1, 12, 30), 42)
+    assert decode_cursor(cursor, datetime, int) == [datetime(2026, 1, 1, 12, 30), 42]
+
+
+@pytest.mark.parametrize('cursor', [
+    encode_cursor(1, 2),                      # wrong value types
+    encode_cursor('2026-01-01', [1]),
+    encode_cursor(None, 2),                   # NULL sort key
+    encode_cursor(datetime(2026, 1, 1)),      # wrong length
+    'not-a-cursor',
+])
+def test_invalid_cursors_raise_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, datetime, int)
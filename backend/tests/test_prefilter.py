@@ -0,0 +1,42 @@
+"""Pre-filter near-duplicate detection (app.services.prefilter)"""
+from app.services.prefilter import PreFilter, SimHashIndex, simhash
+
+
+def make_prefilter():
+    return PreFilter(min_chars=5, near_duplicate_index=SimHashIndex(3))
+
+
+def post(post_id, text):
+    return {'id': post_id, 'text': text, 'lang': None}
+
+
+def test_non_latin_texts_get_distinct_fingerprints():
+    fingerprints = {
+        simhash('Привет мир это новость'),
+        simhash('東京で地震が発生しました'),
+        simhash('الحكومة تعلن عن ميزانية جديدة للعام المقبل'),
+    }
+    assert None not in fingerprints
+    assert len(fingerprints) == 3
+
+
+def test_non_latin_posts_are_not_near_duplicates_of_each_other():
+    prefilter = make_prefilter()
+    assert prefilter.check(post('1', 'Привет мир это новость')) is None
+    assert prefilter.check(post('2', '東京で地震が発生しました')) is None
+    assert prefilter.check(post('3', 'الحكومة تعلن عن ميزانية جديدة للعام المقبل')) is None
+    assert prefilter.check(post('4', 'Центральный банк снизил ключевую ставку')) is None
+
+
+def test_non_latin_copy_is_near_duplicate():
+    prefilter = make_prefilter()
+    assert prefilter.check(post('1', 'Центральный банк снизил ключевую ставку до 15%')) is None
+    assert prefilter.check(post('2', 'RT @news: Центральный банк снизил ключевую ставку до 15% https://t.co/x')) == 'near_duplicate'
+
+
+def test_posts_without_words_are_not_indexed():
+    prefilter = make_prefilter()
+    assert simhash('🔥🔥🔥 🚀🚀 https://t.co/abc') is None
+    assert prefilter.check(post('1', '🔥🔥🔥 🚀🚀 https://t.co/abc')) is None
+    assert prefilter.check(post('2', '💥💥💥 🎉🎉 https://t.co/def')) is None
+    assert prefilter.near_duplicate_index.size == 0
@@ -14,7 +14,7 @@ export default function Pantry() {
   const [logCleanupDays, setLogCleanupDays] = useState(7);
   const [operationFeedback, setOperationFeedback] = useState<string | null>(null);
   const [logLimit, setLogLimit] = useState(250);
-  const [logOffset, setLogOffset] = useState(0);
+  const [logCursor, setLogCursor] = useState<string | null>(null);
   const [hasMoreLogs, setHasMoreLogs] = useState(false);
   const [isLoadingLogs, setIsLoadingLogs] = useState(false);
   const [debugSnapshot, setDebugSnapshot] = useState<any>(null);
@@ -54,24 +54,25 @@ export default function Pantry() {
     return Number.isFinite(parsed) ? parsed : null;
   };
 
-  const loadLogs = async ({ reset = false, offset }: { reset?: boolean; offset?: number } = {}) => {
+  const loadLogs = async ({ reset = false }: { reset?: boolean } = {}) => {
     try {
       setIsLoadingLogs(true);
-      const effectiveOffset = reset ? 0 : (offset ?? logOffset);
+      // Keyset pagination: continue after the last loaded row; the list never shows a total
       const response = await logsApi.getAll({
         level: logFilters.level || undefined,
         category: logFilters.category || undefined,
         hours: logFilters.hours,
         limit: logLimit,
-        offset: effectiveOffset
+        cursor: reset ? undefined : logCursor ?? undefined,
+        count: 'none'
       });
       const withContext = (response.data.logs || []).map((log: any) => ({
         ...log,
         _context: parseLogContext(log.context)
       }));
       setSystemLogs((prev) => (reset ? withContext : [...prev, ...withContext]));
-      setHasMoreLogs(effectiveOffset + withContext.length < response.data.total);
-      setLogOffset(effectiveOffset);
+      setHasMoreLogs(Boolean(response.data.next_cursor));
+      setLogCursor(response.data.next_cursor);
     } catch (error) {
       console.error('Failed to load logs:', error);
     } finally {
@@ -282,7 +283,7 @@ export default function Pantry() {
       await logsApi.cleanup(logCleanupDays);
       setOperationFeedback('Logs cleaned up successfully');
       setTimeout(() => setOperationFeedback(null), 3000);
-      loadLogs();
+      loadLogs({ reset: true });
       loadLogStats();
       loadLowWorthinessOverview();
     } catch (error) {
@@ -624,7 +625,7 @@ export default function Pantry() {
                       {hasMoreLogs && (
                         <button
                           className="btn-secondary btn-small"
-                          onClick={() => loadLogs({ reset: false, offset: logOffset + logLimit })}
+                          onClick={() => loadLogs({ reset: false })}
                           disabled={isLoadingLogs}
                         >
                           {isLoadingLogs ? 'Loading…' : 'Load more'}
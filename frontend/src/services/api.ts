@@ -135,7 +135,8 @@ export const adminApi = {
 // Groups API (V-5, V-8, V-9, V-14)
 export const groupsApi = {
   getAll: () => apiClient.get<{ groups: any[] }>('/api/groups/'),
-  getArchived: () => apiClient.get<{ groups: any[] }>('/api/groups/archived'),
+  getArchived: (params?: { limit?: number; cursor?: string }) =>
+    apiClient.get<{ groups: any[]; next_cursor: string | null }>('/api/groups/archived', { params }),
   getPostsByGroup: (groupId: number) => apiClient.get<{ posts: any[] }>(`/api/groups/${groupId}/posts`),
   select: (groupId: number) => apiClient.post(`/api/groups/${groupId}/select`),
   archive: (groupId: number) => apiClient.post(`/api/groups/${groupId}/archive`),
@@ -172,8 +173,8 @@ export const researchApi = {
 export const groupArticlesApi = {
   generate: (groupId: number, style: string, customPrompt?: string) =>
     apiClient.post(`/api/groups/${groupId}/article/`, { style, custom_prompt: customPrompt }),
-  getAll: (groupId: number) =>
-    apiClient.get<{ articles: GroupArticle[]; count: number }>(`/api/groups/${groupId}/articles/`),
+  getAll: (groupId: number, params?: { limit?: number; cursor?: string }) =>
+    apiClient.get<{ articles: GroupArticle[]; count: number; next_cursor: string | null }>(`/api/groups/${groupId}/articles/`, { params }),
   get: (groupId: number) =>
     apiClient.get(`/api/groups/${groupId}/article/`),
   update: (groupId: number, articleId: number, content: string, title?: string, preview?: string) =>
@@ -184,7 +185,7 @@ export const groupArticlesApi = {
 
 // Logs API
 export const logsApi = {
-  getAll: (params: { level?: string; category?: string; logger_name?: string; search?: string; hours?: number; limit?: number; offset?: number }) =>
+  getAll: (params: { level?: string; category?: string; logger_name?: string; search?: string; hours?: number; limit?: number; offset?: number; cursor?: string; count?: 'exact' | 'estimated' | 'none' }) =>
     apiClient.get('/api/logs/', { params }),
   getStats: (hours: number = 24) =>
     apiClient.get(`/api/logs/stats?hours=${hours}`),